@@ -2,6 +2,7 @@
 
 # T(0) = 0, T(1) = 1, T(2) = 1, T(n) = T(n-1) + T(n-2) + T(n-3) for n > 2
 
+
 # ============================================================================
 # APPROACH 1: TOP-DOWN DYNAMIC PROGRAMMING (MEMOIZATION)
 # ============================================================================
@@ -68,3 +69,23 @@ class SolutionTabulation:
             
         return dp[n]
 
+
+# ============================================================================
+# BONUS: MATRIX EXPONENTIATION (O(log n), dsa.recurrence)
+# ============================================================================
+class SolutionMatrix:
+    def __init__(self):
+        # One recurrence per instance: the squared powers of the 3x3
+        # companion matrix are cached on it and reused by later queries,
+        # and go away with the instance instead of living for the process
+        from dsa.recurrence import tribonacci_recurrence
+        self._recurrence = tribonacci_recurrence()
+
+    def tribonacci(self, n: int) -> int:
+        """
+        [T(n+2), T(n+1), T(n)] = M^n · [1, 1, 0],  M = [[1,1,1],[1,0,0],[0,1,0]]
+
+        Time Complexity: O(log n) - one 3x3 matrix-vector product per set bit
+        Space Complexity: O(log n) - the cached powers M^(2^k)
+        """
+        return self._recurrence[n]
@@ -66,4 +66,26 @@ class Solution:
         for i in range(1, n):
             minPrice = min(minPrice, prices[i])
             dp[i] = max(dp[i - 1], prices[i] - minPrice)
-        return dp[-1]
\ No newline at end of file
+        return dp[-1]
+
+
+# -----------------------------------------------
+# 🤖 State Machine Approach (dsa.stocks)
+# -----------------------------------------------
+# Time Complexity: O(n)
+# Space Complexity: O(1)
+#
+# Description:
+# The same hold / free DP that 122 and 714 use, limited to k=1
+# transaction.  dsa.stocks also returns the buy and sell days
+# (best_trades) and runs thousands of price series at once (backtest).
+class SolutionStateMachine:
+    def maxProfit(self, prices: List[int]) -> int:
+        from dsa.stocks import max_profit
+        return max_profit(prices, k=1)
+
+    def bestTrade(self, prices: List[int]):
+        """(profit, (buy_day, sell_day)), or (0, None) if no trade pays."""
+        from dsa.stocks import best_trades
+        profit, trades = best_trades(prices, k=1)
+        return profit, (trades[0] if trades else None)
@@ -296,6 +296,25 @@ class Solution:
                 
         return maxProfit
 
+# ---------------------------------------------------
+# 🤖 APPROACH 7: Generic State Machine (dsa.stocks)
+# ---------------------------------------------------
+# TIME COMPLEXITY: O(n)
+# SPACE COMPLEXITY: O(1) for the profit, O(n) bits for the trade days
+#
+# Approach 4 with the knobs exposed: k (max transactions, None here),
+# cooldown and fee — one engine for 121, 122 and 714.  tradeDays
+# returns the (buy_day, sell_day) pairs instead of just the profit;
+# dsa.stocks.backtest does the same over a (tickers, days) matrix.
+class SolutionStateMachine:
+    def maxProfit(self, prices: List[int]) -> int:
+        from dsa.stocks import max_profit
+        return max_profit(prices)
+
+    def tradeDays(self, prices: List[int]) -> List[tuple]:
+        from dsa.stocks import best_trades
+        return best_trades(prices)[1]
+
 # ---------------------------------------------------
 # 🎯 INTERVIEW TIPS AND KEY INSIGHTS
 # ---------------------------------------------------
@@ -332,4 +351,5 @@ class Solution:
    - What if transaction fees exist? (Stock with fees)
    - What if limited to k transactions? (Stock III/IV)
    - What if cooldown period? (Stock with cooldown)
+   → all three are parameters of dsa.stocks.max_profit(prices, k, cooldown, fee)
 """
\ No newline at end of file
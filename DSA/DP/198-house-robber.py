@@ -76,4 +76,22 @@ class Solution:
             # If we don't rob, take max of previous rob/not_rob
             rob, not_rob = not_rob + money, max(rob, not_rob)
             
-        return max(rob, not_rob)
\ No newline at end of file
+        return max(rob, not_rob)
+
+
+class SolutionBuffer:
+    """
+    dsa.robber: same skip / take recurrence, but reads any list, array
+    or NumPy buffer in place (optionally just houses[lo:hi], no copy).
+    """
+
+    def rob(self, nums: List[int]) -> int:
+        # Time Complexity: O(n)
+        # Space Complexity: O(1)
+        from dsa.robber import rob
+        return rob(nums)
+
+    def robbedHouses(self, nums: List[int]) -> List[int]:
+        # Which houses to rob, not just the total — O(n) decision bits
+        from dsa.robber import rob_choice
+        return rob_choice(nums)[1]
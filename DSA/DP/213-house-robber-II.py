@@ -131,8 +131,24 @@ class SolutionRecursiveMemo:
             
         return max(self.rob_linear_memo(nums[:-1]), 
                   self.rob_linear_memo(nums[1:]))
+# APPROACH 4: Single Pass, No Slices (dsa.robber)
+
+class SolutionOnePass:
+    """
+    Approaches 1-3 copy the input twice (nums[:-1], nums[1:]) and scan
+    it twice.  Both scenarios only differ at the two ends, so they can
+    advance together: one pass, nothing copied, any list/array/buffer.
+
+    Time: O(n), Space: O(1)
+    """
+
+    def rob(self, nums: List[int]) -> int:
+        from dsa.robber import rob_circular
+        return rob_circular(nums)
+
 # Key Insights:
 # 1. Circular constraint creates two mutually exclusive scenarios
 # 2. Each scenario reduces to linear house robber problem
 # 3. Space optimization: only need last two DP values, not entire array
-# 4. This problem demonstrates how constraints can be handled by case analysis
\ No newline at end of file
+# 4. This problem demonstrates how constraints can be handled by case analysis
+# 5. The two scenarios share every middle house → one pass (Approach 4)
\ No newline at end of file
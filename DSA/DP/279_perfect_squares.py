@@ -108,6 +108,9 @@ class SolutionV3:
 #     is an O(1) lookup — this is what collapses exponential backtracking
 #     down to O(n * sqrt(n)).
 #
+# ⚠️  Recursion goes one level per unit of n, so the cache is warmed
+#     bottom-up in strides of 256 to keep the stack shallow.
+#
 # ✅  Time:  O(n * sqrt(n))
 # ✅  Space: O(n)  (call stack + cache)
 # -----------------------------------------------------------------------------
@@ -126,6 +129,8 @@ class SolutionV4:
                 min_count = min(min_count, 1 + dp(remaining - sq))
             return min_count
 
+        for warm in range(256, n, 256):
+            dp(warm)
         return dp(n)
 
 
@@ -169,6 +174,62 @@ class SolutionV5:
         return depth
 
 
+# -----------------------------------------------------------------------------
+# VERSION 6 — Shared Bottom-Up Table (dsa.memo.DPTable)
+# -----------------------------------------------------------------------------
+# 💡  V3's dp array, but kept between calls on the same solver: numSquares(n)
+#     only fills the entries past the largest n it has seen, every smaller n
+#     is a plain array read.  array('b') — one byte per entry (answers <= 4).
+#     A new SolutionV6() starts empty, so nothing is shared at module level.
+#
+#     solver.table.save(path) / .load(path) carry it across restarts.
+#
+# ✅  Time:  O((n - largest seen) * sqrt(n)), O(1) when already covered
+# ✅  Space: O(N) bytes for the largest N this solver was asked
+# -----------------------------------------------------------------------------
+def _fill_squares(dp, i):
+    best, s = 4, 1                  # Lagrange: never more than 4
+    while s * s <= i:
+        best = min(best, dp[i - s * s] + 1)
+        s += 1
+    return best
+
+
+class SolutionV6:
+    def __init__(self):
+        from dsa.memo import DPTable
+        self.table = DPTable(_fill_squares, typecode="b", base=[0])
+
+    def numSquares(self, n: int) -> int:
+        return self.table[n]
+
+
+# -----------------------------------------------------------------------------
+# VERSION 7 — Number Theory (Lagrange + Legendre) 🔥
+# -----------------------------------------------------------------------------
+# 💡  The answer is always 1, 2, 3 or 4 (Lagrange's four-square theorem),
+#     and which one can be decided without any DP:
+#     - 1 if n is a perfect square
+#     - 4 iff n = 4^a * (8b + 7)          (Legendre's three-square theorem)
+#     - 2 if n = i² + j² for some i       (try i up to sqrt(n / 2))
+#     - 3 otherwise
+#
+# 💡  The check itself is dsa.squares.num_squares — one copy, used here
+#     and by the table lookups for n beyond the table.
+#
+# 💡  For millions of queries, dsa/squares.py precomputes this for every
+#     n <= N into an array('b') table (one byte per n), saves it, and
+#     memory-maps it on later runs; bulk lookups are vectorized.
+#
+# ✅  Time:  O(sqrt(n))
+# ✅  Space: O(1)
+# -----------------------------------------------------------------------------
+class SolutionV7:
+    def numSquares(self, n: int) -> int:
+        from dsa.squares import num_squares
+        return num_squares(n)
+
+
 # =============================================================================
 # QUICK TEST
 # =============================================================================
@@ -181,17 +242,24 @@ if __name__ == "__main__":
         (100, 1),  # 10²
     ]
 
-    versions = [SolutionV1, SolutionV2, SolutionV3, SolutionV4, SolutionV5]
+    versions = [SolutionV1, SolutionV2, SolutionV3, SolutionV4, SolutionV5, SolutionV6,
+                SolutionV7]
     labels   = ["V1 Backtrack (naive)",
                 "V2 Backtrack (pruned)",
                 "V3 Bottom-Up DP",
                 "V4 Memo Top-Down",
-                "V5 BFS"]
+                "V5 BFS",
+                "V6 Shared table",
+                "V7 Number theory"]
 
     print(f"{'':30} " + "  ".join(f"n={n}" for n, _ in test_cases))
     print("-" * 70)
     for label, cls in zip(labels, versions):
-        results = [cls().numSquares(n) for n, _ in test_cases]
+        try:
+            results = [cls().numSquares(n) for n, _ in test_cases]
+        except ModuleNotFoundError:     # V6 / V7 use dsa: run from DSA/
+            print(f"⏭️  {label:28} skipped — needs the dsa package")
+            continue
         passed  = all(r == exp for r, (_, exp) in zip(results, test_cases))
         status  = "✅" if passed else "❌"
         print(f"{status} {label:28} " + "  ".join(f"{'':3}{r}" for r in results))
\ No newline at end of file
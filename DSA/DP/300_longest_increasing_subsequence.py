@@ -1,6 +1,11 @@
 import math
 from typing import List
-from bisect import bisect_left
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # optional — only lis_lengths_batch needs it
+    np = None
 
 # ============================================================
 # APPROACH 1: Brute Force Recursion
@@ -155,6 +160,131 @@ class Solution:
         return max_len
 
 
+# ============================================================
+# APPROACH 6: Patience Sorting Engine (streaming + reconstruction)
+# Time: O(n log n) | Space: O(n) with reconstruction, O(LIS) without
+#
+# Approach 4's tails, plus for every tail the INDEX of the element
+# sitting there.  When x lands on pile `pos`, its predecessor is the
+# element currently on top of pile pos-1 — store that in `parent`.
+# Walking parent from the top of the last pile gives a real LIS
+# (Approach 5's reconstruction, without the O(n^2) scan).
+#
+#   strict=True   → bisect_left  (1, 2, 3:  strictly increasing)
+#   strict=False  → bisect_right (1, 2, 2, 3: non-decreasing)
+#   key=f         → compare f(x), return the original items
+#
+# Elements are pushed one at a time, so any iterable / generator works.
+# With reconstruction every item and its parent index are kept — O(n)
+# memory; with reconstruct=False only the tails, O(LIS).
+# ============================================================
+class PatienceLIS:
+    def __init__(self, strict: bool = True, key=None, reconstruct: bool = True):
+        self.key = key
+        self.reconstruct = reconstruct
+        self._bisect = bisect_left if strict else bisect_right
+        self.tails = []         # tails[p] = smallest tail KEY of an IS of length p+1
+        self.tail_index = []    # tail_index[p] = index of the element on pile p
+        self.items = []         # every item seen (only when reconstructing)
+        self.parent = []        # parent[i] = index of the item before i, -1 = none
+        self.count = 0
+
+    def push(self, item) -> int:
+        """Feed one element; returns the LIS length so far."""
+        k = self.key(item) if self.key else item
+        tails = self.tails
+        pos = self._bisect(tails, k)
+        if pos == len(tails):
+            tails.append(k)
+            self.tail_index.append(self.count)
+        else:
+            tails[pos] = k
+            self.tail_index[pos] = self.count
+        if self.reconstruct:
+            self.items.append(item)
+            self.parent.append(self.tail_index[pos - 1] if pos else -1)
+        self.count += 1
+        return len(tails)
+
+    def extend(self, iterable) -> "PatienceLIS":
+        for item in iterable:
+            self.push(item)
+        return self
+
+    def __len__(self):
+        return len(self.tails)
+
+    def indices(self) -> List[int]:
+        """Positions (in stream order) of one longest subsequence."""
+        if not self.reconstruct:
+            raise ValueError("built with reconstruct=False: only the length is known")
+        out = []
+        i = self.tail_index[-1] if self.tail_index else -1
+        while i != -1:
+            out.append(i)
+            i = self.parent[i]
+        out.reverse()
+        return out
+
+    def sequence(self) -> list:
+        """The items of one longest subsequence, in order."""
+        items = self.items
+        return [items[i] for i in self.indices()]
+
+
+def longest_increasing_subsequence(iterable, strict: bool = True, key=None) -> list:
+    return PatienceLIS(strict, key).extend(iterable).sequence()
+
+
+def lis_lengths_batch(sequences, strict: bool = True):
+    """
+    LIS length of MANY sequences at once (NumPy).
+
+    sequences: 2-D array-like, one sequence per row.  Ragged input is
+    padded with NaN, which is skipped (values are compared as float64).
+    All rows advance together: each column is one vectorized binary
+    search over every row's tails (log2(n) numpy ops per column instead
+    of a Python loop per row).
+
+    Time: O(n log n) vector steps of width len(sequences)
+    """
+    if np is None:
+        raise ImportError("lis_lengths_batch needs numpy installed")
+    data = np.asarray(sequences, dtype=np.float64)
+    if data.ndim != 2:
+        raise ValueError("expected one sequence per row (2-D input)")
+    rows, n = data.shape
+    tails = np.full((rows, n + 1), np.inf)
+    lengths = np.zeros(rows, dtype=np.int64)
+    row_ids = np.arange(rows)
+
+    for col in range(n):
+        x = data[:, col]
+        live = ~np.isnan(x)
+        # Per-row binary search over tails[:, :lengths] (inf beyond it)
+        lo = np.zeros(rows, dtype=np.int64)
+        hi = lengths.copy()
+        while True:
+            active = lo < hi
+            if not active.any():
+                break
+            mid = (lo + hi) // 2
+            probe = tails[row_ids, mid]
+            go_right = (probe < x) if strict else (probe <= x)
+            lo = np.where(active & go_right, mid + 1, lo)
+            hi = np.where(active & ~go_right, mid, hi)
+        rows_live = row_ids[live]
+        tails[rows_live, lo[live]] = x[live]
+        lengths = np.where(live & (lo == lengths), lengths + 1, lengths)
+
+    return lengths
+
+
+class Solution:
+    def lengthOfLIS(self, nums: List[int]) -> int:
+        return len(PatienceLIS(reconstruct=False).extend(nums))
+
+
 # ============================================================
 # COMPLEXITY SUMMARY
 # ============================================================
@@ -164,4 +294,6 @@ class Solution:
 # 2. Top-Down DP (Memo)     O(n^2)      O(n^2)  Clean recursive structure
 # 3. Bottom-Up DP           O(n^2)      O(n)    Iterative, cache-friendly
 # 4. Binary Search (Greedy) O(n log n)  O(n)    OPTIMAL — use in interviews
-# 5. DP + Reconstruction    O(n^2)      O(n)    Use when actual LIS is needed
\ No newline at end of file
+# 5. DP + Reconstruction    O(n^2)      O(n)    Use when actual LIS is needed
+# 6. Patience + parents     O(n log n)  O(n)    Actual LIS, streams, strict or
+#                                               not, key=; batch via NumPy
\ No newline at end of file
@@ -66,6 +66,23 @@ class Solution3:
 
         return dp[n]
 
+
+# ============================================================================
+# APPROACH 4: FAST DOUBLING (O(log n), dsa.recurrence)
+# ============================================================================
+class Solution4:
+    def fib(self, n: int) -> int:
+        """
+        F(2k) = F(k)(2F(k+1) - F(k)),  F(2k+1) = F(k)^2 + F(k+1)^2
+
+        Time Complexity: O(log n) - one doubling step per bit of n
+        Space Complexity: O(1)
+        Same answers as Solution1; pass mod= to dsa.recurrence.fibonacci
+        for n up to 10^18 and beyond.
+        """
+        from dsa.recurrence import fibonacci
+        return fibonacci(n)
+
 """
 DETAILED ANALYSIS:
 **COMPLEXITY PROGRESSION**:
@@ -74,4 +91,6 @@ DETAILED ANALYSIS:
    - Tabulation: O(n) time, O(n) space - Good
    - Space-optimized: O(n) time, O(1) space - BEST
    - Matrix exponentiation: O(log n) time, O(1) space - Advanced
+     (dsa/recurrence.py: LinearRecurrence, cached powers, batches)
+   - Fast doubling: O(log n) time, O(1) space - Solution4
 """
\ No newline at end of file
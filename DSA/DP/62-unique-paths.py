@@ -1,6 +1,11 @@
 from typing import List
 import math
 
+try:
+    import numpy as np
+except ImportError:  # optional — only the *_numpy approach needs it
+    np = None
+
 
 class Solution:
     """
@@ -187,6 +192,38 @@ class Solution:
         
         return result
 
+    # ========================================================================
+    # APPROACH 7: NumPy Row Scan - for huge grids / counting mod p
+    # Time Complexity: O(m*n) additions, but only O(min(m,n)) Python steps
+    # Space Complexity: O(max(m,n)) - one row
+    # ========================================================================
+    def uniquePaths_numpy(self, m: int, n: int, mod: int = None) -> int:
+        """
+        Same recurrence as Approach 4, vectorized.
+
+        Key insight: dp[j] = dp[j] + dp[j - 1] applied left-to-right over
+        a whole row is exactly a prefix sum, so each row is one np.cumsum
+        of the row above.  The grid is symmetric, so we loop over the
+        SHORTER side and let NumPy sweep the longer one.
+
+        - mod=None → object dtype: exact big integers (the counts grow
+          like C(m+n, m), far past int64), still looped in C.
+        - mod=p    → int64 with `% p` per row: much faster, for when only
+          the count modulo p is needed.
+        """
+        if np is None:
+            raise ImportError("uniquePaths_numpy needs numpy installed")
+        rows, cols = min(m, n), max(m, n)
+        if mod is not None and mod * cols >= 2 ** 63:
+            raise ValueError("mod * max(m, n) must fit in int64")
+
+        dp = np.ones(cols, dtype=object if mod is None else np.int64)
+        for _ in range(rows - 1):
+            dp = np.cumsum(dp)
+            if mod is not None:
+                dp %= mod
+        return int(dp[-1])
+
 
 # ============================================================================
 # VISUAL EXAMPLES
@@ -244,6 +281,7 @@ Mathematical verification for Example 1:
 │ 4. 1D DP Array       │ O(m*n)          │ O(n)            │ Space optimized      │
 │ 5. Min Dimension     │ O(m*n)          │ O(min(m,n))     │ Better space opt     │
 │ 6. Math (Combinat.)  │ O(m+n)          │ O(1)            │ ⭐ BEST - Optimal!  │
+│ 7. NumPy row scan    │ O(m*n) in C     │ O(max(m,n))     │ Bulk / mod p counts  │
 └──────────────────────┴─────────────────┴─────────────────┴──────────────────────┘
 
 RECOMMENDATION BY CONTEXT:
@@ -1,5 +1,10 @@
 from typing import List
 
+try:
+    import numpy as np
+except ImportError:  # optional — only the *_numpy approach needs it
+    np = None
+
 
 class Solution:
     """
@@ -237,6 +242,57 @@ class Solution:
         
         return obstacleGrid[m - 1][n - 1]
 
+    # ========================================================================
+    # APPROACH 6: NumPy Segmented Row Scan - for huge grids
+    # Time Complexity: O(m*n) in C, O(min(m,n)) Python steps
+    # Space Complexity: O(m*n) for the boolean grid + O(n) row
+    # ========================================================================
+    def uniquePathsWithObstacles_numpy(self, obstacleGrid: List[List[int]], mod: int = None) -> int:
+        """
+        Approach 4 vectorized one row at a time.
+
+        Without obstacles, a row is np.cumsum of the row above.  An
+        obstacle at j zeroes dp[j] and RESTARTS the running sum after it,
+        so each row is a segmented prefix sum:
+
+            vals = row_above with obstacle cells set to 0
+            c    = cumsum(vals)
+            last = index of the nearest obstacle at or left of j
+            dp   = c - c[last]          (0 where there is no such obstacle)
+
+        Seeding the "row above row 0" with [1, 0, 0, ...] handles the
+        first row (1s until the first obstacle) with no special case.
+        The recurrence is symmetric under transposition, so we transpose
+        tall grids and loop over the shorter side.
+
+        mod=None → exact object-dtype integers; mod=p → int64 mod p.
+        """
+        if np is None:
+            raise ImportError("uniquePathsWithObstacles_numpy needs numpy installed")
+        blocked = np.asarray(obstacleGrid, dtype=bool)
+        if blocked[0, 0] or blocked[-1, -1]:
+            return 0
+        if blocked.shape[0] > blocked.shape[1]:
+            blocked = np.ascontiguousarray(blocked.T)
+        m, n = blocked.shape
+        if mod is not None and mod * n >= 2 ** 63:
+            raise ValueError("mod * max(m, n) must fit in int64")
+
+        cols = np.arange(n)
+        dp = np.zeros(n, dtype=object if mod is None else np.int64)
+        dp[0] = 1
+        for i in range(m):
+            row_blocked = blocked[i]
+            if not row_blocked.any():
+                dp = np.cumsum(dp)            # fast path: plain prefix sum
+            else:
+                c = np.cumsum(np.where(row_blocked, 0, dp))
+                last = np.maximum.accumulate(np.where(row_blocked, cols, -1))
+                dp = c - np.where(last >= 0, c[last], 0)
+            if mod is not None:
+                dp %= mod
+        return int(dp[-1])
+
 
 # ============================================================================
 # ISSUES IN YOUR ORIGINAL CODE (Fixed Above)
@@ -309,6 +365,7 @@ Output: 0
 │ 3. 2D DP             │ O(m*n)          │ O(m*n)          │ ✅ Recommended   │
 │ 4. 1D DP Array       │ O(m*n)          │ O(n)            │ Space optimized  │
 │ 5. In-place          │ O(m*n)          │ O(1)            │ Modifies input   │
+│ 6. NumPy row scan    │ O(m*n) in C     │ O(m*n) bools    │ Huge grids       │
 └──────────────────────┴─────────────────┴─────────────────┴──────────────────┘
 
 RECOMMENDATION:
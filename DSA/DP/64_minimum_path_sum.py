@@ -1,5 +1,10 @@
 from typing import List
 
+try:
+    import numpy as np
+except ImportError:  # optional — only the *_numpy approach needs it
+    np = None
+
 
 class Solution:
     """
@@ -160,6 +165,42 @@ class Solution:
         
         return grid[m - 1][n - 1]
 
+    # ========================================================================
+    # APPROACH 6: NumPy Min-Plus Row Scan - for huge grids
+    # Time Complexity: O(m*n) in C, O(min(m,n)) Python steps
+    # Space Complexity: O(m*n) for the array copy of the grid + O(n) row
+    # ========================================================================
+    def minPathSum_numpy(self, grid: List[List[int]]) -> int:
+        """
+        Approach 4 vectorized one row at a time.
+
+        The left-to-right dependency dp[j] = g[j] + min(up[j], dp[j - 1])
+        looks sequential, but unrolled it is
+
+            dp[j] = min over k <= j of ( up[k] + g[k] + ... + g[j] )
+                  = P[j] + min over k <= j of ( up[k] - P[k - 1] )
+
+        with P the prefix sum of the current row (P[-1] = 0).  That inner
+        "running min" is np.minimum.accumulate, so each row costs two
+        scans in C.  Tall grids are transposed (the recurrence is
+        symmetric) so the Python loop runs over the shorter side.
+        """
+        if np is None:
+            raise ImportError("minPathSum_numpy needs numpy installed")
+        g = np.asarray(grid)
+        if g.dtype.kind in "iub":
+            g = g.astype(np.int64)     # avoid overflow on small int dtypes
+        if g.shape[0] > g.shape[1]:
+            g = np.ascontiguousarray(g.T)
+
+        dp = np.cumsum(g[0])           # first row: only from the left
+        shifted = np.zeros_like(dp)
+        for row in g[1:]:
+            prefix = np.cumsum(row)
+            shifted[1:] = prefix[:-1]  # P[k - 1], with P[-1] = 0
+            dp = np.minimum.accumulate(dp - shifted) + prefix
+        return dp[-1].item()
+
 
 # ============================================================================
 # COMPARISON SUMMARY
@@ -174,6 +215,7 @@ class Solution:
 │ 4. 1D DP Array       │ O(m*n)          │ O(n)            │ Space optimized │
 │ 5. In-place          │ O(m*n)          │ O(1)            │ Best space, but │
 │                      │                 │                 │ modifies input  │
+│ 6. NumPy row scan    │ O(m*n) in C     │ O(m*n) copy     │ Huge grids      │
 └──────────────────────┴─────────────────┴─────────────────┴─────────────────┘
 
 RECOMMENDATION:
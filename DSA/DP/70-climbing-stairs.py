@@ -134,6 +134,19 @@ class Solution:
 # NOTE: May have floating point precision issues for very large n
 
 
+# APPROACH 7: FAST DOUBLING (EXACT O(log n))
+class Solution:
+    def climbStairs(self, n: int) -> int:
+        # ways(n) = F(n+1), computed with integer fast doubling
+        # (dsa.recurrence) — no floats, so exact for any n
+        from dsa.recurrence import fibonacci
+        return fibonacci(n + 1)
+
+# TIME COMPLEXITY: O(log n) - one doubling step per bit of n+1
+# SPACE COMPLEXITY: O(1)
+# NOTE: dsa.recurrence.fibonacci(n + 1, mod) answers n = 10^18 mod p
+
+
 # PERFORMANCE COMPARISON:
 # n=10:   Naive: ~100 calls, Optimized: 10 operations
 # n=20:   Naive: ~21,000 calls, Optimized: 20 operations  
@@ -142,4 +155,5 @@ class Solution:
 # RECOMMENDED SOLUTION: Space-optimized DP (Approach 5)
 # - Easy to understand and implement
 # - Optimal time and space complexity
-# - No precision issues like mathematical formula
\ No newline at end of file
+# - No precision issues like mathematical formula
+# For huge n (or answers mod p): fast doubling (Approach 7)
\ No newline at end of file
@@ -1 +1,37 @@
-# https://leetcode.com/problems/best-time-to-buy-and-sell-stock-with-transaction-fee
\ No newline at end of file
+# https://leetcode.com/problems/best-time-to-buy-and-sell-stock-with-transaction-fee
+
+from typing import List
+
+
+# ---------------------------------------------------
+# APPROACH 1: Space-Optimized DP (122 + a fee per sale)
+# ---------------------------------------------------
+# TIME COMPLEXITY: O(n)
+# SPACE COMPLEXITY: O(1)
+#
+# - hold     = best profit while holding a share
+# - not_hold = best profit with no share
+# Paying the fee on the sell makes a trade worth it only when the
+# price rise beats the fee — the greedy "take every uphill" of 122
+# no longer works.
+class Solution:
+    def maxProfit(self, prices: List[int], fee: int) -> int:
+        hold, not_hold = float("-inf"), 0
+        for price in prices:
+            hold, not_hold = (max(hold, not_hold - price),
+                              max(not_hold, hold + price - fee))
+        return not_hold
+
+
+# ---------------------------------------------------
+# APPROACH 2: Generic State Machine (dsa.stocks)
+# ---------------------------------------------------
+# Same recurrence, shared with 121 / 122; also returns the trade days.
+class SolutionStateMachine:
+    def maxProfit(self, prices: List[int], fee: int) -> int:
+        from dsa.stocks import max_profit
+        return max_profit(prices, fee=fee)
+
+    def tradeDays(self, prices: List[int], fee: int) -> List[tuple]:
+        from dsa.stocks import best_trades
+        return best_trades(prices, fee=fee)[1]
@@ -44,6 +44,11 @@ ALGORITHM APPROACHES FOR MERGE K SORTED LISTS
 WHERE:
 - N = total number of nodes across all lists
 - k = number of lists
+
+BEYOND LINKED LISTS:
+- dsa/kmerge.py merges sorted arrays / memory-mapped files with the
+  divide-and-conquer tree of Approach 4, runs the subtrees in a process
+  pool and streams the result as a generator.
 """
 
 # APPROACH 1: Sequential Merging (Your first solution)
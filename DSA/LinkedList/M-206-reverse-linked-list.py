@@ -2,6 +2,8 @@
 
 # Definition for singly-linked list.
 class ListNode:
+    __slots__ = ("val", "next")  # no per-node __dict__ — see dsa/linked.py
+
     def __init__(self, val=0, next=None):
         self.val = val
         self.next = next
@@ -1,4 +1,6 @@
-from typing import List
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable, List, Optional
 
 
 # ─────────────────────────────────────────────────────────────
@@ -191,6 +193,186 @@ class Solution5:
         return longest
 
 
+# ─────────────────────────────────────────────────────────────
+# APPROACH 6 — Online tracker (interval map + lazy max-heap)
+# ─────────────────────────────────────────────────────────────
+# Idea: Approaches 1-5 answer ONE query over a static list.  When
+#       IDs keep arriving (and leaving), keep the runs themselves:
+#
+#         start → end and end → start dicts    merge on add, O(1)
+#         sorted run starts (bucketed list)    find x's run on remove
+#         length counts + lazy max-heap        longest() without a scan
+#                                              (rebuilt once mostly stale)
+#
+#       add(x)    joins the run ending at x-1 and the one starting
+#                 at x+1 (Approach 3's boundary trick, two dicts).
+#       remove(x) finds the run holding x (floor of x among starts)
+#                 and splits it around x — the part Approaches 3/4
+#                 cannot do, since union-find has no "split".
+#       longest() pops heap tops whose length no run has any more.
+#
+# Time  : O(log n) amortised per operation (bisect + heap; the
+#         bucketed list moves ≤ 2·LOAD items per insert/delete)
+# Space : O(runs) — a dense block of a million IDs is ONE run
+# ─────────────────────────────────────────────────────────────
+class _SortedInts:
+    """Sorted list of ints split into buckets of ≤ 2·LOAD (cheap insert/delete)."""
+
+    LOAD = 512
+
+    def __init__(self, values: Iterable[int] = ()):
+        values = sorted(values)
+        size = self.LOAD
+        self.buckets = [values[i:i + size] for i in range(0, len(values), size)]
+        self.maxes = [bucket[-1] for bucket in self.buckets]
+
+    def floor(self, x: int) -> Optional[int]:
+        """Largest value <= x, or None."""
+        maxes = self.maxes
+        i = bisect_left(maxes, x)
+        if i < len(maxes):
+            bucket = self.buckets[i]
+            j = bisect_right(bucket, x)
+            if j:
+                return bucket[j - 1]
+        return maxes[i - 1] if i else None
+
+    def add(self, x: int) -> None:
+        maxes, buckets = self.maxes, self.buckets
+        if not buckets:
+            buckets.append([x])
+            maxes.append(x)
+            return
+        i = min(bisect_left(maxes, x), len(maxes) - 1)
+        bucket = buckets[i]
+        insort(bucket, x)
+        maxes[i] = bucket[-1]
+        if len(bucket) > 2 * self.LOAD:
+            half = bucket[self.LOAD:]
+            del bucket[self.LOAD:]
+            buckets.insert(i + 1, half)
+            maxes[i] = bucket[-1]
+            maxes.insert(i + 1, half[-1])
+
+    def remove(self, x: int) -> None:
+        i = bisect_left(self.maxes, x)
+        bucket = self.buckets[i]
+        del bucket[bisect_left(bucket, x)]
+        if bucket:
+            self.maxes[i] = bucket[-1]
+        else:
+            del self.buckets[i], self.maxes[i]
+
+    def __iter__(self):
+        for bucket in self.buckets:
+            yield from bucket
+
+
+class ConsecutiveTracker:
+    """
+    Set of integers with the longest run of consecutive values kept up
+    to date under inserts and deletes.
+
+        tracker = ConsecutiveTracker([100, 4, 200, 1, 3, 2])
+        tracker.longest()      # 4   (1..4)
+        tracker.remove(3)      # runs 1..2 and 4..4
+        tracker.add(101)       # runs 100..101
+        tracker.runs()         # [(1, 2), (4, 4), (100, 101), (200, 200)]
+    """
+
+    def __init__(self, nums: Iterable[int] = ()):
+        self.end_of = {}            # run start → run end
+        self.start_of = {}          # run end → run start
+        self.count = 0
+        self._lengths = {}          # run length → number of runs
+        self._heap = []             # -length, possibly stale
+        run_start = prev = None
+        for x in sorted(set(nums)):
+            if prev is None or x != prev + 1:
+                if prev is not None:
+                    self._open(run_start, prev)
+                run_start = x
+            prev = x
+        if prev is not None:
+            self._open(run_start, prev)
+        self.starts = _SortedInts(self.end_of)
+
+    # ---- run bookkeeping (dicts + length counts) ---------------------------
+    def _open(self, start: int, end: int) -> None:
+        self.end_of[start] = end
+        self.start_of[end] = start
+        length = end - start + 1
+        self.count += length
+        self._lengths[length] = self._lengths.get(length, 0) + 1
+        heapq.heappush(self._heap, -length)
+        if len(self._heap) > 4 * len(self.end_of) + 64:   # mostly stale entries
+            self._heap = [-n for n, c in self._lengths.items() for _ in range(c)]
+            heapq.heapify(self._heap)
+
+    def _close(self, start: int) -> int:
+        end = self.end_of.pop(start)
+        del self.start_of[end]
+        length = end - start + 1
+        self.count -= length
+        self._lengths[length] -= 1
+        return end
+
+    # ---- updates -----------------------------------------------------------
+    def add(self, x: int) -> bool:
+        """Insert x; False if it was already there."""
+        if x in self:
+            return False
+        start = end = x
+        if x - 1 in self.start_of:               # run ending right before x
+            start = self.start_of[x - 1]
+            self._close(start)
+        else:
+            self.starts.add(x)
+        if x + 1 in self.end_of:                 # run starting right after x
+            end = self._close(x + 1)
+            self.starts.remove(x + 1)
+        self._open(start, end)
+        return True
+
+    def remove(self, x: int) -> bool:
+        """Delete x; False if it wasn't there."""
+        start = self.starts.floor(x)
+        if start is None or self.end_of[start] < x:
+            return False
+        end = self._close(start)
+        if start < x:
+            self._open(start, x - 1)
+        else:
+            self.starts.remove(start)
+        if x < end:
+            self._open(x + 1, end)
+            self.starts.add(x + 1)
+        return True
+
+    # ---- queries -----------------------------------------------------------
+    def longest(self) -> int:
+        heap, lengths = self._heap, self._lengths
+        while heap and not lengths.get(-heap[0]):
+            heapq.heappop(heap)
+        return -heap[0] if heap else 0
+
+    def __contains__(self, x: int) -> bool:
+        start = self.starts.floor(x)
+        return start is not None and x <= self.end_of[start]
+
+    def __len__(self):
+        return self.count
+
+    def runs(self) -> List[tuple]:
+        """(start, end) of every run, in order."""
+        return [(start, self.end_of[start]) for start in self.starts]
+
+
+class Solution6:
+    def longestConsecutive(self, nums: List[int]) -> int:
+        return ConsecutiveTracker(nums).longest()
+
+
 # ─────────────────────────────────────────────────────────────
 # Quick comparison
 # ─────────────────────────────────────────────────────────────
@@ -201,4 +383,55 @@ class Solution5:
 # | 3. HashMap           | O(n)        | O(n)  | Streams well; no re-traversal  |
 # | 4. Union-Find        | O(n · α(n)) | O(n)  | Graph-flavoured; reusable DSU  |
 # | 5. Bucket/Pigeonhole | O(n + R)    | O(R)  | Best when range R ≈ n (dense)  |
-# ─────────────────────────────────────────────────────────────
\ No newline at end of file
+# | 6. Online tracker    | O(log n)/op | O(runs)| Inserts + deletes, live answer |
+# ─────────────────────────────────────────────────────────────
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    universe = max(ops // 4, 10)
+    rng = random.Random(7)
+
+    # Correctness: replay a short mixed stream against Solution2
+    tracker, members = ConsecutiveTracker(), set()
+    for step in range(20000):
+        x = rng.randrange(500)
+        if rng.random() < 0.6:
+            assert tracker.add(x) == (x not in members)
+            members.add(x)
+        else:
+            assert tracker.remove(x) == (x in members)
+            members.discard(x)
+        if step % 97 == 0:
+            assert tracker.longest() == Solution2().longestConsecutive(list(members))
+            assert len(tracker) == len(members)
+
+    # Benchmark: `ops` operations — 55% add, 35% remove, 10% longest()
+    stream = [(rng.random(), rng.randrange(universe)) for _ in range(ops)]
+    tracker = ConsecutiveTracker()
+    start = time.perf_counter()
+    add, remove, longest = tracker.add, tracker.remove, tracker.longest
+    for p, x in stream:
+        if p < 0.55:
+            add(x)
+        elif p < 0.9:
+            remove(x)
+        else:
+            longest()
+    elapsed = time.perf_counter() - start
+    queries = sum(1 for p, _ in stream if p >= 0.9)
+    print(f"{ops:,} ops over {universe:,} IDs: {elapsed:.2f}s "
+          f"({elapsed / ops * 1e6:.2f} µs/op), {len(tracker.end_of):,} runs, "
+          f"longest = {tracker.longest()}")
+
+    # Baseline: recompute with Solution2 on every longest() query
+    snapshot = [x for a, b in tracker.runs() for x in range(a, b + 1)]
+    start = time.perf_counter()
+    Solution2().longestConsecutive(snapshot)
+    once = time.perf_counter() - start
+    print(f"Solution2 per query: {once * 1e3:.1f} ms x {queries:,} queries "
+          f"≈ {once * queries / 3600:.1f} h")
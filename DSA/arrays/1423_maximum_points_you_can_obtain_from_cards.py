@@ -20,6 +20,7 @@ Constraint reminder:
     - 1 <= k <= cardPoints.length
 """
 
+from itertools import chain
 from typing import List
 
 
@@ -175,6 +176,30 @@ class SolutionV5_PrefixSuffix:
         return max(prefix[i] + suffix[k - i] for i in range(k + 1))
 
 
+
+# =============================================================================
+# APPROACH 6 — Shared Window Engine (dsa.window)
+# =============================================================================
+# V3's k+1 scores are exactly the width-k windows over the cards laid out
+# as  last k cards + first k cards  (two k-slices, chained):
+#   window j = cardPoints[n-k+j:] + cardPoints[:j]  →  j cards from the left.
+# A NumPy array goes through V4's form instead: total minus the smallest
+# width-(n-k) window, computed with one vectorized cumsum.
+#
+# Time Complexity : O(k) for lists, O(n) vectorized for NumPy arrays
+# Space Complexity: O(k) — the engine's ring buffer (O(n) for NumPy)
+
+class SolutionV6_Window:
+    def maxScore(self, cardPoints: List[int], k: int) -> int:
+        from dsa.window import window_sums
+        n = len(cardPoints)
+        if hasattr(cardPoints, "dtype"):          # NumPy: V4's form, vectorized
+            total = int(cardPoints.sum())
+            return total if k == n else total - int(window_sums(cardPoints, n - k).min())
+        if k == 0:
+            return 0
+        return max(window_sums(chain(cardPoints[n - k:], cardPoints[:k]), k))
+
 # =============================================================================
 # COMPLEXITY SUMMARY
 # =============================================================================
@@ -185,6 +210,7 @@ class SolutionV5_PrefixSuffix:
 # | V3 - Sliding window (✓)   | O(k)    | O(1)  | Best: fast & minimal space |
 # | V4 - Min window (✓)       | O(n)    | O(1)  | Elegant alternative        |
 # | V5 - Prefix+Suffix (✓)    | O(n)    | O(n)  | Most readable, uses space  |
+# | V6 - dsa.window (✓)       | O(k)    | O(k)  | Shared engine, NumPy path  |
 #
 # Recommendation: Use V3 (Sliding Window) for interviews — O(k) time, O(1)
 # space, clean logic. V4 is equally good and may be more intuitive to some.
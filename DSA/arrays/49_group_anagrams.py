@@ -17,6 +17,8 @@ Approaches covered:
     2. Character frequency tuple — O(n * k)         ← optimal
     3. Prime product hash        — O(n * k), clever but risky
     4. Counter as key            — O(n * k), Pythonic but slower
+    5. Streaming, spill to disk  — O(n * k), bounded memory (dsa.anagrams)
+    6. Sharded process pool      — O(n * k / cores)          (dsa.anagrams)
 
 ============================================================
 """
@@ -131,6 +133,52 @@ class Solution4_Counter:
         return list(hmap.values())
 
 
+# ─────────────────────────────────────────────────────────
+# APPROACH 5 — Streaming, hash-partitioned spill files
+# ─────────────────────────────────────────────────────────
+# Intuition:
+#   Anagrams share a key, so they share hash(key) too.  Split the
+#   words into partitions by hash(key) on disk, then group one
+#   partition at a time — only that partition's dict is in RAM.
+#   Key = 26 letter counts as bytes: Approach 2's tuple, but
+#   fixed-size and compact, with none of Approach 3's big ints.
+#
+# Time:  O(n * k)   — plus writing and reading every word once
+# Space: O(n / partitions) in memory, O(n * k) on disk
+#
+# When to prefer this:
+#   Corpora that do not fit in memory — feed it
+#   dsa.anagrams.words_from_file(path) instead of a list.
+# ─────────────────────────────────────────────────────────
+class Solution5_Streaming:
+    def groupAnagrams(self, strs: List[str]) -> List[List[str]]:
+        from dsa.anagrams import group_anagrams_stream
+        return list(group_anagrams_stream(strs))
+
+
+# ─────────────────────────────────────────────────────────
+# APPROACH 6 — Sharded process pool
+# ─────────────────────────────────────────────────────────
+# Intuition:
+#   Computing the keys is the expensive part, and each word's key
+#   is independent — so compute them on every core.  Workers group
+#   their chunk into per-shard dicts (shard = hash of the key); the
+#   partial dicts merge key by key, nobody recomputes a key.
+#
+# Time:  O(n * k / cores) for the keys + O(distinct keys) to merge
+# Space: O(n * k)
+#
+# When to prefer this:
+#   Big in-memory word lists on a multi-core machine.  Shipping the
+#   words to the workers costs time, so small inputs are faster in
+#   one process (workers=1 skips the pool).
+# ─────────────────────────────────────────────────────────
+class Solution6_Parallel:
+    def groupAnagrams(self, strs: List[str]) -> List[List[str]]:
+        from dsa.anagrams import group_anagrams_parallel
+        return list(group_anagrams_parallel(strs).groups())
+
+
 # ─────────────────────────────────────────────────────────
 # COMPLEXITY SUMMARY
 # ─────────────────────────────────────────────────────────
@@ -142,4 +190,6 @@ class Solution4_Counter:
 # 2. Freq tuple ★       | O(n·k)        | O(n·k)  | Optimal for large k
 # 3. Prime product      | O(n·k)        | O(n)    | Clever, risky overflow
 # 4. Counter frozenset  | O(n·k)        | O(n·k)  | Pythonic, slower
+# 5. Streaming spill    | O(n·k)        | O(n/p)  | Bounded RAM, uses disk
+# 6. Sharded pool       | O(n·k/cores)  | O(n·k)  | Multi-core, mergeable
 # ─────────────────────────────────────────────────────────
\ No newline at end of file
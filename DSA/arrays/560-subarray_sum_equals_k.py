@@ -87,6 +87,26 @@ class Solution:
         return total_count
 
 
+
+class SolutionPrefixIndex:
+    """
+    dsa.prefix: the prefix sums are built once and kept.  Several k on
+    the same array share one pass in pure Python; with NumPy, P is
+    ranked once and each k is a separate vectorized search.
+    """
+
+    # Time Complexity: O(n) to build; then O(n) per k (pure Python, one
+    #                  shared pass) or O(n log n) per k in C (NumPy)
+    # Space Complexity: O(n) - one int64 prefix sum per element
+    def subarraySum(self, nums: List[int], k: int) -> int:
+        from dsa.prefix import PrefixSums
+        return PrefixSums.build(nums).count_subarrays(k)
+
+    def subarraySums(self, nums: List[int], ks: List[int]) -> List[int]:
+        # One count per k, same order
+        from dsa.prefix import PrefixSums
+        return PrefixSums.build(nums).count_subarrays(ks)
+
 # ============================================================================
 # EXAMPLE WALKTHROUGH
 # ============================================================================
@@ -116,6 +136,7 @@ class Solution:
 # ------------------|---------|-------|----------------------------------
 # Brute Force       | O(n²)   | O(1)  | Very small inputs, interviews
 # Prefix Sum HashMap| O(n)    | O(n)  | Production code (OPTIMAL)
+# Prefix index     | O(n)/k  | O(n)  | Same array, many k (dsa.prefix)
 #
 # Recommendation: Use the hash map approach for optimal performance
 # ============================================================================
\ No newline at end of file
@@ -239,6 +239,34 @@ class Solution:
         return are_frequencies_zeros(counter_map)   # Check the final window
 
 
+
+# ============================================================
+# Approach 5: Shared Window Engine (dsa.window)
+# ------------------------------------------------------------
+# Strategy:
+#   - anagram_windows(s2, s1) lists every window start that is a
+#     permutation of s1 (this is also LeetCode 438); we only need
+#     to know whether the first one exists.
+#   - ASCII strings with NumPy installed: one cumsum per distinct
+#     character of s1 over the whole of s2, all in C.
+#   - Otherwise Approach 3's balance counter, as a lazy generator —
+#     stops at the first hit.
+#
+# Time Complexity : O(n * d) vectorized, d = distinct chars in s1 (≤ 26);
+#                   O(n) streaming
+# Space Complexity: O(n) with NumPy, O(k) streaming
+# ============================================================
+
+class SolutionWindow:
+    def checkInclusion(self, s1: str, s2: str) -> bool:
+        from dsa.window import anagram_windows
+        return next(anagram_windows(s2, s1), None) is not None
+
+    def findAnagrams(self, s2: str, s1: str) -> list:
+        # 438: every start index, not just "is there one?"
+        from dsa.window import anagram_windows
+        return list(anagram_windows(s2, s1))
+
 # ============================================================
 # Comparison Summary
 # ------------------------------------------------------------
@@ -247,6 +275,7 @@ class Solution:
 #  1. Freq Maps          | O(n)           | O(1)  | Correct & optimal
 #  2. Sort Window        | O(n * k log k) | O(k)  | Simple but slow
 #  3. Match Counter      | O(n)           | O(1)  | Cleanest — use this
+#  5. dsa.window         | O(n * d)       | O(n)  | Vectorized, all hits
 # ------------------------------------------------------------
 # Approaches 1 and 3 are both O(n) / O(1).
 # Approach 3 avoids dict comparison overhead and is preferred
@@ -97,4 +97,19 @@ class Solution:
                 return i
             left_sum += nums[i]             # grow left to include nums[i] for next step
 
-        return -1
\ No newline at end of file
+        return -1
+
+
+# APPROACH 5: kept prefix-sum index (dsa.prefix)
+# P[i] = sum(nums[:i]) is stored once; i is a pivot when P[i] == total - P[i+1].
+# With NumPy the whole check is one vectorized comparison, and the same index
+# answers range sums in O(1) afterwards.  pivotIndices() lists every pivot.
+# Space: O(n). Time: O(n).
+class SolutionPrefixIndex:
+    def pivotIndex(self, nums: List[int]) -> int:
+        from dsa.prefix import PrefixSums
+        return PrefixSums.build(nums).pivot_index()
+
+    def pivotIndices(self, nums: List[int]) -> List[int]:
+        from dsa.prefix import PrefixSums
+        return PrefixSums.build(nums).pivot_indices()
@@ -0,0 +1,55 @@
+"""
+============================================================
+dsa — importable facade over the solution files in this folder
+============================================================
+
+The problem files (e.g. `DP/279_perfect_squares.py`) have hyphens and
+leading digits in their names, so they can't be imported with a plain
+`import`.  This package maps them to attributes and loads each one
+lazily — only the problems you touch are ever executed:
+
+    import dsa                                  # imports no problem file
+    dsa.perfect_squares.SolutionV5().numSquares(12)   # loads 279 once
+    dsa.problem(23).Solution6                   # by LeetCode number
+    dsa.solution("reverse_linked_list")         # the single Solution class
+
+    loader.py    — load a problem file by path (cached)
+    registry.py  — problem ID / slug → lazy Problem proxy
+    bench.py     — discover + benchmark every variant of a problem
+    kmerge.py    — parallel, streaming k-way merge of sorted sequences
+    linked.py    — slotted ListNode + array-backed CompactLinkedList
+    unionfind.py — array-backed DisjointSet with save/load
+    graph.py     — CSRGraph + iterative provinces / safe-nodes on it
+    orderstat.py — introselect kth_smallest / kth_largest / nth_element
+    memo.py      — growable, persistable bottom-up DP tables
+    squares.py   — mmap-able perfect-squares answer table, bulk queries
+    recurrence.py — O(log n) linear recurrences: matrix power, fast doubling
+    stocks.py    — stock-trading state machine (k, cooldown, fee), backtests
+    robber.py    — copy-free house robber: ranges, circular, tree, batches
+    anagrams.py  — group anagrams out of core (spill files) or on a pool
+    prefix.py    — prefix-sum index: O(1) range sums, 724 pivots, batched 560
+    window.py    — sliding-window sums, min/max, anagram hits; streams or NumPy
+
+Run from the DSA/ folder:
+
+    python -m dsa.bench DP/279_perfect_squares.py
+    python -m dsa DP/279_perfect_squares.py     # the file's own __main__
+                                                # (extra args go to it)
+"""
+
+from dsa.registry import problem, problems, slugs, solution
+
+__all__ = ["problem", "problems", "slugs", "solution"]
+
+
+def __getattr__(name):
+    # PEP 562 — only called when `name` isn't a real module attribute,
+    # i.e. for problem slugs.  The returned proxy is still lazy.
+    try:
+        return problem(name)
+    except LookupError:
+        raise AttributeError(f"module 'dsa' has no attribute {name!r}") from None
+
+
+def __dir__():
+    return sorted(set(globals()) | set(slugs()))
@@ -0,0 +1,33 @@
+"""
+python -m dsa <problem file> [args ...] — run a problem file as a script.
+
+The solution classes that build on the package import `dsa` inside
+their methods, so the files also run standalone; going through the
+package just guarantees that `dsa` resolves (run from DSA/).  Extra
+arguments are passed on to the script in sys.argv.
+"""
+
+import argparse
+import runpy
+import sys
+
+from dsa.loader import resolve
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m dsa",
+        description="Run a problem file's __main__ block with `dsa` importable")
+    parser.add_argument("file", help="problem file, absolute or relative to DSA/")
+    parser.add_argument("args", nargs=argparse.REMAINDER,
+                        help="arguments passed on to the script")
+    args = parser.parse_args(argv)
+    path = resolve(args.file)
+    if not path.is_file():
+        parser.error(f"no such problem file: {args.file}")
+    sys.argv = [str(path), *args.args]
+    runpy.run_path(str(path), run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
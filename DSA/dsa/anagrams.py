@@ -0,0 +1,432 @@
+"""
+============================================================
+Group anagrams out of core — hash-partitioned spill files
+============================================================
+
+arrays/49_group_anagrams.py builds one dict over the whole word list.
+That caps the corpus at what fits in RAM (keys + words + lists: well
+over 100 bytes per word).  This module streams instead:
+
+    words = words_from_file("corpus.txt")         # lazy, one token at a time
+    for group in group_anagrams_stream(words):    # lazy, one group at a time
+        ...
+
+Canonical key — anagram_key(word):
+    26 bytes, byte i = count of letter i.  Fixed size, hashable, cheap
+    to store — unlike Solution3_PrimeHash's product, which grows
+    without bound (one big-int multiply per letter).  Words that are
+    not plain a-z, or 255+ letters long, fall back to b"\\xff" +
+    their sorted UTF-8 (a count key never starts with 0xff).
+
+Pipeline:
+    1. SPILL   — key each word; partition = crc32(key) % partitions;
+                 append (key, word) to that partition's buffer, and
+                 the buffer to its temp file once it reaches `buffer`
+                 bytes.  Anagrams always land in the same partition.
+    2. GROUP   — one partition at a time: read it, group with a dict,
+                 yield the groups, drop the dict.
+       A partition larger than `memory_limit` is first re-spilled into
+       sub-partitions by a depth-salted blake2b of the key (up to
+       MAX_DEPTH levels; a single giant group cannot be split and is
+       read whole).
+
+Memory: partitions × buffer for spilling, then one partition's dict.
+Disk:   ~ corpus size + 8 + 26 bytes per word, deleted as it goes.
+
+Parallel (fits in RAM, many cores) — group_anagrams_parallel(words):
+    - The parent cuts the words into chunks; workers key them with
+      encode_keys and group each chunk into an AnagramGroups: one dict
+      per shard, shard = crc32(key) % shards.
+    - Partial results merge shard by shard, key by key: the workers'
+      keys are reused, no word is re-keyed in the parent.
+    - encode_keys does a whole chunk at once: one bytes.translate call
+      checks every word is plain a-z, then NumPy counts all letters
+      with a single bincount (per-word loop without NumPy).
+
+Benchmark (writes a synthetic corpus, compares with Solution2, then
+scales the parallel version from 1 to --workers processes):
+
+    python -m dsa.anagrams --words 1000000 --workers 8
+"""
+
+import argparse
+import os
+import random
+import shutil
+import struct
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from hashlib import blake2b
+from zlib import crc32
+
+try:
+    import numpy as np
+except ImportError:  # optional — encode_keys falls back to a per-word loop
+    np = None
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+PARTITIONS = 256
+BUFFER = 1 << 16
+MEMORY_LIMIT = 256 << 20
+MAX_DEPTH = 3
+READ_CHUNK = 1 << 20
+SHARDS = 64
+CHUNK = 1 << 16
+
+_HEADER = struct.Struct("<II")      # key length, word length (bytes)
+_LETTERS = ALPHABET.encode("ascii")
+
+
+def anagram_key(word: str) -> bytes:
+    """Canonical, fixed-size key: 26 letter counts (see module docstring)."""
+    data = word.encode("utf-8")
+    if len(data) < 255 and not data.translate(None, _LETTERS):
+        counts = bytearray(26)
+        for code in data:
+            counts[code - 97] += 1
+        return bytes(counts)
+    return b"\xff" + "".join(sorted(word)).encode("utf-8")
+
+
+def encode_keys(words) -> list:
+    """anagram_key of every word in a list, batched (see module docstring)."""
+    if not words or "".join(words).encode("utf-8").translate(None, _LETTERS):
+        return [anagram_key(word) for word in words]      # some word isn't a-z
+    data = "\n".join(words).encode("ascii")
+    lengths = list(map(len, words))
+    if np is None or max(lengths) >= 255:
+        return [anagram_key(word) for word in words]
+    codes = np.frombuffer(data, dtype=np.uint8)
+    owner = np.repeat(np.arange(len(words), dtype=np.int64),
+                      np.array(lengths, dtype=np.int64) + 1)[:len(codes)]
+    letters = codes != 10
+    counts = np.bincount(owner[letters] * 26 + (codes[letters] - 97),
+                         minlength=26 * len(words)).astype(np.uint8).tobytes()
+    return [counts[i:i + 26] for i in range(0, len(counts), 26)]
+
+
+def words_from_file(path, encoding="utf-8"):
+    """Whitespace-separated tokens of a text file, read line by line."""
+    with open(path, encoding=encoding) as f:
+        for line in f:
+            yield from line.split()
+
+
+# ============================================================
+# SPILL + GROUP
+# ============================================================
+
+class _Spill:
+    """
+    `partitions` append-only temp files with one write buffer each.
+    Level 0 partitions by crc32(key); a re-spill at depth d uses a
+    blake2b salted with d — crc32 is affine, so a re-seeded crc32 would
+    send every key of one partition to the same sub-partition again.
+    """
+
+    def __init__(self, workdir, partitions, buffer, depth, prefix="part"):
+        self.paths = [os.path.join(workdir, f"{prefix}-{i:05d}")
+                      for i in range(partitions)]
+        self.buffers = [bytearray() for _ in range(partitions)]
+        self.buffer = buffer
+        self.salt = depth.to_bytes(8, "little")
+        self.depth = depth
+        for path in self.paths:
+            open(path, "wb").close()
+
+    def add(self, key: bytes, word: bytes):
+        if self.depth:
+            digest = blake2b(key, digest_size=8, salt=self.salt).digest()
+            i = int.from_bytes(digest, "little") % len(self.buffers)
+        else:
+            i = crc32(key) % len(self.buffers)
+        out = self.buffers[i]
+        out += _HEADER.pack(len(key), len(word))
+        out += key
+        out += word
+        if len(out) >= self.buffer:
+            self._flush(i)
+
+    def _flush(self, i):
+        with open(self.paths[i], "ab") as f:
+            f.write(self.buffers[i])
+        self.buffers[i].clear()
+
+    def close(self):
+        for i, out in enumerate(self.buffers):
+            if out:
+                self._flush(i)
+        self.buffers = None
+        return self.paths
+
+
+def _records(data):
+    """(key, word bytes) pairs of one partition file's contents."""
+    view, pos, size = memoryview(data), 0, len(data)
+    unpack = _HEADER.unpack_from
+    while pos < size:
+        klen, wlen = unpack(view, pos)
+        pos += 8
+        key = bytes(view[pos:pos + klen])
+        pos += klen
+        yield key, bytes(view[pos:pos + wlen])
+        pos += wlen
+
+
+def _record_end(data) -> int:
+    """Offset just past the last complete record in `data`."""
+    pos, size = 0, len(data)
+    while pos + 8 <= size:
+        klen, wlen = _HEADER.unpack_from(data, pos)
+        end = pos + 8 + klen + wlen
+        if end > size:
+            break
+        pos = end
+    return pos
+
+
+def _file_records(path, chunk):
+    """_records of a file read `chunk` bytes at a time."""
+    with open(path, "rb") as f:
+        tail = b""
+        while True:
+            block = f.read(chunk)
+            if not block:
+                return
+            data = tail + block
+            cut = _record_end(data)
+            yield from _records(data[:cut])
+            tail = data[cut:]
+
+
+def _group_partition(path, workdir, partitions, buffer, memory_limit, depth, encoding):
+    size = os.path.getsize(path)
+    if size > memory_limit and depth < MAX_DEPTH:
+        spill = _Spill(workdir, partitions, buffer, depth + 1,
+                       prefix=os.path.basename(path))
+        for key, word in _file_records(path, READ_CHUNK):
+            spill.add(key, word)
+        os.remove(path)
+        for sub in spill.close():
+            # A sub-partition as big as its parent is one giant group:
+            # splitting again cannot shrink it, so group it as it is
+            next_depth = depth + 1 if os.path.getsize(sub) < size else MAX_DEPTH
+            yield from _group_partition(sub, workdir, partitions, buffer,
+                                        memory_limit, next_depth, encoding)
+        return
+
+    groups = {}
+    for key, word in _file_records(path, READ_CHUNK):
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [word.decode(encoding)]
+        else:
+            group.append(word.decode(encoding))
+    os.remove(path)
+    yield from groups.values()
+
+
+def group_anagrams_stream(words, partitions=PARTITIONS, buffer=BUFFER,
+                          memory_limit=MEMORY_LIMIT, tmpdir=None, encoding="utf-8"):
+    """
+    Yield anagram groups (lists of words) of an iterable of words with
+    bounded memory.  Groups come out partition by partition; within a
+    group, words keep their input order.  Temp files live in `tmpdir`
+    (default: the system temp dir) and are removed as they are read.
+    """
+    workdir = tempfile.mkdtemp(prefix="anagrams-", dir=tmpdir)
+    try:
+        spill = _Spill(workdir, partitions, buffer, 0)
+        words = iter(words)
+        for batch in iter(lambda: list(islice(words, 4096)), []):
+            for key, word in zip(encode_keys(batch), batch):
+                spill.add(key, word.encode(encoding))
+        for path in spill.close():
+            yield from _group_partition(path, workdir, partitions, buffer,
+                                        memory_limit, 0, encoding)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def write_groups(groups, path, encoding="utf-8") -> int:
+    """One group per line, words separated by spaces.  Returns the group count."""
+    count = 0
+    with open(path, "w", encoding=encoding) as f:
+        for group in groups:
+            f.write(" ".join(group))
+            f.write("\n")
+            count += 1
+    return count
+
+
+# ============================================================
+# PARALLEL, SHARDED BY KEY HASH
+# ============================================================
+
+class AnagramGroups:
+    """
+    Anagram groups split into `shards` dicts (key → words) by crc32 of
+    the key.  Two AnagramGroups with the same shard count merge shard
+    by shard without recomputing any key.
+    """
+
+    __slots__ = ("shards",)
+
+    def __init__(self, shards: int = SHARDS):
+        self.shards = [{} for _ in range(shards)]
+
+    def add_words(self, words) -> "AnagramGroups":
+        shards = self.shards
+        count = len(shards)
+        for key, word in zip(encode_keys(words), words):
+            shard = shards[crc32(key) % count]
+            group = shard.get(key)
+            if group is None:
+                shard[key] = [word]
+            else:
+                group.append(word)
+        return self
+
+    def merge(self, other: "AnagramGroups") -> "AnagramGroups":
+        if len(other.shards) != len(self.shards):
+            raise ValueError("can only merge AnagramGroups with the same shard count")
+        for mine, theirs in zip(self.shards, other.shards):
+            if not mine:
+                mine.update(theirs)
+                continue
+            for key, words in theirs.items():
+                group = mine.get(key)
+                if group is None:
+                    mine[key] = words
+                else:
+                    group.extend(words)
+        return self
+
+    def groups(self):
+        for shard in self.shards:
+            yield from shard.values()
+
+    def __len__(self):
+        return sum(map(len, self.shards))
+
+    def word_count(self) -> int:
+        return sum(len(group) for group in self.groups())
+
+
+def _group_chunk(words, shards):
+    return AnagramGroups(shards).add_words(words)
+
+
+def group_anagrams_parallel(words, workers=None, shards=SHARDS,
+                            chunk=CHUNK) -> AnagramGroups:
+    """
+    Group an iterable of words on `workers` processes (None: every
+    core; 1: in this process).  At most 2 x workers chunks are in
+    flight, so the input can be a lazy stream.  Groups are in the
+    order each key was first seen per chunk, merged chunk by chunk.
+    """
+    workers = workers or os.cpu_count() or 1
+    words = iter(words)
+    chunks = iter(lambda: list(islice(words, chunk)), [])
+    result = AnagramGroups(shards)
+    if workers == 1:
+        for part in chunks:
+            result.add_words(part)
+        return result
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for part in chunks:
+            pending.append(pool.submit(_group_chunk, part, shards))
+            if len(pending) >= 2 * workers:
+                result.merge(pending.popleft().result())
+        while pending:
+            result.merge(pending.popleft().result())
+    return result
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def _write_corpus(path, n, rng):
+    letters = ALPHABET[:8]            # small alphabet → real groups
+    with open(path, "w") as f:
+        for _ in range(n):
+            f.write("".join(rng.choice(letters) for _ in range(rng.randint(1, 8))))
+            f.write("\n")
+
+
+def _canonical(groups):
+    return sorted(sorted(group) for group in groups)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark out-of-core group anagrams")
+    parser.add_argument("--words", type=int, default=10**6)
+    parser.add_argument("--partitions", type=int, default=PARTITIONS)
+    parser.add_argument("--memory-limit", type=int, default=MEMORY_LIMIT,
+                        help="largest partition file grouped in memory (bytes)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="scale the parallel version up to this many processes")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    from dsa.registry import problem
+    solution = problem(49).Solution2_FrequencyTuple()
+
+    workdir = tempfile.mkdtemp(prefix="anagrams-bench-")
+    try:
+        corpus = os.path.join(workdir, "corpus.txt")
+        _write_corpus(corpus, args.words, random.Random(args.seed))
+        print(f"{args.words:,} words, {os.path.getsize(corpus) / 2**20:.1f} MiB corpus, "
+              f"{args.partitions} partitions")
+
+        def run(label, fn):
+            start = time.perf_counter()
+            groups = fn()
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()
+            fn()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{label:<40}{elapsed:8.2f}s{peak / 2**20:10.1f} MiB peak")
+            return groups
+
+        # Peak includes holding the answer; the streamed run only counts groups
+        in_memory = run("Solution2 (list in RAM)",
+                        lambda: solution.groupAnagrams(list(words_from_file(corpus))))
+        stream = lambda: group_anagrams_stream(
+            words_from_file(corpus), args.partitions, memory_limit=args.memory_limit,
+            tmpdir=workdir)
+        count = run("group_anagrams_stream (count groups)",
+                    lambda: sum(1 for _ in stream()))
+        assert count == len(in_memory)
+        if args.words <= 10**6:
+            assert _canonical(stream()) == _canonical(in_memory)
+
+        words = list(words_from_file(corpus))
+        print(f"\n{'parallel workers':<20}{'time':>9}{'speedup':>10}")
+        counts = [1]
+        while counts[-1] * 2 <= args.workers:
+            counts.append(counts[-1] * 2)
+        if counts[-1] != args.workers:
+            counts.append(args.workers)
+        base = None
+        for workers in counts:
+            start = time.perf_counter()
+            grouped = group_anagrams_parallel(words, workers=workers)
+            elapsed = time.perf_counter() - start
+            base = base or elapsed
+            assert len(grouped) == len(in_memory)
+            print(f"{workers:<20}{elapsed:8.2f}s{base / elapsed:9.2f}x")
+        print(f"(os.cpu_count() = {os.cpu_count()})")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,531 @@
+"""
+============================================================
+Benchmark Runner — race every Solution variant of a problem
+============================================================
+
+Most problem files ship several competing classes (Solution1..7,
+SolutionV1..V5, SolutionBFS, ...) plus a hand-written complexity table.
+This runner measures them instead:
+
+    python -m dsa.bench priorityQueue_or_heaps/215-M-kth-largest-element.py
+    python -m dsa.bench 279 --sizes 100,1000,10000       # by id or slug
+    python -m dsa.bench --all --timeout 2
+
+For every file it:
+    1. Loads the module by path (dsa.loader).
+    2. Finds the entry method (a method with a registered WORKLOAD)
+       and every class exposing it.  Methods named `<entry>_<suffix>`
+       (uniquePaths_memoization, ...) count as separate variants.
+    3. Generates inputs of growing size n (10^3 .. 10^7 by default).
+    4. Runs each (variant, n) in a child process so exponential or
+       crashing variants can be killed after --timeout seconds.
+    5. Reports best wall time, peak extra memory (tracemalloc) and the
+       empirical slope of log(time) vs log(n):
+           ~1.0 → O(n),  ~1.1 → O(n log n),  ~2.0 → O(n²), ...
+
+Note: files that redefine `class Solution` several times only expose
+the LAST definition — earlier ones are shadowed at import time.
+"""
+
+import argparse
+import math
+import multiprocessing as mp
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+from dsa.loader import load_path, ROOT
+from dsa.registry import problem, problems
+
+
+DEFAULT_SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+
+# entry method name → (make_args, sizes, driver)
+#   make_args(n, rng, module) → tuple of positional args
+#   driver(obj, method_name, args) → runs one call (None = plain call)
+WORKLOADS = {}
+
+
+def workload(method, sizes=None, driver=None):
+    """Register an input generator for every class exposing `method`."""
+    def register(make_args):
+        WORKLOADS[method] = (make_args, sizes or DEFAULT_SIZES, driver)
+        return make_args
+    return register
+
+
+# ============================================================
+# INPUT GENERATORS
+# ============================================================
+# Sizes are picked so the best variant finishes the largest n in a few
+# seconds; slower variants simply time out at the bigger sizes.
+
+def _ints(n, rng, lo, hi):
+    return [rng.randint(lo, hi) for _ in range(n)]
+
+
+def _linked(module, values):
+    # Build with the module's own ListNode so attribute names match
+    head = None
+    for v in reversed(values):
+        head = module.ListNode(v, head)
+    return head
+
+
+def _grid(side, rng, lo=0, hi=100):
+    return [[rng.randint(lo, hi) for _ in range(side)] for _ in range(side)]
+
+
+# --- arrays -------------------------------------------------
+
+@workload("findKthLargest")
+def _kth_largest(n, rng, module):
+    return _ints(n, rng, -10**4, 10**4), max(1, n // 10)
+
+
+@workload("topKFrequent")
+def _top_k(n, rng, module):
+    return _ints(n, rng, 0, max(10, n // 10)), 10
+
+
+@workload("kClosest")
+def _k_closest(n, rng, module):
+    points = [[rng.randint(-10**4, 10**4), rng.randint(-10**4, 10**4)]
+              for _ in range(n)]
+    return points, 10
+
+
+@workload("longestConsecutive")
+def _longest_consecutive(n, rng, module):
+    return (_ints(n, rng, -n, n),)
+
+
+@workload("subarraySum", sizes=[10**3, 10**4, 10**5, 10**6])
+def _subarray_sum(n, rng, module):
+    return _ints(n, rng, -10, 10), 5
+
+
+@workload("pivotIndex")
+def _pivot_index(n, rng, module):
+    return (_ints(n, rng, -1000, 1000),)
+
+
+@workload("maxScore")
+def _max_score(n, rng, module):
+    return _ints(n, rng, 1, 10**4), n // 2
+
+
+@workload("groupAnagrams", sizes=[10**3, 10**4, 10**5, 10**6])
+def _group_anagrams(n, rng, module):
+    letters = string.ascii_lowercase[:6]   # small alphabet → real groups
+    return ([
+        "".join(rng.choice(letters) for _ in range(rng.randint(1, 8)))
+        for _ in range(n)
+    ],)
+
+
+@workload("checkInclusion")
+def _check_inclusion(n, rng, module):
+    s2 = "".join(rng.choice("abcdef") for _ in range(n))
+    return "fedcbaz", s2   # 'z' never appears → worst case, full scan
+
+
+# --- dynamic programming ------------------------------------
+
+@workload("numSquares", sizes=[10**2, 10**3, 10**4, 10**5])
+def _num_squares(n, rng, module):
+    return (n,)
+
+
+@workload("lengthOfLIS", sizes=[10**2, 10**3, 10**4, 10**5, 10**6])
+def _lis(n, rng, module):
+    return (_ints(n, rng, -10**4, 10**4),)
+
+
+@workload("fib", sizes=[10, 20, 30, 10**3, 10**4])
+def _fib(n, rng, module):
+    return (n,)
+
+
+@workload("tribonacci", sizes=[10, 20, 30, 10**3, 10**4])
+def _tribonacci(n, rng, module):
+    return (n,)
+
+
+@workload("climbStairs", sizes=[10, 20, 30, 10**3, 10**4])
+def _climb_stairs(n, rng, module):
+    return (n,)
+
+
+@workload("maxProfit")
+def _max_profit(n, rng, module):
+    return (_ints(n, rng, 0, 10**4),)
+
+
+@workload("rob")
+def _rob(n, rng, module):
+    return (_ints(n, rng, 0, 400),)
+
+
+@workload("jump", sizes=[10**2, 10**3, 10**4, 10**5, 10**6])
+def _jump(n, rng, module):
+    return (_ints(n, rng, 1, 5),)
+
+
+@workload("canJump", sizes=[10**2, 10**3, 10**4, 10**5, 10**6])
+def _can_jump(n, rng, module):
+    return (_ints(n, rng, 1, 5),)
+
+
+# n = side length of an n x n grid
+@workload("uniquePaths", sizes=[10, 100, 1000, 3000])
+def _unique_paths(n, rng, module):
+    return n, n
+
+
+@workload("minPathSum", sizes=[10, 100, 1000, 3000])
+def _min_path_sum(n, rng, module):
+    return (_grid(n, rng),)
+
+
+@workload("uniquePathsWithObstacles", sizes=[10, 100, 1000, 3000])
+def _unique_paths_obstacles(n, rng, module):
+    grid = [[1 if rng.random() < 0.1 else 0 for _ in range(n)]
+            for _ in range(n)]
+    grid[0][0] = grid[-1][-1] = 0
+    return (grid,)
+
+
+# --- graphs -------------------------------------------------
+
+@workload("eventualSafeNodes")
+def _safe_nodes(n, rng, module):
+    # ~2 out-edges per node, mostly forward so a good share stays safe
+    graph = []
+    for node in range(n):
+        edges = {rng.randint(node, n - 1) for _ in range(2)} - {node}
+        if rng.random() < 0.01:
+            edges.add(rng.randint(0, n - 1))   # occasional back edge
+        graph.append(sorted(edges))
+    return (graph,)
+
+
+# n = number of cities → n x n adjacency matrix
+@workload("findCircleNum", sizes=[100, 300, 1000, 3000])
+def _circle_num(n, rng, module):
+    matrix = [[0] * n for _ in range(n)]
+    for i in range(n):
+        matrix[i][i] = 1
+        j = rng.randint(0, n - 1)
+        matrix[i][j] = matrix[j][i] = 1
+    return (matrix,)
+
+
+# --- heaps / scheduling -------------------------------------
+
+@workload("leastInterval", sizes=[10**3, 10**4, 10**5, 10**6])
+def _least_interval(n, rng, module):
+    return [rng.choice(string.ascii_uppercase) for _ in range(n)], 2
+
+
+def _drive_median(obj, method, args):
+    (stream,) = args
+    for i, num in enumerate(stream):
+        obj.addNum(num)
+        if i % 100 == 0:
+            obj.findMedian()
+    return obj.findMedian()
+
+
+@workload("addNum", sizes=[10**3, 10**4, 10**5, 10**6], driver=_drive_median)
+def _median_stream(n, rng, module):
+    return (_ints(n, rng, -10**5, 10**5),)
+
+
+# --- linked lists -------------------------------------------
+
+@workload("reverseList")
+def _reverse_list(n, rng, module):
+    return (_linked(module, _ints(n, rng, 0, 5000)),)
+
+
+@workload("isPalindrome")
+def _is_palindrome(n, rng, module):
+    half = _ints(n // 2, rng, 0, 9)
+    return (_linked(module, half + half[::-1]),)
+
+
+@workload("reverseBetween")
+def _reverse_between(n, rng, module):
+    return _linked(module, _ints(n, rng, 0, 500)), 1, n
+
+
+# n = total nodes, spread over ~sqrt(n) sorted lists
+@workload("mergeKLists", sizes=[10**3, 10**4, 10**5, 10**6])
+def _merge_k(n, rng, module):
+    k = max(1, math.isqrt(n))
+    lists = [sorted(_ints(n // k, rng, -10**4, 10**4)) for _ in range(k)]
+    return ([_linked(module, values) for values in lists],)
+
+
+# ============================================================
+# DISCOVERY
+# ============================================================
+
+def discover(module, entry=None):
+    """
+    Return (entry, [(label, class_name, method_name), ...]).
+
+    Only classes defined in the module itself are considered, so
+    imported helpers (ListNode, typing.List, ...) are skipped.
+    """
+    classes = [
+        obj for obj in vars(module).values()
+        if isinstance(obj, type) and obj.__module__ == module.__name__
+    ]
+
+    if entry is None:
+        entry = _guess_entry(classes)
+    if entry is None:
+        return None, []
+
+    variants = []
+    for cls in classes:
+        for name in sorted(vars(cls)):
+            if name == entry or name.startswith(entry + "_"):
+                label = cls.__name__ if name == entry else f"{cls.__name__}.{name}"
+                variants.append((label, cls.__name__, name))
+    return entry, variants
+
+
+def _guess_entry(classes):
+    # The most widely exposed method that has a registered workload
+    counts = {}
+    for cls in classes:
+        for name in vars(cls):
+            if name in WORKLOADS:
+                counts[name] = counts.get(name, 0) + 1
+    if not counts:
+        return None
+    return max(counts, key=counts.get)
+
+
+# ============================================================
+# MEASUREMENT (runs in a child process)
+# ============================================================
+
+def _child(conn, path, entry, cls_name, method, n, seed, repeat):
+    try:
+        module = load_path(path)
+        cls = getattr(module, cls_name)
+        make_args, _, driver = WORKLOADS[entry]
+
+        def run(args):
+            obj = cls()
+            if driver is not None:
+                return driver(obj, method, args)
+            return getattr(obj, method)(*args)
+
+        # Fresh inputs per run — several variants mutate their input
+        # (sort in place, relink nodes).  Generation is NOT timed.
+        inputs = [make_args(n, random.Random(seed), module)
+                  for _ in range(repeat + 1)]
+        conn.send(("ready", None))
+
+        best = math.inf
+        for args in inputs[:repeat]:
+            start = time.perf_counter()
+            run(args)
+            best = min(best, time.perf_counter() - start)
+
+        # Separate pass for memory — tracemalloc slows execution
+        # too much to share a run with the timer.
+        tracemalloc.start()
+        run(inputs[repeat])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        conn.send(("ok", (best, peak)))
+    except RecursionError:
+        conn.send(("error", "RecursionError"))
+    except MemoryError:
+        conn.send(("error", "MemoryError"))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+def measure(path, entry, cls_name, method, n, seed=0, repeat=3, timeout=10.0):
+    """
+    Time one (variant, n) pair in a fresh process.
+    Returns ("ok", (seconds, peak_bytes)) | ("timeout", None) | ("error", msg).
+    The timeout starts once inputs are built, so big inputs aren't penalised.
+    """
+    parent, child = mp.Pipe(duplex=False)
+    proc = mp.Process(
+        target=_child,
+        args=(child, str(path), entry, cls_name, method, n, seed, repeat),
+        daemon=True,
+    )
+    proc.start()
+    child.close()
+
+    try:
+        status, payload = _recv(parent, proc, timeout=None)
+        if status == "ready":
+            status, payload = _recv(parent, proc, timeout)
+    finally:
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
+        parent.close()
+    return status, payload
+
+
+def _recv(conn, proc, timeout):
+    # poll(None) blocks until data arrives OR the child dies (EOF)
+    if not conn.poll(timeout):
+        return "timeout", None
+    try:
+        return conn.recv()
+    except EOFError:
+        return "error", f"child exited with code {proc.exitcode}"
+
+
+# ============================================================
+# ANALYSIS + REPORT
+# ============================================================
+
+def slope(points):
+    """
+    Least-squares slope of log(time) against log(n).
+    Points faster than 50µs are dropped — they are mostly call overhead.
+    """
+    pts = [(math.log(n), math.log(t)) for n, t in points if t > 5e-5]
+    if len(pts) < 2:
+        return None
+    mx = sum(x for x, _ in pts) / len(pts)
+    my = sum(y for _, y in pts) / len(pts)
+    sxx = sum((x - mx) ** 2 for x, _ in pts)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in pts) / sxx
+
+
+def _fmt_time(t):
+    if t < 1e-3:
+        return f"{t * 1e6:.0f}µs"
+    if t < 1:
+        return f"{t * 1e3:.1f}ms"
+    return f"{t:.2f}s"
+
+
+def _fmt_bytes(b):
+    for unit in ("B", "KB", "MB"):
+        if b < 1024:
+            return f"{b:.0f}{unit}"
+        b /= 1024
+    return f"{b:.1f}GB"
+
+
+def _fmt_n(n):
+    exp = math.log10(n)
+    return f"1e{exp:.0f}" if exp.is_integer() else str(n)
+
+
+def bench_file(path, entry=None, sizes=None, seed=0, repeat=3, timeout=10.0,
+               out=sys.stdout):
+    """
+    Benchmark every variant in one problem file and print a report.
+    `path` may be a file path, a LeetCode number or a slug.
+    """
+    path = problem(path).path
+    module = load_path(path)
+    entry, variants = discover(module, entry)
+    if not variants:
+        print(f"{path.relative_to(ROOT)}: no variant with a registered workload",
+              file=out)
+        return {}
+    if entry not in WORKLOADS:
+        raise KeyError(f"no workload registered for {entry!r}")
+
+    sizes = sizes or WORKLOADS[entry][1]
+    results = {}   # label → {n: (status, payload)}
+
+    for label, cls_name, method in variants:
+        results[label] = {}
+        for n in sizes:
+            status, payload = measure(path, entry, cls_name, method, n,
+                                      seed, repeat, timeout)
+            results[label][n] = (status, payload)
+            if status != "ok":
+                break   # bigger n won't do better
+
+    _report(path, entry, sizes, results, out)
+    return results
+
+
+def _report(path, entry, sizes, results, out):
+    width = max(len(label) for label in results) + 2
+    header = "".join(f"{'n=' + _fmt_n(n):>20}" for n in sizes)
+
+    print(f"\n{path.relative_to(ROOT)} — {entry}", file=out)
+    print(f"{'variant':<{width}}{header}{'slope':>8}", file=out)
+    print("-" * (width + 20 * len(sizes) + 8), file=out)
+
+    for label, runs in results.items():
+        cells, points = [], []
+        for n in sizes:
+            status, payload = runs.get(n, ("skip", None))
+            if status == "ok":
+                t, peak = payload
+                points.append((n, t))
+                cells.append(f"{_fmt_time(t)} / {_fmt_bytes(peak)}")
+            elif status == "error":
+                cells.append(payload.split(":")[0][:18])
+            else:
+                cells.append(status if status != "skip" else "-")
+        k = slope(points)
+        k = f"{k:.2f}" if k is not None else "-"
+        print(f"{label:<{width}}" + "".join(f"{c:>20}" for c in cells) + f"{k:>8}",
+              file=out)
+
+    # Fastest = got furthest up the size ladder, then lowest time there
+    def rank(label):
+        done = [n for n, (s, _) in results[label].items() if s == "ok"]
+        if not done:
+            return (0, math.inf)
+        top = max(done)
+        return (-top, results[label][top][1][0])
+
+    best = min(results, key=rank)
+    if rank(best)[1] < math.inf:
+        print(f"fastest: {best}   (cells are best time / peak extra memory)",
+              file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", nargs="*",
+                        help="problem files (relative to DSA/), ids or slugs")
+    parser.add_argument("--all", action="store_true", help="every problem file")
+    parser.add_argument("--method", help="entry method (default: auto-detect)")
+    parser.add_argument("--sizes", help="comma separated, e.g. 1e3,1e4,1e5")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="seconds per (variant, n) before it is killed")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    paths = [p.path for p in problems()] if args.all else args.paths
+    if not paths:
+        parser.error("give at least one problem file or --all")
+    sizes = [int(float(s)) for s in args.sizes.split(",")] if args.sizes else None
+
+    for path in paths:
+        bench_file(path, args.method, sizes, args.seed, args.repeat, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""
+============================================================
+CSRGraph — compressed sparse row graphs on two flat arrays
+============================================================
+
+The graph files keep one Python list per node: 547 a dense n x n
+matrix, 802 a list of neighbour lists (and Solution3 builds a second
+one for the reverse graph).  For a million nodes that is a million
+list objects plus an int object per edge.  CSR keeps the same data in
+two contiguous arrays:
+
+    graph = [[1, 2], [2], [0, 3], []]
+
+    indptr  = [0, 2, 3, 5, 5]     neighbours of u are
+    indices = [1, 2, 2, 0, 3]     indices[indptr[u]:indptr[u + 1]]
+
+    - 4 bytes per node + 4 bytes per edge (8 once n or E pass 2^31).
+    - transpose() is one counting sort, O(V + E), cached on the graph.
+    - g[u] returns u's neighbours and len(g) the node count, so
+      code written for a list of lists (802's Solution1..3) accepts a
+      CSRGraph unchanged.
+
+The functions below run the provinces, safe-nodes DFS and topological
+sort variants straight on the arrays — iteratively, so depth is no
+limit, with bytearray node states:
+
+    count_components(g)          547 (g symmetric, as the matrix is)
+    safe_nodes(g)                802 Solution2, explicit stack
+    safe_nodes_topological(g)    802 Solution3, Kahn on g.transpose()
+
+NumPy, when installed, does the counting sorts in C.
+
+Benchmark (memory of each representation + time of each algorithm):
+
+    python -m dsa.graph --n 1000000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from array import array
+from itertools import accumulate, chain, compress
+
+try:
+    import numpy as np
+except ImportError:  # optional — pure-Python counting sort otherwise
+    np = None
+
+from dsa.registry import problem
+
+
+def _typecode(limit: int) -> str:
+    """Smallest array typecode holding 0..limit."""
+    return "i" if limit < 2**31 else "q"
+
+
+def _zeros(typecode, n):
+    return array(typecode, bytes(array(typecode).itemsize * n))
+
+
+def _bucket(n, keys, values, typecode):
+    """
+    Stable counting sort of `values` by `keys` (both length E).
+    Returns (indptr, indices): values with key u land in row u.
+    """
+    if np is not None and len(keys):
+        k = np.frombuffer(keys, dtype=keys.typecode)
+        order = np.argsort(k, kind="stable")
+        counts = np.bincount(k, minlength=n)
+        indptr = array(typecode, [0])
+        indptr.frombytes(np.cumsum(counts, dtype=typecode).tobytes())
+        indices = array(typecode)
+        indices.frombytes(
+            np.frombuffer(values, dtype=values.typecode)[order].astype(typecode).tobytes())
+        return indptr, indices
+
+    counts = _zeros(typecode, n + 1)
+    for k in keys:
+        counts[k + 1] += 1
+    indptr = array(typecode, accumulate(counts))
+    fill = indptr[:-1]          # next free slot of each row
+    indices = _zeros(typecode, len(keys))
+    for k, v in zip(keys, values):
+        indices[fill[k]] = v
+        fill[k] += 1
+    return indptr, indices
+
+
+class CSRGraph:
+    """Directed graph on nodes 0..n-1 (see module docstring)."""
+
+    __slots__ = ("indptr", "indices", "_transpose")
+
+    def __init__(self, indptr, indices):
+        self.indptr = indptr
+        self.indices = indices
+        self._transpose = None
+
+    # ---- constructors -----------------------------------------------------
+    @classmethod
+    def from_adjacency(cls, graph) -> "CSRGraph":
+        """From a list of neighbour lists (802's input format)."""
+        degrees = list(map(len, graph))
+        typecode = _typecode(max(len(graph), sum(degrees)))
+        indptr = array(typecode, [0])
+        indptr.extend(accumulate(degrees))
+        return cls(indptr, array(typecode, chain.from_iterable(graph)))
+
+    @classmethod
+    def from_matrix(cls, matrix) -> "CSRGraph":
+        """From an n x n 0/1 matrix (547's isConnected)."""
+        n = len(matrix)
+        columns = range(n)
+        typecode = _typecode(n * n)
+        indptr = array(typecode, [0])
+        indices = array(typecode)
+        for row in matrix:
+            indices.extend(compress(columns, row))
+            indptr.append(len(indices))
+        return cls(indptr, indices)
+
+    @classmethod
+    def from_edges(cls, n: int, edges) -> "CSRGraph":
+        """From an iterable of (u, v) pairs — u → v; order within a row is kept."""
+        src, dst = array("q"), array("q")
+        for u, v in edges:
+            src.append(u)
+            dst.append(v)
+        typecode = _typecode(max(n, len(src)))
+        indptr, indices = _bucket(n, src, dst, typecode)
+        return cls(indptr, indices)
+
+    # ---- list-of-lists protocol ------------------------------------------
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def __getitem__(self, u):
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+    def __iter__(self):
+        indptr, indices = self.indptr, self.indices
+        for u in range(len(self)):
+            yield indices[indptr[u]:indptr[u + 1]]
+
+    def __repr__(self):
+        return f"CSRGraph(nodes={len(self)}, edges={self.num_edges})"
+
+    # ---- properties -------------------------------------------------------
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    def degree(self, u: int) -> int:
+        return self.indptr[u + 1] - self.indptr[u]
+
+    def out_degrees(self) -> array:
+        indptr = self.indptr
+        return array(indptr.typecode, map(int.__sub__, indptr[1:], indptr))
+
+    def nbytes(self) -> int:
+        return (self.indptr.itemsize * len(self.indptr)
+                + self.indices.itemsize * len(self.indices))
+
+    def to_adjacency(self) -> list:
+        return [row.tolist() for row in self]
+
+    def transpose(self) -> "CSRGraph":
+        """Reverse every edge.  O(V + E) once, then cached (both ways)."""
+        if self._transpose is None:
+            n, indptr = len(self), self.indptr
+            typecode = indptr.typecode
+            if np is not None:
+                sources = array(typecode)
+                sources.frombytes(np.repeat(
+                    np.arange(n, dtype=typecode),
+                    np.diff(np.frombuffer(indptr, dtype=typecode))).tobytes())
+            else:
+                sources = array(typecode, chain.from_iterable(
+                    [u] * (indptr[u + 1] - indptr[u]) for u in range(n)))
+            rev = CSRGraph(*_bucket(n, self.indices, sources, typecode))
+            rev._transpose = self
+            self._transpose = rev
+        return self._transpose
+
+
+# ============================================================
+# ALGORITHMS ON CSR
+# ============================================================
+
+WHITE, GRAY, SAFE, UNSAFE = 0, 1, 2, 3
+
+
+def count_components(g: CSRGraph) -> int:
+    """547: connected components of a symmetric graph, iterative DFS."""
+    indptr, indices = g.indptr, g.indices
+    seen = bytearray(len(g))
+    count = 0
+    root = seen.find(0)
+    while root != -1:
+        count += 1
+        seen[root] = 1
+        stack = [root]
+        while stack:
+            u = stack.pop()
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if not seen[v]:
+                    seen[v] = 1
+                    stack.append(v)
+        root = seen.find(0, root + 1)
+    return count
+
+
+def safe_nodes(g: CSRGraph) -> list:
+    """
+    802 three-color DFS with an explicit stack.
+
+    Each stack frame is (node, next edge offset); a frame resumes at the
+    child it descended into and reads the child's final colour.
+    TC: O(V + E)  SC: O(V)
+    """
+    indptr, indices = g.indptr, g.indices
+    n = len(g)
+    state = bytearray(n)
+    for root in range(n):
+        if state[root]:
+            continue
+        state[root] = GRAY
+        nodes, offsets = [root], [indptr[root]]
+        while nodes:
+            node = nodes[-1]
+            i, end = offsets[-1], indptr[node + 1]
+            while i < end and state[indices[i]] == SAFE:
+                i += 1
+            if i == end:                       # every neighbour is safe
+                state[node] = SAFE
+            else:
+                child = indices[i]
+                if state[child] == WHITE:      # descend, resume at i later
+                    offsets[-1] = i
+                    state[child] = GRAY
+                    nodes.append(child)
+                    offsets.append(indptr[child])
+                    continue
+                state[node] = UNSAFE           # GRAY = cycle, or UNSAFE child
+            nodes.pop()
+            offsets.pop()
+    # Already in node order — no sort needed
+    return [i for i in range(n) if state[i] == SAFE]
+
+
+def safe_nodes_topological(g: CSRGraph) -> list:
+    """802 Solution3: peel terminal nodes off the reversed graph (Kahn)."""
+    rev = g.transpose()
+    indptr, indices = rev.indptr, rev.indices
+    out_degree = g.out_degrees()
+    queue = [u for u, d in enumerate(out_degree) if d == 0]
+    safe = bytearray(len(g))
+    for node in queue:          # the list grows while we walk it
+        safe[node] = 1
+        for prev in indices[indptr[node]:indptr[node + 1]]:
+            out_degree[prev] -= 1
+            if out_degree[prev] == 0:
+                queue.append(prev)
+    return list(compress(range(len(g)), safe))
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def _random_adjacency(n, rng):
+    # Same shape as bench.py's eventualSafeNodes workload
+    graph = []
+    for node in range(n):
+        edges = {rng.randrange(node, n) for _ in range(2)} - {node}
+        if rng.random() < 0.01:
+            edges.add(rng.randrange(n))
+        graph.append(sorted(edges))
+    return graph
+
+
+def _province_lists(graph):
+    """547-style DFS over a list-of-lists graph (visited set + stack)."""
+    visited, count = set(), 0
+    for city in range(len(graph)):
+        if city in visited:
+            continue
+        count += 1
+        visited.add(city)
+        stack = [city]
+        while stack:
+            for nei in graph[stack.pop()]:
+                if nei not in visited:
+                    visited.add(nei)
+                    stack.append(nei)
+    return count
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark CSR vs list-of-lists graphs")
+    parser.add_argument("--n", type=int, default=10**6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    n = args.n
+
+    tracemalloc.start()
+    graph = _random_adjacency(n, random.Random(args.seed))
+    list_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    csr, build = _timed(lambda: CSRGraph.from_adjacency(graph))
+    rev, transpose = _timed(csr.transpose)
+    csr_bytes = csr.nbytes() + rev.nbytes()
+
+    print(f"nodes={n:,} edges={csr.num_edges:,}")
+    print(f"list of lists     {list_bytes / 2**20:8.1f} MiB")
+    print(f"CSR + transpose   {csr_bytes / 2**20:8.1f} MiB  "
+          f"(build {build:.2f}s, transpose {transpose:.2f}s)")
+
+    undirected = CSRGraph.from_edges(n, chain(
+        ((u, v) for u, row in enumerate(graph) for v in row),
+        ((v, u) for u, row in enumerate(graph) for v in row)))
+    undirected_lists = undirected.to_adjacency()
+    solution3 = problem("safe_nodes").Solution3()
+
+    rows = [
+        ("provinces: lists DFS", lambda: _province_lists(undirected_lists)),
+        ("provinces: CSR DFS", lambda: count_components(undirected)),
+        ("safe nodes: Solution3 (lists)", lambda: solution3.eventualSafeNodes(graph)),
+        ("safe nodes: Solution3 (CSR)", lambda: solution3.eventualSafeNodes(csr)),
+        ("safe nodes: CSR iterative DFS", lambda: safe_nodes(csr)),
+        ("safe nodes: CSR topological", lambda: safe_nodes_topological(csr)),
+    ]
+    results = {}
+    for label, fn in rows:
+        result, elapsed = _timed(fn)
+        results.setdefault(label.split(":")[0], set()).add(
+            result if isinstance(result, int) else len(result))
+        print(f"{label:<32}{elapsed:8.2f}s")
+    for kind, values in results.items():
+        assert len(values) == 1, f"{kind}: variants disagree {values}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""
+============================================================
+Parallel K-Way Merge — array-backed cousin of LeetCode 23
+============================================================
+
+LinkedList/23-H-merged-k-sorted-lists.py merges ListNode chains on one
+core.  This module merges plain sorted SEQUENCES and streams the result:
+
+    from dsa.kmerge import merge_sorted
+    for x in merge_sorted([a, b, c], workers=8):
+        ...
+
+Accepted sources (mix freely):
+    - list / array.array / numpy array / anything sliceable
+    - "runs.bin" or Path       → whole binary file of `typecode` items
+    - ("runs.bin", start, stop) → items [start, stop) of such a file
+  File sources are memory-mapped INSIDE the worker, so nothing but the
+  file name crosses the process boundary.
+
+How it works — a merge tree, Solution4's divide & conquer generalised:
+
+    level 0:  [s0 .. s63] [s64 .. s127] ...    ← groups of `fanin`
+                  │             │                  merged in a process
+                  ▼             ▼                  pool, each written
+    level 1:    run0          run1   ...           to a temp file
+                  └──── ... ────┘
+    final:   ≤ fanin runs, merged lazily in the parent → generator
+
+Block merge (used in workers for big groups and in the final stream):
+    - Read every source in blocks of `chunk` items.
+    - bound = smallest LAST value among the current blocks.  Every
+      value <= bound, from every block, is safe to emit now.
+    - Cut those prefixes (bisect), sort them together (timsort sees
+      ≤ fanin runs → C speed), yield the whole block at once.
+    - At least one block is used up per round, so the loop does
+      O(total blocks) rounds instead of O(N) heap pops in Python.
+
+Time:  O(N log k) comparisons, mostly in C (timsort / bisect)
+Space: parent O(fanin * chunk); workers O(group) below
+       `in_memory_limit`, O(fanin * chunk) above it.
+
+Benchmark (k lists of n items each, written to one memory-mapped file):
+
+    python -m dsa.kmerge --k 10000 --n 10000 --workers 8
+"""
+
+import argparse
+import array
+import bisect
+import heapq
+import math
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
+
+
+DEFAULT_CHUNK = 1 << 16
+DEFAULT_FANIN = 64
+IN_MEMORY_LIMIT = 10**7
+
+
+# ============================================================
+# READING SOURCES IN BLOCKS
+# ============================================================
+
+def _is_file_spec(src) -> bool:
+    if isinstance(src, (str, os.PathLike)):
+        return True
+    return (isinstance(src, tuple) and len(src) == 3
+            and isinstance(src[0], (str, os.PathLike)))
+
+
+def _blocks(src, typecode, chunk):
+    """Yield consecutive sorted blocks (Python lists) of one source."""
+    if _is_file_spec(src):
+        yield from _file_blocks(src, typecode, chunk)
+        return
+    n = len(src)
+    for i in range(0, n, chunk):
+        block = src[i:i + chunk]
+        yield block.tolist() if hasattr(block, "tolist") else list(block)
+
+
+def _file_blocks(spec, typecode, chunk):
+    if isinstance(spec, tuple):
+        path, start, stop = spec
+    else:
+        path, start, stop = spec, 0, None
+    if os.path.getsize(path) == 0:
+        return   # mmap can't map an empty file
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm).cast(typecode)
+        try:
+            stop = len(view) if stop is None else stop
+            for i in range(start, stop, chunk):
+                yield view[i:min(i + chunk, stop)].tolist()
+        finally:
+            view.release()   # must happen before the mmap closes
+
+
+def _length(src, typecode) -> int:
+    if not _is_file_spec(src):
+        return len(src)
+    if isinstance(src, tuple):
+        return src[2] - src[1]
+    return os.path.getsize(src) // array.array(typecode).itemsize
+
+
+# ============================================================
+# BLOCK MERGE
+# ============================================================
+
+def block_merge(sources, typecode="q", chunk=DEFAULT_CHUNK):
+    """
+    Merge sorted sources, yielding sorted LISTS (blocks) of values.
+    Concatenating the blocks gives the fully merged sequence.
+    """
+    streams = [_blocks(src, typecode, chunk) for src in sources]
+    heads = []   # [current block, its stream]
+    for stream in streams:
+        block = next(stream, None)
+        if block:
+            heads.append([block, stream])
+
+    while heads:
+        if len(heads) == 1:
+            # Only one source left — pass its blocks straight through
+            block, stream = heads.pop()
+            yield block
+            yield from stream
+            return
+
+        bound = min(block[-1] for block, _ in heads)
+        out = []
+        alive = []
+        for head in heads:
+            block, stream = head
+            cut = bisect.bisect_right(block, bound)
+            if cut:
+                out.extend(block[:cut])
+            if cut < len(block):
+                head[0] = block[cut:]
+                alive.append(head)
+            else:
+                nxt = next(stream, None)
+                if nxt:
+                    head[0] = nxt
+                    alive.append(head)
+        heads = alive
+        out.sort()   # ≤ len(heads) sorted runs → timsort merges them
+        yield out
+
+
+# ============================================================
+# WORKER: merge one group of the tree into a temp file
+# ============================================================
+
+def _merge_group(sources, out_path, typecode, chunk, in_memory_limit):
+    total = sum(_length(src, typecode) for src in sources)
+    with open(out_path, "wb") as f:
+        if total <= in_memory_limit:
+            # Small enough: one timsort over the concatenation is
+            # fastest — it detects the sorted runs and merges them.
+            values = sorted(chain.from_iterable(
+                chain.from_iterable(_blocks(src, typecode, chunk))
+                for src in sources))
+            array.array(typecode, values).tofile(f)
+        else:
+            for block in block_merge(sources, typecode, chunk):
+                array.array(typecode, block).tofile(f)
+    return (str(out_path), 0, total)
+
+
+class _InlineExecutor:
+    """Executor stand-in for workers=1: run tasks in this process."""
+
+    def map(self, fn, *iterables):
+        return list(map(fn, *iterables))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+# ============================================================
+# PUBLIC ENTRY POINTS
+# ============================================================
+
+def merge_sorted_blocks(sources, workers=None, typecode="q", fanin=DEFAULT_FANIN,
+                        chunk=DEFAULT_CHUNK, in_memory_limit=IN_MEMORY_LIMIT,
+                        tmpdir=None):
+    """
+    Same as merge_sorted() but yields sorted blocks (lists) — cheaper
+    when the consumer works in batches (writing to disk, numpy, ...).
+    """
+    if fanin < 2:
+        raise ValueError("fanin must be at least 2")
+    workers = workers or os.cpu_count() or 1
+    runs = [src for src in sources if _length(src, typecode)]
+    workdir = Path(tempfile.mkdtemp(prefix="kmerge-", dir=tmpdir))
+
+    try:
+        level = 0
+        pool = ProcessPoolExecutor(workers) if workers > 1 else _InlineExecutor()
+        with pool:
+            while len(runs) > fanin:
+                groups = [runs[i:i + fanin] for i in range(0, len(runs), fanin)]
+                outs = [workdir / f"l{level}-{i}.bin" for i in range(len(groups))]
+                merged = list(pool.map(
+                    _merge_group, groups, outs,
+                    [typecode] * len(groups), [chunk] * len(groups),
+                    [in_memory_limit] * len(groups),
+                ))
+                # Inputs of this level that WE created are no longer needed
+                for src in runs:
+                    if _is_file_spec(src) and Path(src[0]).parent == workdir:
+                        os.remove(src[0])
+                runs = merged
+                level += 1
+
+        yield from block_merge(runs, typecode, chunk)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def merge_sorted(sources, workers=None, typecode="q", fanin=DEFAULT_FANIN,
+                 chunk=DEFAULT_CHUNK, in_memory_limit=IN_MEMORY_LIMIT, tmpdir=None):
+    """
+    Lazily merge k sorted sources into one sorted stream of values.
+
+    workers=None uses every core; workers=1 runs the same merge tree
+    in-process.  Values must fit `typecode` ("q" = int64, "d" = float)
+    since intermediate runs are stored as raw arrays.
+    """
+    return chain.from_iterable(merge_sorted_blocks(
+        sources, workers, typecode, fanin, chunk, in_memory_limit, tmpdir))
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def _write_runs(path, k, n, seed, typecode):
+    """k sorted runs of n random items, back to back in one file."""
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    specs = []
+    with open(path, "wb") as f:
+        if np is not None:
+            rng = np.random.default_rng(seed)
+            for i in range(k):
+                np.sort(rng.integers(0, 2**40, n)).astype(np.int64).tofile(f)
+                specs.append((str(path), i * n, (i + 1) * n))
+        else:
+            import random
+            rng = random.Random(seed)
+            for i in range(k):
+                array.array(typecode, sorted(rng.randrange(2**40) for _ in range(n))).tofile(f)
+                specs.append((str(path), i * n, (i + 1) * n))
+    return specs
+
+
+def _drain(stream):
+    # Consume without keeping anything; check order on the fly
+    count, last = 0, -math.inf
+    for block in stream:
+        if block:
+            assert block[0] >= last, "output not sorted"
+            last = block[-1]
+            count += len(block)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark parallel k-way merge")
+    parser.add_argument("--k", type=int, default=10**4, help="number of sorted lists")
+    parser.add_argument("--n", type=int, default=10**4, help="items per list")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--fanin", type=int, default=DEFAULT_FANIN)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-heapq", action="store_true",
+                        help="skip the (slow) heapq.merge baseline")
+    args = parser.parse_args(argv)
+
+    workdir = Path(tempfile.mkdtemp(prefix="kmerge-bench-"))
+    try:
+        start = time.perf_counter()
+        specs = _write_runs(workdir / "runs.bin", args.k, args.n, args.seed, "q")
+        total = args.k * args.n
+        print(f"k={args.k:,} lists × n={args.n:,} = {total:,} items "
+              f"(generated in {time.perf_counter() - start:.1f}s)")
+
+        def report(label, fn):
+            start = time.perf_counter()
+            count = fn()
+            elapsed = time.perf_counter() - start
+            assert count == total, (count, total)
+            print(f"{label:<34} {elapsed:8.2f}s  {total / elapsed / 1e6:7.2f} M items/s")
+
+        if not args.skip_heapq:
+            def baseline():
+                streams = [chain.from_iterable(_blocks(s, "q", DEFAULT_CHUNK)) for s in specs]
+                deque(heapq.merge(*streams), maxlen=0)
+                return total
+            report("heapq.merge (1 core)", baseline)
+
+        report("block merge tree (1 core)",
+               lambda: _drain(merge_sorted_blocks(specs, workers=1, fanin=args.fanin)))
+        report(f"block merge tree ({args.workers} workers)",
+               lambda: _drain(merge_sorted_blocks(specs, workers=args.workers,
+                                                  fanin=args.fanin)))
+        report("  …streamed as single values",
+               lambda: sum(1 for _ in merge_sorted(specs, workers=args.workers,
+                                                   fanin=args.fanin)))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
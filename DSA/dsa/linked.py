@@ -0,0 +1,324 @@
+"""
+============================================================
+Compact linked lists — ListNode without the per-object cost
+============================================================
+
+A plain `ListNode` (no __slots__) is a Python object PLUS its own
+__dict__: ~90 bytes per node on CPython 3.11 (more on older versions)
+before counting the value — a 10^6-node list is ~10^6 tiny allocations.
+
+Two cheaper representations:
+
+1. ListNode with __slots__ = ("val", "next")
+   - ~48 bytes per node, attribute access through a C slot descriptor.
+   - Drop-in: every algorithm written against `.val` / `.next` works
+     unchanged.  The ListNode classes in M-206, 92-M and E-234 use it.
+
+2. CompactLinkedList — two parallel array('q') buffers
+       vals[i] = value of node i
+       nxt[i]  = index of the node after i   (-1 = None)
+   - 16 bytes per node, ONE allocation per buffer, no per-node objects.
+   - Nodes are indices, so "pointer" rewiring is an array store.
+   - insert_after / push_front add a node in O(1): it goes at the end
+     of the buffers and is linked in by rewiring `nxt`.
+   - While node order == index order (`contiguous`: a freshly built
+     list, or one only ever extended at its tail) the three algorithms
+     collapse to C-level slice ops on `vals` — no Python loop at all.
+     Any other insertion clears the flag and they walk `nxt` instead;
+     compact() re-lays the nodes out in order and restores it.
+   - reverse / reverse_between / is_palindrome below are the O(1)-space
+     algorithms from M-206 (iterative), 92-M (three-pointer) and E-234
+     (Solution — reverse half, compare, restore), rewritten on indices.
+   - Values must fit a signed 64-bit integer.
+
+Benchmark (build memory + time of each algorithm per representation):
+
+    python -m dsa.linked --n 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+from array import array
+
+from dsa.registry import problem
+
+NIL = -1
+
+
+class ListNode:
+    """LeetCode's ListNode, slotted."""
+
+    __slots__ = ("val", "next")
+
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+
+class CompactLinkedList:
+    """Singly linked list stored as index arrays (see module docstring)."""
+
+    __slots__ = ("vals", "nxt", "head", "contiguous")
+
+    def __init__(self, values=()):
+        self.vals = array("q", values)
+        n = len(self.vals)
+        # Node i → i + 1 initially; the last node points to NIL
+        self.nxt = array("q", range(1, n + 1))
+        if n:
+            self.nxt[-1] = NIL
+        self.head = 0 if n else NIL
+        self.contiguous = True      # node i is the i-th node in order
+
+    # ---- converters -------------------------------------------------------
+    @classmethod
+    def from_nodes(cls, head) -> "CompactLinkedList":
+        """Copy any `.val` / `.next` chain (plain or slotted ListNode)."""
+        values = array("q")
+        while head:
+            values.append(head.val)
+            head = head.next
+        return cls(values)
+
+    def to_nodes(self, node_cls=ListNode):
+        """Build a `.val` / `.next` chain in list order (node_cls(val, next))."""
+        head = None
+        for v in reversed(self.to_list()):
+            head = node_cls(v, head)
+        return head
+
+    def to_list(self) -> list:
+        if self.contiguous:
+            return self.vals.tolist()
+        vals, nxt = self.vals, self.nxt
+        out = []
+        i = self.head
+        while i != NIL:
+            out.append(vals[i])
+            i = nxt[i]
+        return out
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __len__(self):
+        return len(self.vals)
+
+    def __repr__(self):
+        preview = self.to_list()[:8]
+        tail = " → …" if len(self) > 8 else ""
+        return "CompactLinkedList(" + " → ".join(map(str, preview)) + tail + ")"
+
+    def compact(self) -> "CompactLinkedList":
+        """Re-lay the nodes out in list order (restores `contiguous`)."""
+        if not self.contiguous:
+            CompactLinkedList.__init__(self, self.to_list())
+        return self
+
+    def node_at(self, position: int) -> int:
+        """Index of the node at 0-based `position` in list order."""
+        if not 0 <= position < len(self.vals):
+            raise IndexError("position out of range")
+        if self.contiguous:
+            return position
+        i = self.head
+        for _ in range(position):
+            i = self.nxt[i]
+        return i
+
+    # ---- insertion ----------------------------------------------------------
+    def insert_after(self, node: int, value) -> int:
+        """Link a new node after `node` (NIL: new head).  Returns its index.  O(1)"""
+        i = len(self.vals)
+        self.vals.append(value)
+        if node == NIL:
+            self.nxt.append(self.head)
+            self.head = i
+        else:
+            self.nxt.append(self.nxt[node])
+            self.nxt[node] = i
+        # Index order survives only an append after the last node
+        if node != i - 1 or self.nxt[i] != NIL:
+            self.contiguous = False
+        return i
+
+    def push_front(self, value) -> int:
+        return self.insert_after(NIL, value)
+
+    def nbytes(self) -> int:
+        return (self.vals.itemsize * len(self.vals)
+                + self.nxt.itemsize * len(self.nxt))
+
+    # ---- M-206: reverse the whole list -------------------------------------
+    def reverse(self) -> "CompactLinkedList":
+        """In-place pointer reversal.  TC: O(n) SC: O(1)"""
+        if self.contiguous:
+            self.vals.reverse()     # same sequence, done in C
+            return self
+        nxt = self.nxt
+        prev, curr = NIL, self.head
+        while curr != NIL:
+            tail = nxt[curr]
+            nxt[curr] = prev
+            prev = curr
+            curr = tail
+        self.head = prev
+        return self
+
+    # ---- 92-M: reverse positions left..right (1-indexed) -----------------
+    def reverse_between(self, left: int, right: int) -> "CompactLinkedList":
+        """Three-pointer reversal of a sublist.  TC: O(n) SC: O(1)"""
+        if left >= right or self.head == NIL:
+            return self
+        if self.contiguous:
+            self.vals[left - 1:right] = self.vals[left - 1:right][::-1]
+            return self
+        nxt = self.nxt
+
+        # 'first' = node before position left (NIL stands in for dummy)
+        first = NIL
+        for _ in range(left - 1):
+            first = self.head if first == NIL else nxt[first]
+
+        second = self.head if first == NIL else nxt[first]
+        current, third = second, NIL
+        for _ in range(right - left + 1):
+            tail = nxt[current]
+            nxt[current] = third
+            third = current
+            current = tail
+
+        if first == NIL:
+            self.head = third
+        else:
+            nxt[first] = third
+        nxt[second] = current
+        return self
+
+    # ---- E-234: palindrome check, list restored afterwards ----------------
+    def is_palindrome(self) -> bool:
+        """Reverse second half, compare, reverse back.  TC: O(n) SC: O(1)"""
+        vals, nxt, head = self.vals, self.nxt, self.head
+        if head == NIL or nxt[head] == NIL:
+            return True
+        if self.contiguous:
+            half = len(vals) // 2
+            # memoryview slices compare in C without copying the halves
+            view = memoryview(vals)
+            return view[:half] == view[::-1][:half]
+
+        slow = fast = head
+        while fast != NIL and nxt[fast] != NIL:
+            slow = nxt[slow]
+            fast = nxt[nxt[fast]]
+
+        prev, curr = NIL, slow
+        while curr != NIL:
+            tail = nxt[curr]
+            nxt[curr] = prev
+            prev = curr
+            curr = tail
+
+        result = True
+        first, second = head, prev
+        while second != NIL:
+            if vals[first] != vals[second]:
+                result = False
+                break
+            first = nxt[first]
+            second = nxt[second]
+
+        # Restore the second half
+        restore, curr = NIL, prev
+        while curr != NIL:
+            tail = nxt[curr]
+            nxt[curr] = restore
+            restore = curr
+            curr = tail
+        return result
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+class _PlainNode:
+    """The unslotted ListNode every LeetCode file starts with."""
+
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+
+def _chain(node_cls, values):
+    head = None
+    for v in reversed(values):
+        head = node_cls(v, head)
+    return head
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark linked list representations")
+    parser.add_argument("--n", type=int, default=10**6)
+    args = parser.parse_args(argv)
+    n = args.n
+
+    half = [i % 1000 for i in range(n // 2)]
+    palindrome = half + half[::-1]
+    values = list(range(n))
+
+    reverse = problem("reverse_linked_list").Solution()          # stack version
+    reverse_ii = problem("reverse_linked_list_ii").Solution()    # three-pointer
+    is_pal = problem("palindrome_linked_list").Solution()        # restore version
+
+    def build_memory(make):
+        tracemalloc.start()
+        obj = make()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return obj, size
+
+    print(f"n = {n:,}")
+    print(f"{'representation':<22}{'bytes/node':>12}{'reverse':>11}"
+          f"{'rev[l..r]':>11}{'palindrome':>12}")
+
+    for label, node_cls in (("ListNode (dict)", _PlainNode),
+                            ("ListNode (__slots__)", ListNode)):
+        head, size = build_memory(lambda: _chain(node_cls, values))
+        holder = [head]
+        t1 = _timed(lambda: holder.__setitem__(0, reverse.reverseList(holder[0])))
+        t2 = _timed(lambda: holder.__setitem__(
+            0, reverse_ii.reverseBetween(holder[0], 2, n - 1)))
+        del holder, head
+        pal = _chain(node_cls, palindrome)
+        t3 = _timed(lambda: is_pal.isPalindrome(pal))
+        del pal
+        print(f"{label:<22}{size / n:>12.1f}{t1:>10.3f}s{t2:>10.3f}s{t3:>11.3f}s")
+
+    def pushed_front(items):
+        # Same list, built head-first: node order is the reverse of
+        # index order, so every algorithm takes the pointer-walking path
+        lst = CompactLinkedList()
+        for v in reversed(items):
+            lst.push_front(v)
+        return lst
+
+    for label, build in (("Compact (index walk)", pushed_front),
+                         ("Compact (contiguous)", CompactLinkedList)):
+        lst, size = build_memory(lambda: build(values))
+        t1 = _timed(lst.reverse)
+        t2 = _timed(lambda: lst.reverse_between(2, n - 1))
+        pal = build(palindrome)
+        t3 = _timed(pal.is_palindrome)
+        print(f"{label:<22}{size / n:>12.1f}{t1:>10.3f}s{t2:>10.3f}s{t3:>11.3f}s")
+
+
+if __name__ == "__main__":
+    main()
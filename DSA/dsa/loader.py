@@ -0,0 +1,77 @@
+"""
+Load problem files by path.
+
+Every file under DSA/<category>/ is a standalone script whose name is
+not a valid identifier (`23-H-merged-k-sorted-lists.py`).  We give each
+one a stable module name, exec it once and keep it in `sys.modules`,
+so repeated loads are a dict lookup instead of re-running the module
+body (and its demo code).
+
+Solution classes that build on the package import it inside their
+methods (`from dsa.robber import rob_circular`), so every file still
+imports and runs standalone; only those classes need `dsa` on the
+path.  From DSA/, `python -m dsa <file> [args ...]` runs a file's
+`__main__` block with the package importable.
+"""
+
+import importlib.util
+import re
+import sys
+from pathlib import Path
+
+# DSA/ — the folder that holds the category directories
+ROOT = Path(__file__).resolve().parent.parent
+
+# Package prefix for the synthetic module names
+PREFIX = "dsa.problems"
+
+
+def module_name(path) -> str:
+    """
+    DP/279_perfect_squares.py         → dsa.problems.DP.p279_perfect_squares
+    LinkedList/E-141-linked-list-...  → dsa.problems.LinkedList.E_141_linked_list_...
+    """
+    path = resolve(path)
+    category = path.parent.name.replace("-", "_")
+    stem = re.sub(r"\W", "_", path.stem)
+    if stem[0].isdigit():
+        stem = "p" + stem   # identifiers can't start with a digit
+    return f"{PREFIX}.{category}.{stem}"
+
+
+def resolve(path) -> Path:
+    """Accept absolute paths or paths relative to DSA/."""
+    path = Path(path)
+    if not path.is_absolute():
+        path = ROOT / path
+    return path.resolve()
+
+
+def load_path(path):
+    """Import a problem file by path, once.  Returns the module object."""
+    path = resolve(path)
+    name = module_name(path)
+
+    # Already loaded → O(1) lookup, the module body is NOT re-run
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+
+    # Register before exec so self-references resolve
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def problem_files():
+    """Every solution file under DSA/<category>/, sorted."""
+    return sorted(
+        p for p in ROOT.glob("*/*.py")
+        if p.parent.name != "dsa"
+    )
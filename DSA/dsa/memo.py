@@ -0,0 +1,81 @@
+"""
+============================================================
+Memoization — DP tables that outlive one call
+============================================================
+
+The top-down DP files each roll their own memo: a dict inside the call
+(45 SolutionMemo, 213 SolutionRecursiveMemo, 300) or an lru_cache(None)
+re-created per call (279 SolutionV4).  Those stay as they are — a plain
+dict per call is the fastest memo there is.  This module is for a memo
+that outlives one call:
+
+    table = DPTable(fill, typecode="b")  # bottom-up table that grows on
+    table[n]                             # demand → repeated queries O(1)
+    table.save("squares.tbl")            # ... and survives restarts
+
+Only a subproblem independent of the input can be kept like this (279:
+dp(remaining) is the same for every n; 279 SolutionV6 keeps a DPTable per
+solver instance).  A subproblem tied to one input (45: dfs(i) depends on
+nums) belongs in a per-call dict.  Filling bottom-up means no recursion,
+so a table of any size is safe from the recursion limit.
+"""
+
+import os
+import tempfile
+from array import array
+
+
+# ============================================================
+# DP TABLE — bottom-up, grows on demand, persistable
+# ============================================================
+
+class DPTable:
+    """
+    dp[0..n] kept between calls.  `fill(dp, i)` returns dp[i] given
+    dp[0..i-1]; indices past the end are computed once, on first use.
+
+        squares = DPTable(lambda dp, i: ..., typecode="b", base=[0])
+        squares[12]      # computes dp[1..12]
+        squares[7]       # O(1) read
+    """
+
+    __slots__ = ("fill", "values")
+
+    def __init__(self, fill, typecode="q", base=()):
+        self.fill = fill
+        self.values = array(typecode, base)
+
+    def ensure(self, n: int) -> None:
+        """Make dp[0..n] available."""
+        values, fill = self.values, self.fill
+        for i in range(len(values), n + 1):
+            values.append(fill(values, i))
+
+    def __getitem__(self, i: int):
+        if i >= len(self.values):
+            self.ensure(i)
+        return self.values[i]
+
+    def __len__(self):
+        return len(self.values)
+
+    def save(self, path) -> None:
+        """Raw array dump via temp file + os.replace (never half-written)."""
+        path = os.fspath(path)
+        fd, tmp = tempfile.mkstemp(prefix=".dptable-",
+                                   dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                self.values.tofile(f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def load(self, path) -> "DPTable":
+        """Replace the values with a saved table of the same typecode."""
+        values = array(self.values.typecode)
+        with open(path, "rb") as f:
+            values.frombytes(f.read())
+        self.values = values
+        return self
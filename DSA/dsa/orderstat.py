@@ -0,0 +1,275 @@
+"""
+============================================================
+Order statistics — introselect with a guaranteed O(n) bound
+============================================================
+
+215's quickselects (Solution2) pick the last element as the pivot and
+recurse: sorted or all-equal input makes every partition peel off one
+element → O(n²) time and O(n) recursion depth.  This module fixes both:
+
+    kth_smallest(nums, 3)             # 3rd smallest (1-indexed, like 215)
+    kth_largest(nums, [1, 10, 100])   # several k, ONE partitioning pass
+    nth_element(nums, 500)            # std::nth_element: partial sort in place
+
+How it works (introselect):
+    - Pivot = median of first / middle / last.  Partition THREE ways
+      (< pivot, == pivot, > pivot), so duplicates never degrade it.
+    - Keep only the side(s) holding a wanted rank — with several ranks,
+      a segment is split between them, so k queries cost one pass over
+      the shared prefix of the partition tree, not k selections.
+    - Every segment carries a depth budget (2·log2 n).  Once a segment
+      has spent it (an adversarial input is feeding bad pivots), its
+      pivots come from median-of-medians instead, which always
+      discards ≥ 30% → O(n) worst case.
+    - Segments of ≤ 16 items are just sorted.
+    - No recursion: segments wait on an explicit stack.
+
+Partitions are built with list comprehensions (C-level loops) and
+written back as one slice — several times faster in CPython than
+swapping elements one by one, for O(segment) temporary memory.  Items
+equal to the pivot are written back as the pivot object itself.
+
+On random lists this only just beats sorted() (a C timsort); the wins
+are the O(n) worst case, multi-k, and np.partition for arrays.
+
+Backends: "python" (above), "numpy" (np.partition, also multi-k), or
+"auto" — NumPy for NumPy arrays, Python otherwise.
+
+Benchmark (random, sorted, all-equal and few-distinct inputs):
+
+    python -m dsa.orderstat --n 1000000
+"""
+
+import argparse
+import random
+import time
+from numbers import Integral
+
+try:
+    import numpy as np
+except ImportError:  # optional — only the "numpy" backend needs it
+    np = None
+
+SMALL = 16     # segments this short are sorted outright
+
+
+# ============================================================
+# PIVOTS
+# ============================================================
+
+def _median_of_3(a, lo, hi):
+    x, y, z = a[lo], a[(lo + hi) // 2], a[hi - 1]
+    if x < y:
+        return y if y < z else (z if x < z else x)
+    return x if x < z else (z if y < z else y)
+
+
+def _median_of_medians(a, lo, hi):
+    """BFPRT pivot: median of the medians of groups of 5."""
+    medians = []
+    for i in range(lo, hi, 5):
+        group = sorted(a[i:min(i + 5, hi)])
+        medians.append(group[(len(group) - 1) // 2])
+    mid = (len(medians) - 1) // 2
+    _select(medians, [mid])          # ~n/5 items, its own budget
+    return medians[mid]
+
+
+# ============================================================
+# ENGINE
+# ============================================================
+
+def _select(a, ranks):
+    """
+    Rearrange list `a` in place so that a[r] holds its sorted-order
+    value for every r in `ranks` (sorted, distinct, 0-indexed), with
+    smaller items before it and larger ones after.
+    """
+    if not ranks:
+        return
+    budget = 2 * max(1, len(a).bit_length())
+    # (lo, hi, first rank index, end rank index, depth left)
+    stack = [(0, len(a), 0, len(ranks), budget)]
+    while stack:
+        lo, hi, r0, r1, depth = stack.pop()
+        if hi - lo <= SMALL:
+            a[lo:hi] = sorted(a[lo:hi])
+            continue
+
+        if depth > 0:
+            pivot = _median_of_3(a, lo, hi)
+        else:
+            pivot = _median_of_medians(a, lo, hi)
+
+        segment = a[lo:hi]
+        less = [x for x in segment if x < pivot]
+        greater = [x for x in segment if pivot < x]
+        lt = lo + len(less)
+        gt = hi - len(greater)
+        a[lo:hi] = less + [pivot] * (gt - lt) + greater
+        del segment, less, greater
+
+        # Ranks inside [lt, gt) are settled (equal to the pivot)
+        split_lo = r0
+        while split_lo < r1 and ranks[split_lo] < lt:
+            split_lo += 1
+        split_hi = split_lo
+        while split_hi < r1 and ranks[split_hi] < gt:
+            split_hi += 1
+        if split_lo > r0:
+            stack.append((lo, lt, r0, split_lo, depth - 1))
+        if split_hi < r1:
+            stack.append((gt, hi, split_hi, r1, depth - 1))
+
+
+def _ranks(ks, n, largest):
+    """1-indexed k (or several) → sorted distinct 0-indexed ranks."""
+    single = isinstance(ks, Integral)
+    ks = [int(ks)] if single else [int(k) for k in ks]
+    for k in ks:
+        if not 1 <= k <= n:
+            raise ValueError(f"k={k} out of range for {n} items")
+    ranks = [n - k if largest else k - 1 for k in ks]
+    return single, ranks, sorted(set(ranks))
+
+
+def _use_numpy(data, backend):
+    if backend == "auto":
+        return np is not None and isinstance(data, np.ndarray)
+    if backend == "numpy":
+        if np is None:
+            raise ImportError("the numpy backend needs numpy installed")
+        return True
+    if backend == "python":
+        return False
+    raise ValueError(f"unknown backend {backend!r}")
+
+
+def _kth(data, ks, largest, backend):
+    single, ranks, wanted = _ranks(ks, len(data), largest)
+    if _use_numpy(data, backend):
+        arr = np.partition(np.asarray(data), wanted)
+        values = {r: arr[r].item() for r in wanted}
+    else:
+        work = list(data)
+        _select(work, wanted)
+        values = {r: work[r] for r in wanted}
+    return values[ranks[0]] if single else [values[r] for r in ranks]
+
+
+# ============================================================
+# PUBLIC API
+# ============================================================
+
+def kth_smallest(data, k, backend="auto"):
+    """
+    k-th smallest item, k 1-indexed.  `k` may be a list of ks — then a
+    list of answers comes back, all from one pass.  `data` is not
+    modified.
+    """
+    return _kth(data, k, largest=False, backend=backend)
+
+
+def kth_largest(data, k, backend="auto"):
+    """k-th largest item (215's findKthLargest), same rules as kth_smallest."""
+    return _kth(data, k, largest=True, backend=backend)
+
+
+def nth_element(a: list, n, lo: int = 0, hi: int = None):
+    """
+    C++ std::nth_element on a[lo:hi], in place: afterwards a[n] is the
+    item that sorting would put there, nothing before it is larger and
+    nothing after it is smaller.  `n` may be a list of positions
+    (each one satisfies the same contract).  Returns a[n] (or a list).
+    """
+    hi = len(a) if hi is None else hi
+    single = isinstance(n, Integral)
+    positions = [int(n)] if single else [int(p) for p in n]
+    for p in positions:
+        if not lo <= p < hi:
+            raise IndexError(f"position {p} outside [{lo}, {hi})")
+    if lo == 0 and hi == len(a):
+        _select(a, sorted(set(positions)))
+    else:
+        part = a[lo:hi]
+        _select(part, sorted({p - lo for p in positions}))
+        a[lo:hi] = part
+    return a[positions[0]] if single else [a[p] for p in positions]
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def _naive_quickselect(nums, k):
+    """Solution2 without recursion: last-element pivot, Lomuto partition."""
+    nums = list(nums)
+    k = len(nums) - k
+    lo, hi = 0, len(nums) - 1
+    while True:
+        pivot, p = nums[hi], lo
+        for i in range(lo, hi):
+            if nums[i] <= pivot:
+                nums[p], nums[i] = nums[i], nums[p]
+                p += 1
+        nums[p], nums[hi] = nums[hi], nums[p]
+        if p > k:
+            hi = p - 1
+        elif p < k:
+            lo = p + 1
+        else:
+            return pivot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark order-statistic selection")
+    parser.add_argument("--n", type=int, default=10**6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--naive-limit", type=int, default=20000,
+                        help="largest n the O(n²)-prone baseline is run on")
+    args = parser.parse_args(argv)
+    n = args.n
+    rng = random.Random(args.seed)
+
+    inputs = {
+        "random": [rng.randrange(n) for _ in range(n)],
+        "sorted": list(range(n)),
+        "all equal": [7] * n,
+        "3 distinct values": [rng.randrange(3) for _ in range(n)],
+    }
+    k = n // 2
+    many = [1, n // 100, n // 10, n // 2, n - 1]
+
+    def timed(fn):
+        start = time.perf_counter()
+        result = fn()
+        return result, time.perf_counter() - start
+
+    print(f"n = {n:,}, k = {k:,}; multi-k = {len(many)} ranks")
+    header = f"{'input':<20}{'sorted()':>10}{'introselect':>13}{'multi-k':>10}"
+    if np is not None:
+        header += f"{'np.partition':>14}"
+    header += f"{'Solution2-style':>17}"
+    print(header)
+
+    for label, data in inputs.items():
+        expected, t_sort = timed(lambda: sorted(data)[n - k])
+        got, t_select = timed(lambda: kth_largest(data, k, backend="python"))
+        assert got == expected, (label, got, expected)
+        _, t_many = timed(lambda: kth_largest(data, many, backend="python"))
+        row = f"{label:<20}{t_sort:>9.3f}s{t_select:>12.3f}s{t_many:>9.3f}s"
+        if np is not None:
+            arr = np.asarray(data)
+            got, t_np = timed(lambda: kth_largest(arr, k))
+            assert got == expected
+            row += f"{t_np:>13.3f}s"
+        if n <= args.naive_limit:
+            _, t_naive = timed(lambda: _naive_quickselect(data, k))
+            row += f"{t_naive:>16.3f}s"
+        else:
+            row += f"{'skipped':>17}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
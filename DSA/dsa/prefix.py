@@ -0,0 +1,285 @@
+"""
+============================================================
+Prefix-sum index — built once, O(1) range sums, batched counts
+============================================================
+
+560 (subarraySum) and 724 (pivotIndex) rebuild running sums on every
+call.  When the array stays the same and the questions change, keep
+the prefix sums instead — one int64 per element, P[i] = sum(nums[:i]):
+
+    index = PrefixSums.build(nums)     # O(n), once
+    index.range_sum(lo, hi)            # sum(nums[lo:hi]) = P[hi] - P[lo], O(1)
+    index.range_sums(los, his)         # many ranges, one NumPy subtraction
+    index.pivot_index()                # 724: P[i] == total - P[i+1]
+    index.count_subarrays([2, 5, -3])  # 560 for many k at once
+
+    index.save("nums.psum")            # raw int64 file, atomic write
+    PrefixSums.open("nums.psum")       # mmap: O(1) startup, shared pages
+
+count_subarrays — subarrays nums[i:j] with P[j] - P[i] == k, i < j:
+    - Python: one scan over P with a running {prefix: count} dict —
+      560's Approach 2 — checking every k at each step.
+    - NumPy: P is ranked once (np.unique) and the (rank, position)
+      pairs sorted once — cached on the index (5 int64 arrays of n).
+      Each k is then two vectorized binary searches over n ascending
+      queries ("how many earlier positions hold P[j] - k?"), all in C.
+
+Values must keep every prefix sum inside int64: the pure-Python
+build raises OverflowError, NumPy's cumsum would wrap silently.
+
+Benchmark:
+
+    python -m dsa.prefix --n 1000000 --ks 100
+"""
+
+import argparse
+import mmap
+import os
+import random
+import tempfile
+import time
+from array import array
+from itertools import accumulate
+from numbers import Integral
+
+try:
+    import numpy as np
+except ImportError:  # optional — pure-Python queries otherwise
+    np = None
+
+
+def _bound(indices, n):
+    """Slice-rule clamp of an index array into [0, n], as a fresh int64 array."""
+    indices = np.array(indices, dtype=np.int64)
+    indices[indices < 0] += n
+    return np.clip(indices, 0, n, out=indices)
+
+
+class PrefixSums:
+    """Prefix sums of a fixed int array, in memory or memory-mapped."""
+
+    __slots__ = ("_view", "_np", "_ranked", "_mmap", "_file")
+
+    def __init__(self, prefix, _mmap=None, _file=None):
+        self._view = memoryview(prefix).cast("B").cast("q")
+        if len(self._view) == 0:
+            raise ValueError("prefix sums start with P[0] = 0")
+        self._np = np.frombuffer(self._view, dtype=np.int64) if np is not None else None
+        self._ranked = None
+        self._mmap = _mmap
+        self._file = _file
+
+    @classmethod
+    def build(cls, nums) -> "PrefixSums":
+        if np is not None:
+            prefix = np.zeros(len(nums) + 1, dtype=np.int64)
+            np.cumsum(np.asarray(nums, dtype=np.int64), out=prefix[1:])
+            return cls(prefix)
+        return cls(array("q", accumulate(nums, initial=0)))
+
+    @classmethod
+    def open(cls, path) -> "PrefixSums":
+        """Memory-map a file written by save()."""
+        f = open(path, "rb")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mm, mm, f)
+
+    # ---- basics -------------------------------------------------------------
+    def __len__(self):
+        """Number of elements of the original array."""
+        return len(self._view) - 1
+
+    @property
+    def total(self) -> int:
+        return self._view[-1]
+
+    def prefix(self, i: int) -> int:
+        """sum(nums[:i]); i follows slice rules."""
+        return self._view[slice(i).indices(len(self))[1]]
+
+    def range_sum(self, lo: int, hi: int) -> int:
+        """sum(nums[lo:hi]); lo / hi follow slice rules (negative = from the end).  O(1)"""
+        lo, hi, _ = slice(lo, hi).indices(len(self))
+        return self._view[hi] - self._view[lo] if lo < hi else 0
+
+    def range_sums(self, los, his):
+        """sum(nums[lo:hi]) for each pair — an int64 array with NumPy, else a list."""
+        if self._np is not None:
+            n, prefix = len(self), self._np
+            los, his = _bound(los, n), _bound(his, n)
+            np.maximum(his, los, out=his)       # lo >= hi → empty range
+            return prefix[his] - prefix[los]
+        return [self.range_sum(lo, hi) for lo, hi in zip(los, his)]
+
+    # ---- 724 ----------------------------------------------------------------
+    def pivot_indices(self):
+        """Every i with sum(nums[:i]) == sum(nums[i+1:]), ascending."""
+        total = self.total
+        if self._np is not None:
+            prefix = self._np
+            return np.flatnonzero(prefix[:-1] + prefix[1:] == total).tolist()
+        view = self._view
+        return [i for i in range(len(self)) if view[i] + view[i + 1] == total]
+
+    def pivot_index(self) -> int:
+        """Leftmost pivot index (724), or -1."""
+        total, view = self.total, self._view
+        if self._np is not None:
+            hits = self.pivot_indices()
+            return hits[0] if hits else -1
+        for i in range(len(self)):
+            if view[i] + view[i + 1] == total:
+                return i
+        return -1
+
+    # ---- 560 ----------------------------------------------------------------
+    def count_subarrays(self, k):
+        """
+        Number of non-empty subarrays summing to k (560).  `k` may be a
+        list of ks — then a list of counts comes back.  Pure Python
+        answers every k in one shared pass over P; NumPy ranks P once
+        and then runs a separate vectorized search per k.
+        """
+        single = isinstance(k, Integral)
+        ks = [int(k)] if single else [int(x) for x in k]
+        if self._np is not None:
+            counts = [self._count_numpy(target) for target in ks]
+        else:
+            counts = self._count_python(ks)
+        return counts[0] if single else counts
+
+    def _count_python(self, ks):
+        counts = [0] * len(ks)
+        seen = {}
+        get = seen.get
+        for p in self._view:
+            for i, k in enumerate(ks):
+                c = get(p - k)
+                if c:
+                    counts[i] += c
+            seen[p] = get(p, 0) + 1
+        return counts
+
+    def _count_numpy(self, k):
+        if self._ranked is None:
+            prefix = self._np
+            m = len(prefix)
+            values, rank = np.unique(prefix, return_inverse=True)
+            # (rank, position) packed into one int64 and sorted: all the
+            # positions holding one value form a contiguous sorted block
+            packed = np.sort(rank.astype(np.int64) * m + np.arange(m, dtype=np.int64))
+            ranks = packed // m
+            starts = np.searchsorted(packed, np.arange(len(values), dtype=np.int64) * m)
+            self._ranked = (values, packed, values[ranks], packed - ranks * m, starts)
+        values, packed, by_value, positions, starts = self._ranked
+        m = len(packed)
+        # Queries walk P in sorted order, so every binary search below
+        # gets ascending keys — far fewer cache misses than P's order
+        wanted = by_value - k
+        slot = np.searchsorted(values, wanted)
+        np.minimum(slot, len(values) - 1, out=slot)
+        hit = values[slot] == wanted
+        slot = slot[hit]
+        before = np.searchsorted(packed, slot * m + positions[hit]) - starts[slot]
+        return int(before.sum())
+
+    # ---- persistence ------------------------------------------------------------
+    def save(self, path) -> None:
+        """Raw int64 prefix sums via temp file + os.replace."""
+        path = os.fspath(path)
+        fd, tmp = tempfile.mkstemp(prefix=".prefix-",
+                                   dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._view)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def close(self) -> None:
+        """
+        Release the buffer (and the mapping).  Every query result is a
+        copy, so none of them pin it; an array still viewing the buffer
+        itself (e.g. taken from `_np`) makes this raise BufferError —
+        drop it first.
+        """
+        self._np = self._ranked = None
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the prefix-sum index")
+    parser.add_argument("--n", type=int, default=10**6)
+    parser.add_argument("--ks", type=int, default=100, help="distinct k to count")
+    parser.add_argument("--ranges", type=int, default=10**6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    n = args.n
+    rng = random.Random(args.seed)
+
+    from dsa.registry import problem
+    subarray = problem(560).Solution()
+    pivot = problem(724).Solution()
+
+    nums = [rng.randint(-10, 10) for _ in range(n)]
+    ks = [rng.randint(-50, 50) for _ in range(args.ks)]
+    los = [rng.randrange(n + 1) for _ in range(args.ranges)]
+    his = [rng.randint(lo, n) for lo in los]
+
+    def timed(label, fn, per=None):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        rate = f"  {elapsed / per * 1e6:10.3f} µs each" if per else ""
+        print(f"{label:<44}{elapsed:9.3f}s{rate}")
+        return result
+
+    print(f"n = {n:,}, {len(ks)} values of k, {len(los):,} ranges "
+          f"({'numpy' if np is not None else 'pure Python'})")
+    index = timed("PrefixSums.build", lambda: PrefixSums.build(nums))
+
+    sample = ks[:5]
+    expected = timed(f"560 Solution.subarraySum x {len(sample)} k",
+                     lambda: [subarray.subarraySum(nums, k) for k in sample], len(sample))
+    counts = timed(f"count_subarrays({len(ks)} ks)",
+                   lambda: index.count_subarrays(ks), len(ks))
+    assert counts[:len(sample)] == expected
+
+    sums = timed("range_sums (batch)", lambda: index.range_sums(los, his), len(los))
+    timed("range_sum one by one", lambda: [index.range_sum(lo, hi) for lo, hi in zip(los, his)],
+          len(los))
+    assert all(int(sums[i]) == sum(nums[los[i]:his[i]]) for i in range(100))
+
+    expected = timed("724 Solution.pivotIndex", lambda: pivot.pivotIndex(nums))
+    assert timed("pivot_index", index.pivot_index) == expected
+
+    workdir = tempfile.mkdtemp(prefix="prefix-bench-")
+    path = os.path.join(workdir, "nums.psum")
+    try:
+        timed("save", lambda: index.save(path))
+        with timed("open (mmap)", lambda: PrefixSums.open(path)) as mapped:
+            assert mapped.total == index.total
+            timed("range_sums on the mmap", lambda: mapped.range_sums(los, his), len(los))
+    finally:
+        os.remove(path)
+        os.rmdir(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+============================================================
+Linear recurrences in O(log n) — matrix power + fast doubling
+============================================================
+
+509 (Fibonacci), 1137 (Tribonacci) and 70 (Climbing Stairs) are all
+
+    a(n) = c1·a(n-1) + c2·a(n-2) + ... + cd·a(n-d)
+
+solved by O(n) loops.  Any such recurrence is one matrix power:
+
+    [a(n+d-1) ... a(n)]ᵀ = M^n · [a(d-1) ... a(0)]ᵀ
+
+    M = | c1 c2 ... cd |      (companion matrix, d x d)
+        | 1  0  ... 0  |
+        | 0  1  ... 0  |
+        | ...          |
+
+    LinearRecurrence([1, 1, 1], [0, 1, 1], mod=10**9 + 7)[10**18]
+
+- M^(2^k) is squared once and CACHED on the object, so a query costs
+  only ~log2(n) vector × matrix products, O(d²) each, and later
+  queries, of any n, reuse the same powers.
+- terms(ns) answers a batch with the shared cache.
+- With `mod`, every product is reduced → numbers stay small and
+  n = 10^18 is ~60 steps.  Without it, results are exact big ints
+  (their size grows linearly with n, so keep n moderate).
+
+Fibonacci has a faster special case, fast doubling (no matrices):
+
+    F(2k)   = F(k) · (2·F(k+1) − F(k))
+    F(2k+1) = F(k)² + F(k+1)²
+
+Benchmark (n up to 10^18 mod p):
+
+    python -m dsa.recurrence
+"""
+
+import argparse
+import random
+import time
+
+MOD = 10**9 + 7
+
+
+def fibonacci(n: int, mod: int = None) -> int:
+    """F(n) by fast doubling, walking the bits of n from the top.  O(log n)"""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    a, b = 0, 1                         # F(k), F(k+1) for k = prefix of n
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)             # F(2k)
+        d = a * a + b * b               # F(2k+1)
+        if mod is not None:
+            c %= mod
+            d %= mod
+        if bit == "1":
+            a, b = d, c + d
+            if mod is not None:
+                b %= mod
+        else:
+            a, b = c, d
+    return a
+
+
+class LinearRecurrence:
+    """a(n) = sum(coeffs[i] * a(n-1-i)), seeded with initial = [a(0), ...]."""
+
+    __slots__ = ("coeffs", "initial", "mod", "_powers")
+
+    def __init__(self, coeffs, initial, mod: int = None):
+        if len(coeffs) != len(initial) or not coeffs:
+            raise ValueError("need one initial term per coefficient")
+        self.coeffs = list(coeffs)
+        self.initial = list(initial)
+        self.mod = mod
+        d = len(coeffs)
+        companion = [self.coeffs] + [
+            [1 if col == row else 0 for col in range(d)] for row in range(d - 1)
+        ]
+        self._powers = [self._reduce(companion)]     # M^(2^k) for k = 0, 1, ...
+
+    @property
+    def order(self) -> int:
+        return len(self.coeffs)
+
+    def _reduce(self, matrix):
+        if self.mod is None:
+            return matrix
+        mod = self.mod
+        return [[x % mod for x in row] for row in matrix]
+
+    def _power(self, k):
+        """M^(2^k), squaring (and caching) on demand."""
+        powers = self._powers
+        while len(powers) <= k:
+            last = powers[-1]
+            cols = list(zip(*last))
+            square = [[sum(x * y for x, y in zip(row, col)) for col in cols]
+                      for row in last]
+            powers.append(self._reduce(square))
+        return powers[k]
+
+    def __getitem__(self, n: int) -> int:
+        return self.term(n)
+
+    def term(self, n: int) -> int:
+        """a(n).  O(d² log n) with the cache warm, O(d³ log n) to warm it."""
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        d = self.order
+        if n < d:
+            value = self.initial[n]
+            return value % self.mod if self.mod is not None else value
+        # state = [a(m+d-1), ..., a(m)]; start at m = 0, jump m by 2^k
+        state = self.initial[::-1]
+        steps, k, mod = n, 0, self.mod
+        while steps:
+            if steps & 1:
+                state = [sum(x * y for x, y in zip(row, state))
+                         for row in self._power(k)]
+                if mod is not None:
+                    state = [x % mod for x in state]
+            steps >>= 1
+            k += 1
+        return state[-1]            # a(n)
+
+    def terms(self, ns) -> list:
+        """a(n) for every n in ns (same order), sharing the cached powers."""
+        ns = list(ns)
+        if ns:
+            self._power(max(max(ns), 1).bit_length() - 1)   # warm once
+        return [self.term(n) for n in ns]
+
+
+def fibonacci_recurrence(mod: int = None) -> LinearRecurrence:
+    return LinearRecurrence([1, 1], [0, 1], mod)
+
+
+def tribonacci_recurrence(mod: int = None) -> LinearRecurrence:
+    return LinearRecurrence([1, 1, 1], [0, 1, 1], mod)
+
+
+def stairs_recurrence(mod: int = None) -> LinearRecurrence:
+    """ways(n) = ways(n-1) + ways(n-2), ways(0) = ways(1) = 1 (= F(n+1))."""
+    return LinearRecurrence([1, 1], [1, 1], mod)
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def _linear_loop(n, mod):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, (a + b) % mod
+    return a
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark O(log n) linear recurrences")
+    parser.add_argument("--mod", type=int, default=MOD)
+    parser.add_argument("--batch", type=int, default=10**4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    mod = args.mod
+    rng = random.Random(args.seed)
+
+    def timed(fn, repeat=1):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = fn()
+        return result, (time.perf_counter() - start) / repeat
+
+    print(f"mod = {mod}")
+    print(f"{'n':>8}  {'O(n) loop':>12}{'fast doubling':>15}"
+          f"{'matrix fib':>13}{'matrix trib':>13}")
+    fib_rec, trib_rec = fibonacci_recurrence(mod), tribonacci_recurrence(mod)
+    for exp in (3, 6, 9, 12, 18):
+        n = 10**exp
+        if exp <= 6:
+            expected, t_loop = timed(lambda: _linear_loop(n, mod))
+            loop = f"{t_loop * 1e6:10.1f}µs"
+        else:
+            expected, loop = None, f"{'—':>12}"
+        value, t_fast = timed(lambda: fibonacci(n, mod), 100)
+        matrix, t_matrix = timed(lambda: fib_rec[n], 100)
+        _, t_trib = timed(lambda: trib_rec[n], 100)
+        assert value == matrix and expected in (None, value)
+        print(f"  10^{exp:<4}  {loop}{t_fast * 1e6:13.1f}µs"
+              f"{t_matrix * 1e6:11.1f}µs{t_trib * 1e6:11.1f}µs")
+
+    ns = [rng.randrange(10**18) for _ in range(args.batch)]
+    _, t_batch = timed(lambda: trib_rec.terms(ns))
+    _, t_cold = timed(lambda: [tribonacci_recurrence(mod)[n] for n in ns[:100]])
+    print(f"\nbatch of {len(ns):,} tribonacci terms, n < 10^18: "
+          f"{t_batch:.3f}s ({t_batch / len(ns) * 1e6:.1f}µs each, powers cached)")
+    print(f"uncached (fresh recurrence per n):            "
+          f"{t_cold / 100 * 1e6:.1f}µs each")
+
+
+if __name__ == "__main__":
+    main()
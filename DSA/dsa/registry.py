@@ -0,0 +1,160 @@
+"""
+Problem registry — problem ID / slug → lazily loaded module.
+
+Building the registry only lists file NAMES; no problem file is
+executed until one of its attributes is actually used:
+
+    from dsa import registry
+    sq = registry.problem(279)      # Problem proxy, nothing imported yet
+    sq.SolutionV5().numSquares(12)  # first attribute access → load once
+    sq.SolutionV3                   # cached, no re-import
+
+IDs come from the LeetCode number in the file name; slugs from the rest
+of it with difficulty markers (E/M/H) stripped:
+
+    H-295-find-median-from-data-stream.py → 295, find_median_from_data_stream
+    ninja_trainings.py                    → None, ninja_trainings
+
+Two files share ID 42 (permutations + trapping rain water), so
+`problem(42)` asks you to use the slug instead.
+"""
+
+import re
+from pathlib import Path
+
+from dsa.loader import load_path, problem_files, resolve
+
+# Optional "E-"/"M-"/"H-" prefix, the number, optional difficulty marker
+_NAME = re.compile(r"^(?:[EMH][-_](?=\d))?(\d+)[-_](?:[EMH][-_])?(.*)$")
+
+
+class Problem:
+    """
+    Lazy handle on one problem file.
+
+    Attribute access falls through to the module, which is loaded on
+    first use and then cached (see dsa.loader.load_path).
+    """
+
+    __slots__ = ("id", "slug", "category", "path", "_module")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.category = path.parent.name
+        match = _NAME.match(path.stem)
+        if match:
+            self.id = int(match.group(1))
+            rest = match.group(2)
+        else:
+            self.id = None
+            rest = path.stem
+        self.slug = rest.replace("-", "_").lower()
+        self._module = None
+
+    @property
+    def module(self):
+        if self._module is None:
+            self._module = load_path(self.path)
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def classes(self) -> dict:
+        """Classes defined in the file itself (skips ListNode imports etc.)."""
+        module = self.module
+        return {
+            name: obj for name, obj in vars(module).items()
+            if isinstance(obj, type) and obj.__module__ == module.__name__
+        }
+
+    def __getattr__(self, name):
+        # Only reached for names that aren't slots → delegate to the module
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.module, name)
+
+    def __dir__(self):
+        names = {"id", "slug", "category", "path", "module", "loaded", "classes"}
+        if self.loaded:
+            names.update(dir(self._module))
+        return sorted(names)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "lazy"
+        return f"<Problem {self.id} {self.category}/{self.slug} ({state})>"
+
+
+# Built on first use — importing `dsa` doesn't even glob the tree
+_by_slug = None
+_by_id = None
+
+
+def _build():
+    global _by_slug, _by_id
+    if _by_slug is not None:
+        return
+    by_slug, by_id = {}, {}
+    for path in problem_files():
+        problem = Problem(path)
+        by_slug[problem.slug] = problem
+        by_id.setdefault(problem.id, []).append(problem)
+    _by_slug, _by_id = by_slug, by_id
+
+
+def problems() -> list:
+    """Every registered problem, sorted by (category, id)."""
+    _build()
+    return sorted(_by_slug.values(),
+                  key=lambda p: (p.category, p.id if p.id is not None else -1))
+
+
+def slugs() -> list:
+    _build()
+    return sorted(_by_slug)
+
+
+def problem(key) -> Problem:
+    """
+    Look up a problem by LeetCode number, slug, or file path.
+
+        problem(279)
+        problem("perfect_squares")
+        problem("DP/279_perfect_squares.py")
+    """
+    _build()
+    if isinstance(key, int) or (isinstance(key, str) and key.isdigit()):
+        matches = _by_id.get(int(key), [])
+        if len(matches) == 1:
+            return matches[0]
+        if not matches:
+            raise LookupError(f"no problem with id {key}")
+        options = ", ".join(p.slug for p in matches)
+        raise LookupError(f"id {key} is ambiguous, use a slug: {options}")
+
+    if key in _by_slug:
+        return _by_slug[key]
+
+    path = resolve(key)
+    for p in _by_slug.values():
+        if p.path == path:
+            return p
+    raise LookupError(f"unknown problem {key!r}")
+
+
+def solution(key, name=None):
+    """
+    Return a class from a problem file.  Without `name`, returns the
+    single Solution-like class, or raises if there is more than one.
+    """
+    p = problem(key)
+    if name is not None:
+        return getattr(p.module, name)
+    classes = {n: c for n, c in p.classes().items() if n.startswith("Solution")}
+    if len(classes) == 1:
+        return next(iter(classes.values()))
+    raise LookupError(
+        f"{p.slug} has {len(classes)} Solution classes, pick one: "
+        + ", ".join(sorted(classes))
+    )
@@ -0,0 +1,276 @@
+"""
+============================================================
+House robber — linear, circular, tree and interval variants
+============================================================
+
+198 loops over a list; 213 runs that loop twice on nums[:-1] and
+nums[1:], copying the input each time (8 bytes of pointers per house,
+~76 MiB for 10^7 houses).  Here every solver reads its input in place:
+
+    rob(houses, lo=0, hi=None)      198 on houses[lo:hi] — index range,
+                                    no slice is ever materialized
+    rob_circular(houses)            213 in ONE pass: both scenarios
+                                    ("skip the first", "skip the last")
+                                    advance together over the same items
+    rob_choice(houses)              198 + which houses to rob
+    rob_tree(root)                  337 (binary tree, iterative postorder)
+    max_weight_intervals(s, e, w)   weighted interval scheduling — 198 is
+                                    the case "house i = interval [i, i+2)"
+    rob_batch(matrix, circular)     many streets at once, NumPy across rows
+
+`houses` may be a list, an array.array, a NumPy array or any other
+buffer; lo / hi follow slice rules (negative = from the end).  Buffers are read through a memoryview (slicing one is free);
+lists through itertools.islice.  Either way the extra memory is O(1).
+
+Benchmark (time + peak allocation on 10^7 houses):
+
+    python -m dsa.robber --n 10000000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_right
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # optional — only rob_batch needs it
+    np = None
+
+
+def _items(houses, lo, hi):
+    """Iterate houses[lo:hi] without copying."""
+    try:
+        view = memoryview(houses)
+    except TypeError:
+        return islice(houses, lo, hi)
+    if view.ndim != 1:
+        raise ValueError("houses must be one-dimensional")
+    return iter(view[lo:hi])
+
+
+def _bounds(houses, lo, hi):
+    """Slice semantics: negative bounds count from the end, both clamped."""
+    lo, hi, _ = slice(lo, hi).indices(len(houses))
+    return lo, max(lo, hi)
+
+
+# ============================================================
+# LINEAR + CIRCULAR
+# ============================================================
+
+def rob(houses, lo: int = 0, hi: int = None):
+    """198 on houses[lo:hi].  O(hi - lo) time, O(1) extra space."""
+    lo, hi = _bounds(houses, lo, hi)
+    skip, take = 0, 0                 # best ending before / at the last house
+    for money in _items(houses, lo, hi):
+        skip, take = (skip if skip > take else take), skip + money
+    return max(skip, take)
+
+
+def rob_circular(houses, lo: int = 0, hi: int = None):
+    """
+    213 on houses[lo:hi] in one pass.  Scenario A never robs the first
+    house, scenario B never the last; both advance on every middle
+    house, so each item is read exactly once.
+    """
+    lo, hi = _bounds(houses, lo, hi)
+    n = hi - lo
+    if n <= 0:
+        return 0
+    items = _items(houses, lo, hi)
+    first = next(items)
+    if n == 1:
+        return first
+    a_skip, a_take = 0, 0             # houses lo+1 .. hi-1
+    b_skip, b_take = 0, first         # houses lo   .. hi-2
+    for money in islice(items, n - 2):
+        # Conditional expressions: no builtin max() call per house
+        a_skip, a_take = (a_skip if a_skip > a_take else a_take), a_skip + money
+        b_skip, b_take = (b_skip if b_skip > b_take else b_take), b_skip + money
+    last = next(items)
+    a_skip, a_take = max(a_skip, a_take), a_skip + last
+    return max(a_skip, a_take, b_skip, b_take)
+
+
+def rob_choice(houses, lo: int = 0, hi: int = None):
+    """(total, [indices robbed]) for houses[lo:hi].  O(n) bits of decisions."""
+    lo, hi = _bounds(houses, lo, hi)
+    took = bytearray(max(hi - lo, 0))   # took[i]: "take" beat "skip" at i
+    skip, take = 0, 0
+    for i, money in enumerate(_items(houses, lo, hi)):
+        best_before = max(skip, take)
+        take = skip + money
+        skip = best_before
+        took[i] = take > skip
+    # Walk back: rob i whenever taking it was the better choice at i
+    chosen, i, total = [], len(took) - 1, max(skip, take)
+    while i >= 0:
+        if took[i]:
+            chosen.append(lo + i)
+            i -= 2
+        else:
+            i -= 1
+    chosen.reverse()
+    return total, chosen
+
+
+# ============================================================
+# TREE (337) AND WEIGHTED INTERVALS
+# ============================================================
+
+def rob_tree(root):
+    """
+    337: houses on a binary tree (nodes with .val / .left / .right),
+    parent and child never both robbed.  Iterative postorder — any depth.
+    """
+    if root is None:
+        return 0
+    best = {None: (0, 0)}             # node → (skip it, take it)
+    stack = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            ls, lt = best[node.left]
+            rs, rt = best[node.right]
+            best[node] = (max(ls, lt) + max(rs, rt), node.val + ls + rs)
+            continue
+        stack.append((node, True))
+        if node.right is not None:
+            stack.append((node.right, False))
+        if node.left is not None:
+            stack.append((node.left, False))
+    return max(best[root])
+
+
+def max_weight_intervals(starts, ends, weights):
+    """
+    Non-overlapping intervals [start, end) of maximum total weight.
+    Returns (total, [chosen indices, by end]).  O(n log n).
+    """
+    order = sorted(range(len(starts)), key=ends.__getitem__)
+    sorted_ends = [ends[i] for i in order]
+    best = [0] * (len(order) + 1)     # best[j]: among the first j by end
+    prev = array("q", bytes(8 * len(order)))
+    for j, i in enumerate(order):
+        p = bisect_right(sorted_ends, starts[i], 0, j)   # compatible prefix
+        prev[j] = p
+        best[j + 1] = max(best[j], best[p] + weights[i])
+    chosen, j = [], len(order)
+    while j > 0:
+        if best[j] != best[j - 1]:
+            chosen.append(order[j - 1])
+            j = prev[j - 1]
+        else:
+            j -= 1
+    chosen.reverse()
+    return best[-1], chosen
+
+
+# ============================================================
+# BATCH (NumPy)
+# ============================================================
+
+def rob_batch(streets, circular: bool = False):
+    """
+    One answer per row of a (streets, houses) matrix.  Rows of different
+    lengths may be zero-padded on the right for circular=False (an empty
+    house changes nothing); circular rows must be full length.  Bool and
+    integer input is summed as int64 (int8 totals would wrap); floats
+    keep their dtype.
+    """
+    if np is None:
+        raise ImportError("rob_batch needs numpy installed")
+    streets = np.asarray(streets)
+    if streets.ndim != 2:
+        raise ValueError("expected a (streets, houses) matrix")
+    if streets.dtype.kind in "bi" or (streets.dtype.kind == "u"
+                                      and streets.itemsize < 8):
+        streets = streets.astype(np.int64, copy=False)
+    rows, n = streets.shape
+    if n == 0:
+        return np.zeros(rows, dtype=streets.dtype)
+
+    zeros = np.zeros(rows, dtype=streets.dtype)
+    if not circular or n == 1:
+        skip, take = zeros, zeros
+        for i in range(n):
+            skip, take = np.maximum(skip, take), skip + streets[:, i]
+        return np.maximum(skip, take)
+    # Same single pass as rob_circular, one column at a time
+    a_skip, a_take = zeros, zeros
+    b_skip, b_take = zeros, streets[:, 0]
+    for i in range(1, n - 1):
+        money = streets[:, i]
+        a_skip, a_take = np.maximum(a_skip, a_take), a_skip + money
+        b_skip, b_take = np.maximum(b_skip, b_take), b_skip + money
+    a_skip, a_take = np.maximum(a_skip, a_take), a_skip + streets[:, -1]
+    return np.maximum(np.maximum(a_skip, a_take), np.maximum(b_skip, b_take))
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def _measure(fn, label, with_memory):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = None
+    if with_memory:
+        # Separate run: tracemalloc slows Python-level loops down a lot
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    memory = f"{peak / 2**20:10.1f} MiB" if peak is not None else f"{'-':>14}"
+    print(f"{label:<40}{elapsed:8.2f}s{memory}")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the house-robber solvers")
+    parser.add_argument("--n", type=int, default=10**7)
+    parser.add_argument("--streets", type=int, default=10**4,
+                        help="rows for the batched run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the (slow) tracemalloc runs")
+    args = parser.parse_args(argv)
+    rng = random.Random(args.seed)
+    with_memory = not args.no_memory
+
+    from dsa.registry import problem
+    solution_213 = problem("house_robber_ii").Solution()
+
+    houses = [rng.randrange(400) for _ in range(args.n)]
+    buffer = array("q", houses)
+    print(f"n = {args.n:,} houses; peak = extra memory while solving")
+    print(f"{'':<40}{'time':>9}{'peak':>14}")
+    expected = _measure(lambda: solution_213.rob(houses),
+                        "213 Solution (two slice copies)", with_memory)
+    results = [
+        _measure(lambda: rob_circular(houses), "rob_circular(list)", with_memory),
+        _measure(lambda: rob_circular(buffer), "rob_circular(array('q'))", with_memory),
+    ]
+    if np is not None:
+        arr = np.frombuffer(buffer, dtype=np.int64)
+        results.append(_measure(lambda: rob_circular(arr), "rob_circular(ndarray)", with_memory))
+    assert all(r == expected for r in results), (expected, results)
+    _measure(lambda: rob(houses), "rob(list) (198)", with_memory)
+
+    if np is not None:
+        width = max(1, min(args.n // args.streets, 1000))
+        matrix = np.frombuffer(buffer, dtype=np.int64)[:args.streets * width]
+        matrix = matrix.reshape(-1, width)
+        batch = _measure(lambda: rob_batch(matrix, circular=True),
+                         f"rob_batch({matrix.shape[0]:,} x {width}, circular)", False)
+        sample = range(min(len(matrix), 200))
+        assert all(batch[r] == rob_circular(matrix[r]) for r in sample)
+
+
+if __name__ == "__main__":
+    main()
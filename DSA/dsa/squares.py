@@ -0,0 +1,260 @@
+"""
+============================================================
+Perfect-squares answer table — 279 for millions of n at once
+============================================================
+
+DP/279_perfect_squares.py solves one n per call (V3: O(n·√n) DP).  For
+bulk workloads this module precomputes numSquares(n) for every
+n ≤ N into one byte per n, with no DP at all — the answer is pinned
+down by number theory:
+
+    0  n == 0
+    1  n is a perfect square
+    4  n = 4^a · (8b + 7)             Legendre's three-square theorem
+    2  n = i² + j²                    (n not of the form above)
+    3  everything else                Lagrange: never more than 4
+
+Building the table is slice assignments: every 4 lies on arithmetic
+progressions (7·4^a :: 8·4^a), the 2s are the ~π·N/8 pairs i ≤ j
+(vectorized per i with NumPy), 1s are the squares.  N = 10^8 takes
+seconds with NumPy and needs 100 MB — one byte per answer.
+
+    table = SquaresTable.open("squares.tbl", limit=10**8)
+        # first run: build + save atomically; afterwards: mmap the file,
+        # O(1) startup, pages loaded on first touch, shared by processes
+    table[12]                       # 3
+    table.query(ns)                 # bulk: NumPy fancy indexing
+    num_squares(10**15)             # beyond the table: O(√n) math
+
+Benchmark:
+
+    python -m dsa.squares --limit 10000000 --queries 1000000
+"""
+
+import argparse
+import math
+import mmap
+import os
+import random
+import tempfile
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # optional — pure-Python build and query otherwise
+    np = None
+
+
+def num_squares(n: int) -> int:
+    """Least number of perfect squares summing to n.  O(√n), any size of n."""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if n == 0:
+        return 0
+    root = math.isqrt(n)
+    if root * root == n:
+        return 1
+    m = n
+    while m % 4 == 0:
+        m //= 4
+    if m % 8 == 7:
+        return 4
+    i = 1
+    while 2 * i * i <= n:
+        rest = n - i * i
+        r = math.isqrt(rest)
+        if r * r == rest:
+            return 2
+        i += 1
+    return 3
+
+
+def build_table(limit: int) -> array:
+    """array('b') with table[n] = num_squares(n) for 0 <= n <= limit."""
+    if np is not None:
+        return array("b", _build_numpy(limit).tobytes())
+    return _build_python(limit)
+
+
+def _build_numpy(limit):
+    table = np.full(limit + 1, 3, dtype=np.int8)
+    step = 1
+    while 7 * step <= limit:
+        table[7 * step::8 * step] = 4
+        step *= 4
+    root = math.isqrt(limit)
+    for i in range(1, root + 1):
+        top = math.isqrt(limit - i * i)
+        if top < i:
+            break
+        j = np.arange(i, top + 1, dtype=np.int64)
+        table[i * i + j * j] = 2
+    table[np.arange(1, root + 1, dtype=np.int64) ** 2] = 1
+    table[0] = 0
+    return table
+
+
+def _build_python(limit):
+    table = array("b", [3]) * (limit + 1)
+    step = 1
+    while 7 * step <= limit:
+        cells = range(7 * step, limit + 1, 8 * step)
+        table[cells.start::cells.step] = array("b", [4]) * len(cells)
+        step *= 4
+    root = math.isqrt(limit)
+    for i in range(1, root + 1):
+        ii = i * i
+        for j in range(i, math.isqrt(limit - ii) + 1):
+            table[ii + j * j] = 2
+    for i in range(1, root + 1):
+        table[i * i] = 1
+    table[0] = 0
+    return table
+
+
+class SquaresTable:
+    """Read-only answer table, in memory or memory-mapped from disk."""
+
+    __slots__ = ("_view", "_mmap", "_file")
+
+    def __init__(self, values, _mmap=None, _file=None):
+        self._view = memoryview(values).cast("b")
+        self._mmap = _mmap
+        self._file = _file
+
+    @classmethod
+    def build(cls, limit: int) -> "SquaresTable":
+        return cls(build_table(limit))
+
+    @classmethod
+    def open(cls, path, limit: int = None) -> "SquaresTable":
+        """
+        Memory-map a saved table.  If the file is missing or covers less
+        than `limit`, build one first and save it (atomically).
+        """
+        path = os.fspath(path)
+        if limit is not None:
+            have = os.path.getsize(path) - 1 if os.path.exists(path) else -1
+            if have < limit:
+                cls.build(limit).save(path)
+        f = open(path, "rb")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mm, mm, f)
+
+    @property
+    def limit(self) -> int:
+        return len(self._view) - 1
+
+    def __len__(self):
+        return len(self._view)
+
+    def __getitem__(self, n: int) -> int:
+        if 0 <= n < len(self._view):
+            return self._view[n]
+        return num_squares(n)
+
+    def query(self, ns):
+        """
+        Answers for many n at once.  With NumPy: one fancy-indexing pass
+        in C (returns an int8 array); values beyond the table fall back
+        to num_squares.  Without NumPy: a list.
+        """
+        view = self._view
+        if np is None:
+            size = len(view)
+            return [view[n] if 0 <= n < size else num_squares(n) for n in ns]
+        ns = np.asarray(ns, dtype=np.int64)
+        if len(ns) and ns.min() < 0:
+            raise ValueError("n must be non-negative")
+        table = np.frombuffer(view, dtype=np.int8)
+        inside = ns <= self.limit
+        if inside.all():
+            return table[ns]
+        out = np.empty(len(ns), dtype=np.int8)
+        out[inside] = table[ns[inside]]
+        out[~inside] = [num_squares(int(n)) for n in ns[~inside]]
+        return out
+
+    def save(self, path) -> None:
+        """Raw bytes (index = n) via temp file + os.replace."""
+        path = os.fspath(path)
+        fd, tmp = tempfile.mkstemp(prefix=".squares-",
+                                   dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._view)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the perfect-squares table")
+    parser.add_argument("--limit", type=int, default=10**7)
+    parser.add_argument("--queries", type=int, default=10**6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    limit = args.limit
+
+    from dsa.registry import problem
+    sq = problem("perfect_squares")
+
+    rng = random.Random(args.seed)
+    ns = [rng.randint(1, limit) for _ in range(args.queries)]
+    workdir = tempfile.mkdtemp(prefix="squares-bench-")
+    path = os.path.join(workdir, "squares.tbl")
+
+    def timed(label, fn, count=None):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        rate = f"  {elapsed / count * 1e6:9.3f} µs/n" if count else ""
+        print(f"{label:<36}{elapsed:9.3f}s{rate}")
+        return result
+
+    try:
+        print(f"N = {limit:,}, {len(ns):,} random queries "
+              f"({'numpy' if np is not None else 'pure Python'} build)")
+        timed("build + save (first run)",
+              lambda: SquaresTable.open(path, limit).close())
+        table = timed("open again (mmap)", lambda: SquaresTable.open(path, limit))
+        bulk = timed("table.query (bulk)", lambda: table.query(ns), len(ns))
+        single = timed("table[n] one by one",
+                       lambda: [table[n] for n in ns], len(ns))
+        sample = ns[:10**4]
+        timed("num_squares(n) (math, 10^4 of them)",
+              lambda: [num_squares(n) for n in sample], len(sample))
+        shared = sq.SolutionV6()
+        timed("SolutionV6 shared DP (10^3, small n)",
+              lambda: [shared.numSquares(n % 10**4) for n in ns[:10**3]], 10**3)
+        assert list(bulk) == single
+        assert single[:len(sample)] == [num_squares(n) for n in sample]
+        table.close()
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+        os.rmdir(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+============================================================
+Stock trading — one state machine for k trades, cooldown, fee
+============================================================
+
+121 (one trade), 122 (unlimited) and 714 (unlimited + fee) are the same
+DP with different knobs.  Per day, per transaction layer j = 1..k:
+
+    hold[j] = max(hold[j], free[j-1] (as of cooldown+1 days ago) - price)
+    free[j] = max(free[j], hold[j] (yesterday) + price - fee)
+
+    free[j] = best profit holding nothing, ≤ j trades opened so far
+    hold[j] = best profit holding the j-th position
+
+    k=1                       121
+    k=None (unlimited)        122 — layers collapse to one, j-1 → j
+    k=None, fee=f             714
+    k=None, cooldown=1        309 (not in this repo)
+
+    max_profit(prices, k=2, cooldown=1, fee=0.5)        # -> profit
+    best_trades(prices, k=2)          # -> (profit, [(buy_day, sell_day), ...])
+
+Trade indices: every step records two bits per layer — "bought today"
+and "sold today" — and a backward walk replays the choices (O(n·k)
+bytes).  Ties keep the no-trade branch, so no zero-profit round trips.
+
+Backtesting many tickers: backtest(matrix, ...) runs the same recurrence
+over a (tickers, days) NumPy matrix — one Python step per day, each a
+few array ops over (k, tickers) — and reconstructs every ticker's trades
+with the same vectorized backward walk.  O(days · k · tickers).
+
+Benchmark:
+
+    python -m dsa.stocks --tickers 10000 --days 252 --k 2
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # optional — backtest() needs it, the scalar API does not
+    np = None
+
+NEG = float("-inf")
+
+
+def _layers(k, n):
+    """(number of layers, unlimited?) — k ≥ n/2 trades is no limit at all."""
+    if k is None or 2 * k >= n:
+        return 1, True
+    if k < 0:
+        raise ValueError("k must be non-negative")
+    return k, False
+
+
+# ============================================================
+# ONE SERIES
+# ============================================================
+
+def _run(prices, k, cooldown, fee, record):
+    n = len(prices)
+    layers, unlimited = _layers(k, n)
+    if n == 0 or layers == 0:
+        return 0, None, None, layers, unlimited
+    hold = [NEG] * layers
+    free = [0] * (layers + 1)                  # free[0]: no trade yet, always 0
+    past = deque([free[:]] * (cooldown + 1), maxlen=cooldown + 1)
+    bought = [bytearray(layers) for _ in range(n)] if record else None
+    sold = [bytearray(layers) for _ in range(n)] if record else None
+    for i, price in enumerate(prices):
+        source = past[0]                       # free, cooldown + 1 days ago
+        new_free = free[:]
+        for j in range(layers):
+            base = source[j + 1] if unlimited else source[j]
+            sell = hold[j] + price - fee
+            if sell > free[j + 1]:
+                new_free[j + 1] = sell
+                if record:
+                    sold[i][j] = 1
+            buy = base - price
+            if buy > hold[j]:
+                hold[j] = buy
+                if record:
+                    bought[i][j] = 1
+        free = new_free
+        past.append(free)
+    return free[layers], bought, sold, layers, unlimited
+
+
+def max_profit(prices, k=None, cooldown=0, fee=0):
+    """Best profit with at most k trades (None: unlimited).  O(n·k) time, O(k + cooldown) space."""
+    return _run(prices, k, cooldown, fee, record=False)[0]
+
+
+def best_trades(prices, k=None, cooldown=0, fee=0):
+    """(profit, [(buy_day, sell_day), ...]) — the trades that earn it, in order."""
+    profit, bought, sold, layers, unlimited = _run(prices, k, cooldown, fee, record=True)
+    trades = []
+    if bought is None:
+        return profit, trades
+    i, j, holding, sell_day = len(prices) - 1, layers - 1, False, None
+    while i >= 0:
+        if holding and bought[i][j]:
+            trades.append((i, sell_day))
+            holding = False
+            if not unlimited:
+                j -= 1
+                if j < 0:
+                    break
+            i -= cooldown + 1
+            continue
+        if not holding and sold[i][j]:
+            sell_day, holding = i, True
+        i -= 1
+    trades.reverse()
+    return profit, trades
+
+
+# ============================================================
+# MANY SERIES (NumPy)
+# ============================================================
+
+def backtest(prices, k=None, cooldown=0, fee=0, trades=True):
+    """
+    Vectorized over a (tickers, days) price matrix.
+
+    Returns profits (one per ticker) — or, with trades=True,
+    (profits, buys, sells) where buys/sells are (tickers, days) bool
+    masks of the trade days; trades_of(buys[t], sells[t]) pairs them up.
+    """
+    if np is None:
+        raise ImportError("backtest() needs numpy installed")
+    prices = np.asarray(prices)
+    if prices.ndim != 2:
+        raise ValueError("expected a (tickers, days) matrix")
+    tickers, n = prices.shape
+    layers, unlimited = _layers(k, n)
+    dtype = np.result_type(prices, fee)
+    if np.issubdtype(dtype, np.integer):
+        dtype, neg = np.int64, np.iinfo(np.int64).min // 4
+    else:
+        dtype, neg = np.float64, -np.inf
+    prices = prices.astype(dtype, copy=False)
+
+    hold = np.full((layers, tickers), neg, dtype=dtype)
+    free = np.zeros((layers + 1, tickers), dtype=dtype)
+    past = deque([free] * (cooldown + 1), maxlen=cooldown + 1)
+    if trades and layers:
+        bought = np.zeros((n, layers, tickers), dtype=bool)
+        sold = np.zeros((n, layers, tickers), dtype=bool)
+    for i in range(n if layers else 0):
+        price = prices[:, i]
+        source = past[0][1:] if unlimited else past[0][:-1]
+        sell = hold + (price - fee)
+        buy = source - price
+        sell_now = sell > free[1:]
+        buy_now = buy > hold
+        free = free.copy()
+        np.maximum(free[1:], sell, out=free[1:])
+        np.maximum(hold, buy, out=hold)
+        past.append(free)
+        if trades:
+            sold[i] = sell_now
+            bought[i] = buy_now
+    profits = free[layers]
+    if not trades:
+        return profits
+
+    buys = np.zeros((tickers, n), dtype=bool)
+    sells = np.zeros((tickers, n), dtype=bool)
+    if not layers or not n:
+        return profits, buys, sells
+    # Backward walk for all tickers at once; `wait` counts cooldown days
+    rows = np.arange(tickers)
+    layer = np.full(tickers, layers - 1)
+    holding = np.zeros(tickers, dtype=bool)
+    wait = np.zeros(tickers, dtype=np.int64)
+    done = np.zeros(tickers, dtype=bool)
+    for i in range(n - 1, -1, -1):
+        active = (wait == 0) & ~done
+        wait[~active & ~done] -= 1
+        at = np.clip(layer, 0, None)
+        buy_here = active & holding & bought[i, at, rows]
+        sell_here = active & ~holding & sold[i, at, rows]
+        buys[buy_here, i] = True
+        sells[sell_here, i] = True
+        holding ^= buy_here | sell_here
+        wait[buy_here] = cooldown
+        if not unlimited:
+            layer[buy_here] -= 1
+            done |= layer < 0
+    return profits, buys, sells
+
+
+def trades_of(buys, sells) -> list:
+    """Pair one ticker's buy / sell masks into [(buy_day, sell_day), ...]."""
+    return list(zip(np.flatnonzero(buys).tolist(), np.flatnonzero(sells).tolist()))
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the trading state machine")
+    parser.add_argument("--tickers", type=int, default=10**4)
+    parser.add_argument("--days", type=int, default=252)
+    parser.add_argument("--k", type=int, default=2, help="max trades (-1: unlimited)")
+    parser.add_argument("--cooldown", type=int, default=0)
+    parser.add_argument("--fee", type=float, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    k = None if args.k < 0 else args.k
+    rng = random.Random(args.seed)
+
+    series = []
+    for _ in range(args.tickers):
+        price, row = 100.0, []
+        for _ in range(args.days):
+            price = max(1.0, price + rng.gauss(0, 2))
+            row.append(round(price, 2))
+        series.append(row)
+    knobs = dict(k=k, cooldown=args.cooldown, fee=args.fee)
+
+    def timed(label, fn, count):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<34}{elapsed:9.3f}s  {elapsed / count * 1e6:9.1f} µs/ticker")
+        return result
+
+    print(f"{args.tickers:,} tickers x {args.days} days, {knobs}")
+    sample = series[:min(len(series), 1000)]
+    scalar = timed("max_profit, one series at a time",
+                   lambda: [max_profit(row, **knobs) for row in sample], len(sample))
+    timed("best_trades, one series at a time",
+          lambda: [best_trades(row, **knobs) for row in sample], len(sample))
+    if np is None:
+        print("numpy not installed — skipping backtest()")
+        return
+    matrix = np.array(series)
+    timed("backtest (profits only)",
+          lambda: backtest(matrix, trades=False, **knobs), len(series))
+    profits, buys, sells = timed("backtest (profits + trade masks)",
+                                 lambda: backtest(matrix, **knobs), len(series))
+    assert np.allclose(profits[:len(sample)], scalar)
+    for t in range(min(len(series), 50)):
+        trades = trades_of(buys[t], sells[t])
+        realized = sum(series[t][s] - series[t][b] - args.fee for b, s in trades)
+        assert abs(realized - profits[t]) < 1e-6, (t, realized, profits[t])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""
+============================================================
+DisjointSet — array-backed union-find for dynamic connectivity
+============================================================
+
+graphs/547_no_of_provinces.py answers "how many provinces?" from a
+dense n x n matrix handed over all at once: O(n²) memory and time even
+when each city has two roads.  This is the same union by size + path
+compression structure, kept alive between calls:
+
+    ds = DisjointSet(n)
+    ds.union_edges([(0, 1), (2, 3)])        # any iterable of pairs
+    ds.union_flat(batch)                    # [a0, b0, a1, b1, ...]
+    ds.count(), ds.connected(0, 3)          # answered online, O(α(n))
+    ds.save("provinces.dsu")                # survives a restart
+    ds = DisjointSet.load("provinces.dsu")
+
+Storage: two array('q') buffers (parent, size) — 16 bytes per node and
+no per-node objects; edges are never stored, so memory is O(n)
+however many batches stream through.
+
+    find:  path halving (iterative — no recursion limit at 10^7 nodes)
+    union: smaller tree under the larger one → depth O(log n)
+
+Speed matches the list-based version (array reads box an int each
+time, just like list reads); the win is ~3x less memory and no
+recursion, which is what makes 10^7 nodes practical.
+
+Binary edge files (int64 pairs, back to back) stream in fixed-size
+batches with `iter_edge_file`.
+
+Benchmark (sparse random graph, edges streamed in batches):
+
+    python -m dsa.unionfind --nodes 10000000 --edges 10000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+
+_MAGIC = b"DSU1"
+DEFAULT_BATCH = 1 << 20   # edges per batch when streaming files
+
+
+class DisjointSet:
+    """Union-find over nodes 0..n-1 (see module docstring)."""
+
+    __slots__ = ("parent", "size", "_count")
+
+    def __init__(self, n: int = 0):
+        self.parent = array("q", range(n))
+        self.size = array("q", [1]) * n
+        self._count = n
+
+    @classmethod
+    def from_matrix(cls, isConnected) -> "DisjointSet":
+        """Build from 547's adjacency matrix (upper triangle only)."""
+        n = len(isConnected)
+        ds = cls(n)
+        ds.union_edges((i, j) for i in range(n)
+                       for j in range(i + 1, n) if isConnected[i][j])
+        return ds
+
+    def __len__(self):
+        return len(self.parent)
+
+    def __repr__(self):
+        return f"DisjointSet(nodes={len(self)}, components={self._count})"
+
+    def nbytes(self) -> int:
+        return (self.parent.itemsize * len(self.parent)
+                + self.size.itemsize * len(self.size))
+
+    def add(self, k: int = 1) -> int:
+        """Append k singleton nodes; returns the id of the first one."""
+        first = len(self.parent)
+        self.parent.extend(range(first, first + k))
+        self.size.extend(array("q", [1]) * k)
+        self._count += k
+        return first
+
+    # ---- queries ------------------------------------------------------
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]   # path halving
+            x = parent[x]
+        return x
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def count(self) -> int:
+        """Number of components (provinces)."""
+        return self._count
+
+    def component_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+    def labels(self) -> array:
+        """Root of every node, fully compressing the forest on the way."""
+        parent = self.parent
+        find = self.find
+        for x in range(len(parent)):
+            parent[x] = find(x)
+        return array("q", parent)
+
+    # ---- updates ------------------------------------------------------
+    def union(self, a: int, b: int) -> bool:
+        """Merge the components of a and b; False if already joined."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        size = self.size
+        if size[ra] < size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        size[ra] += size[rb]
+        self._count -= 1
+        return True
+
+    def union_edges(self, edges) -> int:
+        """
+        Union every (a, b) pair of an iterable — a list, a generator, one
+        batch of a stream.  Returns how many merges happened.
+        """
+        parent, size = self.parent, self.size
+        merged = 0
+        # find() inlined: the call overhead dominates at 10^7 edges
+        for a, b in edges:
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            size[a] += size[b]
+            merged += 1
+        self._count -= merged
+        return merged
+
+    def union_flat(self, flat) -> int:
+        """Same as union_edges for a flat [a0, b0, a1, b1, ...] sequence."""
+        it = iter(flat)
+        return self.union_edges(zip(it, it))
+
+    # ---- persistence --------------------------------------------------
+    def save(self, path) -> None:
+        """
+        Write header + parent + size as raw int64.  Goes through a temp
+        file and os.replace, so a crash never leaves a half-written state.
+        """
+        path = os.fspath(path)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(prefix=".dsu-", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_MAGIC)
+                array("q", [len(self.parent), self._count]).tofile(f)
+                self.parent.tofile(f)
+                self.size.tofile(f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path) -> "DisjointSet":
+        ds = cls()
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path}: not a DisjointSet file")
+            header = array("q")
+            header.fromfile(f, 2)
+            n, ds._count = header
+            ds.parent.fromfile(f, n)
+            ds.size.fromfile(f, n)
+        return ds
+
+
+def iter_edge_file(path, batch: int = DEFAULT_BATCH):
+    """Yield flat array('q') batches of `batch` edges from an int64 pair file."""
+    with open(path, "rb") as f:
+        while True:
+            chunk = array("q")
+            try:
+                chunk.fromfile(f, 2 * batch)
+            except EOFError:
+                pass   # short last batch — fromfile keeps what it read
+            if not chunk:
+                return
+            yield chunk
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def _random_batches(nodes, edges, seed, batch):
+    """Random sparse edges as flat array('q') batches."""
+    rng = random.Random(seed)
+    randrange = rng.randrange
+    left = edges
+    while left:
+        k = min(batch, left)
+        yield array("q", [randrange(nodes) for _ in range(2 * k)])
+        left -= k
+
+
+def _matrix_style(nodes, batches):
+    """547's findCircleNum_union_find_optimized, fed edges instead of a matrix."""
+    parent = list(range(nodes))
+    rank = [0] * nodes
+    provinces = nodes
+
+    def find(x):
+        if parent[x] != x:
+            parent[x] = find(parent[x])
+        return parent[x]
+
+    for flat in batches:
+        it = iter(flat)
+        for x, y in zip(it, it):
+            rx, ry = find(x), find(y)
+            if rx == ry:
+                continue
+            if rank[rx] < rank[ry]:
+                parent[rx] = ry
+            elif rank[rx] > rank[ry]:
+                parent[ry] = rx
+            else:
+                parent[ry] = rx
+                rank[rx] += 1
+            provinces -= 1
+    # Two pointer arrays plus one int object (28 bytes) per node id
+    footprint = sys.getsizeof(parent) + sys.getsizeof(rank) + 28 * nodes
+    return provinces, footprint
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the array-backed DisjointSet")
+    parser.add_argument("--nodes", type=int, default=10**7)
+    parser.add_argument("--edges", type=int, default=10**7)
+    parser.add_argument("--batch", type=int, default=DEFAULT_BATCH)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-baseline", action="store_true",
+                        help="skip the list-based union-find from 547")
+    args = parser.parse_args(argv)
+    n, m = args.nodes, args.edges
+
+    workdir = tempfile.mkdtemp(prefix="dsu-bench-")
+    edge_path = os.path.join(workdir, "edges.bin")
+    state_path = os.path.join(workdir, "state.dsu")
+    try:
+        start = time.perf_counter()
+        with open(edge_path, "wb") as f:
+            for flat in _random_batches(n, m, args.seed, args.batch):
+                flat.tofile(f)
+        print(f"nodes={n:,} edges={m:,} "
+              f"(written in {time.perf_counter() - start:.1f}s)")
+
+        def report(label, seconds, nbytes, result):
+            print(f"{label:<30}{seconds:8.2f}s  {m / seconds / 1e6:6.2f} M edges/s"
+                  f"  {nbytes / 2**20:8.1f} MiB  components={result:,}")
+
+        # No tracemalloc while timing: it taxes every int allocation
+        start = time.perf_counter()
+        ds = DisjointSet(n)
+        for flat in iter_edge_file(edge_path, args.batch):
+            ds.union_flat(flat)
+        report("DisjointSet (streamed)", time.perf_counter() - start,
+               ds.nbytes(), ds.count())
+
+        start = time.perf_counter()
+        ds.save(state_path)
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        restored = DisjointSet.load(state_path)
+        loaded = time.perf_counter() - start
+        assert restored.count() == ds.count()
+        print(f"{'  save / load':<30}{saved:8.2f}s / {loaded:.2f}s  "
+              f"({os.path.getsize(state_path) / 2**20:.1f} MiB on disk)")
+        del ds, restored
+
+        if not args.skip_baseline:
+            start = time.perf_counter()
+            result, nbytes = _matrix_style(n, iter_edge_file(edge_path, args.batch))
+            report("list parent/rank (547 style)", time.perf_counter() - start,
+                   nbytes, result)
+    finally:
+        for path in (edge_path, state_path):
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+"""
+============================================================
+Sliding windows — fixed-width sums, min/max, anagram matches
+============================================================
+
+1423 (cards) and 567 (permutation in string) each hand-roll a window
+loop over an in-memory list.  The same three aggregates, once:
+
+    window_sums(values, width)         sum of every full window
+    window_mins(values, width)         min of every full window
+    window_maxes(values, width)        max of every full window
+    anagram_windows(seq, pattern)      starts i where seq[i:i+len(pattern)]
+                                       is a permutation of pattern (567/438)
+    RollingWindow(width)               push-based sum / mean / min / max
+                                       for metric rollups
+
+Input decides the path:
+    - NumPy array in → NumPy array out, no Python loop:
+        sums    integer cumsum, c[w:] - c[:-w] (exact); float input uses
+                np.convolve with ones(w) for w <= CONVOLVE_MAX (no cumsum
+                drift), the cumsum difference above that
+        min/max van Herk / Gil-Werman: cut into blocks of w, running
+                max from each block's left and right end
+                (np.maximum.accumulate), window = max(suffix[i],
+                prefix[i+w-1]) — O(n), independent of w
+        anagram one cumsum per distinct pattern symbol — window count
+                == pattern count for all of them (their total is w, so
+                no other symbol can be inside)
+    - anything else (list, generator, file lines, ...) → lazy iterator,
+      O(width) memory, one pass; values are never indexed, so plain
+      iterators work:
+        sums    running total + ring buffer of the last w values
+        min/max monotonic deque of (index, value)
+        anagram {symbol: pattern count - window count} + the number
+                of symbols out of balance; a hit is "none out of balance"
+      ASCII str / bytes go through the NumPy anagram path when NumPy is
+      installed (results still come back as an iterator).
+
+Benchmark:
+
+    python -m dsa.window --n 1000000 --width 1000
+"""
+
+import argparse
+import random
+import string
+import time
+from collections import deque
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # optional — streaming paths only
+    np = None
+
+CONVOLVE_MAX = 64          # float sums: np.convolve up to this width
+
+
+def _is_array(values):
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def _check_width(width):
+    if width < 1:
+        raise ValueError("width must be at least 1")
+
+
+# ============================================================
+# SUMS
+# ============================================================
+
+def window_sums(values, width: int):
+    """sum(values[i:i+width]) for every full window, in order."""
+    _check_width(width)
+    if _is_array(values):
+        return _sums_numpy(values, width)
+    return _sums_stream(values, width)
+
+
+def _sums_stream(values, width):
+    items = iter(values)
+    ring = list(islice(items, width))
+    if len(ring) < width:
+        return
+    total = sum(ring)
+    yield total
+    i = 0
+    for x in items:
+        total += x - ring[i]
+        ring[i] = x
+        i = i + 1 if i + 1 < width else 0
+        yield total
+
+
+def _sums_numpy(values, width):
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError("expected a one-dimensional array")
+    n = len(values)
+    if width > n:
+        return np.zeros(0, dtype=np.result_type(values, 0))
+    if np.issubdtype(values.dtype, np.floating) and width <= CONVOLVE_MAX:
+        return np.convolve(values, np.ones(width, dtype=values.dtype), mode="valid")
+    dtype = np.int64 if np.issubdtype(values.dtype, np.integer) else np.float64
+    cumulative = np.zeros(n + 1, dtype=dtype)
+    np.cumsum(values, dtype=dtype, out=cumulative[1:])
+    return cumulative[width:] - cumulative[:-width]
+
+
+# ============================================================
+# MIN / MAX
+# ============================================================
+
+def window_mins(values, width: int):
+    """min(values[i:i+width]) for every full window, in order."""
+    _check_width(width)
+    if _is_array(values):
+        return _extremes_numpy(values, width, np.minimum)
+    return _mins_stream(values, width)
+
+
+def window_maxes(values, width: int):
+    """max(values[i:i+width]) for every full window, in order."""
+    _check_width(width)
+    if _is_array(values):
+        return _extremes_numpy(values, width, np.maximum)
+    return _maxes_stream(values, width)
+
+
+def _mins_stream(values, width):
+    # Deque values strictly increase front to back; the front is the min
+    window = deque()
+    for i, x in enumerate(values):
+        while window and window[-1][1] >= x:
+            window.pop()
+        window.append((i, x))
+        if window[0][0] <= i - width:
+            window.popleft()
+        if i >= width - 1:
+            yield window[0][1]
+
+
+def _maxes_stream(values, width):
+    window = deque()
+    for i, x in enumerate(values):
+        while window and window[-1][1] <= x:
+            window.pop()
+        window.append((i, x))
+        if window[0][0] <= i - width:
+            window.popleft()
+        if i >= width - 1:
+            yield window[0][1]
+
+
+def _extremes_numpy(values, width, pick):
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError("expected a one-dimensional array")
+    n = len(values)
+    if width > n:
+        return values[:0].copy()
+    if width == 1:
+        return values.copy()
+    # Pad to whole blocks with the last value: it is already in the last
+    # window, so repeating it cannot change any answer
+    blocks = -(-n // width)
+    padded = np.empty(blocks * width, dtype=values.dtype)
+    padded[:n] = values
+    padded[n:] = values[-1]
+    grid = padded.reshape(blocks, width)
+    prefix = pick.accumulate(grid, axis=1).ravel()            # block start .. j
+    suffix = pick.accumulate(grid[:, ::-1], axis=1)[:, ::-1].ravel()  # j .. block end
+    # Window [i, i+w) spans at most two blocks: i..its block end, then
+    # the next block's start..i+w-1
+    count = n - width + 1
+    return pick(suffix[:count], prefix[width - 1:width - 1 + count])
+
+
+# ============================================================
+# ANAGRAM WINDOWS
+# ============================================================
+
+def anagram_windows(seq, pattern):
+    """
+    Start of every window of seq that is a permutation of pattern.
+    seq / pattern: str, bytes, NumPy arrays or any iterables of
+    hashable items.  An ndarray seq gives an ndarray of starts.
+    """
+    if _is_array(seq):
+        return _anagram_numpy(seq, np.asarray(pattern))
+    codes = _ascii_codes(seq), _ascii_codes(pattern)
+    if codes[0] is not None and codes[1] is not None:
+        return iter(_anagram_numpy(*codes).tolist())
+    return _anagram_stream(seq, list(pattern))
+
+
+def _ascii_codes(text):
+    if np is None:
+        return None
+    if isinstance(text, str):
+        if not text.isascii():
+            return None
+        text = text.encode("ascii")
+    if isinstance(text, (bytes, bytearray)):
+        return np.frombuffer(text, dtype=np.uint8)
+    return None
+
+
+def _anagram_stream(seq, pattern):
+    width = len(pattern)
+    balance = {}                       # pattern count - window count
+    for symbol in pattern:
+        balance[symbol] = balance.get(symbol, 0) + 1
+    off = len(balance)                 # symbols whose balance is not 0
+    if width == 0:
+        yield from range(sum(1 for _ in seq) + 1)
+        return
+    ring = [None] * width
+    for i, symbol in enumerate(seq):
+        slot = i % width
+        if i >= width:                 # ring[slot] leaves the window
+            old = ring[slot]
+            before = balance[old]
+            balance[old] = before + 1
+            off += (before == 0) - (before == -1)
+        ring[slot] = symbol
+        before = balance.get(symbol, 0)
+        balance[symbol] = before - 1
+        off += (before == 0) - (before == 1)
+        if off == 0 and i >= width - 1:
+            yield i - width + 1
+
+
+def _anagram_numpy(codes, pattern):
+    n, width = len(codes), len(pattern)
+    if width > n:
+        return np.zeros(0, dtype=np.int64)
+    if width == 0:
+        return np.arange(n + 1)
+    symbols, need = np.unique(pattern, return_counts=True)
+    hits = np.ones(n - width + 1, dtype=bool)
+    cumulative = np.zeros(n + 1, dtype=np.int32 if n < 2**31 else np.int64)
+    # Rarest symbols first: they rule out the most windows early
+    for s in np.argsort(need):
+        np.cumsum(codes == symbols[s], out=cumulative[1:])
+        hits &= (cumulative[width:] - cumulative[:-width]) == need[s]
+        if not hits.any():
+            break
+    return np.flatnonzero(hits)
+
+
+# ============================================================
+# PUSH-BASED ROLLUPS
+# ============================================================
+
+class RollingWindow:
+    """Last `width` values pushed: sum, mean, min and max in O(1) amortized."""
+
+    __slots__ = ("width", "_ring", "_count", "_sum", "_mins", "_maxes")
+
+    def __init__(self, width: int):
+        _check_width(width)
+        self.width = width
+        self._ring = [0] * width
+        self._count = 0                # values pushed so far
+        self._sum = 0
+        self._mins = deque()           # (index, value), increasing values
+        self._maxes = deque()          # (index, value), decreasing values
+
+    def push(self, x) -> None:
+        i, width = self._count, self.width
+        slot = i % width
+        if i >= width:
+            self._sum -= self._ring[slot]
+        self._ring[slot] = x
+        self._sum += x
+        self._count = i + 1
+        mins, maxes = self._mins, self._maxes
+        while mins and mins[-1][1] >= x:
+            mins.pop()
+        mins.append((i, x))
+        while maxes and maxes[-1][1] <= x:
+            maxes.pop()
+        maxes.append((i, x))
+        if mins[0][0] <= i - width:
+            mins.popleft()
+        if maxes[0][0] <= i - width:
+            maxes.popleft()
+
+    def extend(self, values) -> None:
+        for x in values:
+            self.push(x)
+
+    def __len__(self):
+        """Values currently in the window."""
+        return min(self._count, self.width)
+
+    @property
+    def full(self) -> bool:
+        return self._count >= self.width
+
+    @property
+    def sum(self):
+        return self._sum
+
+    @property
+    def mean(self):
+        if not self._count:
+            raise ValueError("empty window")
+        return self._sum / len(self)
+
+    @property
+    def min(self):
+        if not self._count:
+            raise ValueError("empty window")
+        return self._mins[0][1]
+
+    @property
+    def max(self):
+        if not self._count:
+            raise ValueError("empty window")
+        return self._maxes[0][1]
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the sliding-window engine")
+    parser.add_argument("--n", type=int, default=10**6)
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    n, width = args.n, args.width
+    rng = random.Random(args.seed)
+
+    from dsa.registry import problem
+    cards = problem(1423)
+    permutation = problem(567).Solution()
+
+    values = [rng.randrange(1, 10**4) for _ in range(n)]
+    text = "".join(rng.choices(string.ascii_lowercase[:6], k=n))
+    pattern = "".join(rng.choices(string.ascii_lowercase[:6], k=min(width, 64)))
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:<44}{time.perf_counter() - start:9.3f}s")
+        return result
+
+    print(f"n = {n:,}, width = {width:,} ({'numpy' if np is not None else 'pure Python'})")
+    k = n - width
+    expected = timed("1423 SolutionV4_MinWindow", lambda: cards.SolutionV4_MinWindow().maxScore(values, k))
+    timed("1423 SolutionV3_SlidingWindow", lambda: cards.SolutionV3_SlidingWindow().maxScore(values, k))
+    got = timed("1423 SolutionV6_Window", lambda: cards.SolutionV6_Window().maxScore(values, k))
+    assert got == expected
+
+    sums = timed("window_sums (stream)", lambda: list(window_sums(values, width)))
+    mins = timed("window_mins (stream)", lambda: list(window_mins(values, width)))
+    maxes = timed("window_maxes (stream)", lambda: list(window_maxes(values, width)))
+    rolling = RollingWindow(width)
+
+    def rollup():
+        out = []
+        for x in values:
+            rolling.push(x)
+            if rolling.full:
+                out.append(rolling.max)
+        return out
+    assert timed("RollingWindow.push (+ max)", rollup) == maxes
+
+    found = timed("567 Solution x 1 (exists?)", lambda: permutation.checkInclusion(pattern, text))
+    starts = timed("anagram_windows (stream)",
+                   lambda: list(_anagram_stream(text, list(pattern))))
+    assert found == bool(starts)
+
+    if np is None:
+        return
+    arr = np.array(values, dtype=np.int64)
+    assert timed("window_sums (numpy cumsum)", lambda: window_sums(arr, width)).tolist() == sums
+    assert timed("window_mins (numpy blocks)", lambda: window_mins(arr, width)).tolist() == mins
+    assert timed("window_maxes (numpy blocks)", lambda: window_maxes(arr, width)).tolist() == maxes
+    floats = arr.astype(np.float64)
+    small = min(width, CONVOLVE_MAX)
+    timed(f"window_sums (numpy convolve, float, w={small})", lambda: window_sums(floats, small))
+    assert timed("anagram_windows (numpy)", lambda: list(anagram_windows(text, pattern))) == starts
+
+
+if __name__ == "__main__":
+    main()
@@ -244,4 +244,12 @@ KEY INSIGHTS:
 WHEN TO USE WHICH:
 - DFS/BFS: When you need to find connected components once
 - Union-Find: When you have dynamic connectivity queries or need to track changes
+
+SPARSE / STREAMING INPUT:
+- Every approach above reads the full n x n matrix: O(n^2) even with a
+  handful of roads per city.  dsa/unionfind.py has an array-backed
+  DisjointSet that takes edge lists or streamed edge batches, answers
+  count() / connected(a, b) online and saves/loads its state.
+- dsa/graph.py stores a graph as CSR arrays (CSRGraph.from_matrix /
+  from_edges) and count_components() runs the iterative DFS on them.
 """
\ No newline at end of file
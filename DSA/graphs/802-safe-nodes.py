@@ -140,6 +140,198 @@ class Solution3:
         return sorted(safe_nodes)
 
 
+# ============================================================================
+# SOLUTION 4: ITERATIVE THREE-COLOR DFS (NO RECURSION, NO SORT)
+# TC: O(V + E), SC: O(V)
+# ============================================================================
+class Solution4:
+    def eventualSafeNodes(self, graph: List[List[int]]) -> List[int]:
+        """
+        Solution2's three colors with an explicit stack, so a 10^6-long
+        chain is just a 10^6-entry list instead of a RecursionError.
+
+        Each frame is (node, iterator over its neighbors), so a node
+        resumes where it left off after a child finishes SAFE.
+
+        Colors: 0 white, 1 gray (on the stack), 2 safe, 3 unsafe.
+        Hitting a gray (cycle) or unsafe node makes EVERY node on the
+        stack unsafe — each of them reaches it — so the stack is
+        flushed in one go instead of unwinding frame by frame.
+        Unsafe is remembered, so no node is entered twice, and the
+        answer is read off the color array in node order → no sort.
+        """
+        WHITE, GRAY, SAFE, UNSAFE = 0, 1, 2, 3
+        n = len(graph)
+        color = bytearray(n)
+
+        for root in range(n):
+            if color[root]:
+                continue
+            color[root] = GRAY
+            stack = [(root, iter(graph[root]))]
+            while stack:
+                node, neighbors = stack[-1]
+                for child in neighbors:
+                    state = color[child]
+                    if state == SAFE:
+                        continue
+                    if state == WHITE:
+                        color[child] = GRAY
+                        stack.append((child, iter(graph[child])))
+                    else:
+                        # Gray child = cycle; unsafe child = reaches one
+                        for ancestor, _ in stack:
+                            color[ancestor] = UNSAFE
+                        stack.clear()
+                    break
+                else:
+                    color[node] = SAFE      # every neighbor was safe
+                    stack.pop()
+
+        return [i for i in range(n) if color[i] == SAFE]
+
+
+# ============================================================================
+# SOLUTION 5: INCREMENTAL SAFE STATES (EDGES ADDED / REMOVED LATER)
+# ============================================================================
+class SafeNodeTracker:
+    """
+    Keeps the safe / unsafe label of every node up to date while edges
+    change, touching only the part of the graph an update can affect.
+
+        tracker = SafeNodeTracker(graph)     # Solution4 labels everything
+        tracker.add_edge(3, 0)
+        tracker.remove_edge(1, 2)
+        tracker.safe_nodes()                 # in order, no sort
+        tracker.are_safe([0, 4, 7])          # bulk query
+
+    Facts the updates rely on:
+      - unsafe(u)  ⟺  u can reach a cycle.
+      - ADD u → v can only turn nodes unsafe, and only nodes that reach
+        u.  That happens iff u is safe and (v is unsafe, or v reaches u
+        — the new edge closes a cycle).  Then u and every safe ancestor
+        of u flip to unsafe.
+      - REMOVE u → v can only turn nodes safe, and only unsafe nodes
+        that reach u (any other unsafe node's path to a cycle doesn't
+        use the edge).  Those candidates are re-run through Solution3's
+        peel (Kahn) with everything outside them fixed.
+
+    Cost per update: O(nodes + edges in the affected region), not the
+    whole graph.
+
+    SC: O(V + E) — out- and in-neighbor sets per node.
+    """
+
+    def __init__(self, graph: List[List[int]] = ()):
+        self.out = [set(neighbors) for neighbors in graph]
+        self.into = [set() for _ in self.out]
+        for node, neighbors in enumerate(self.out):
+            for neighbor in neighbors:
+                self.into[neighbor].add(node)
+        safe = Solution4().eventualSafeNodes(graph)
+        self.safe = bytearray(len(self.out))
+        for node in safe:
+            self.safe[node] = 1
+
+    # ---- queries ---------------------------------------------------------
+    def __len__(self):
+        return len(self.out)
+
+    def is_safe(self, node: int) -> bool:
+        return bool(self.safe[node])
+
+    def are_safe(self, nodes) -> List[bool]:
+        safe = self.safe
+        return [bool(safe[node]) for node in nodes]
+
+    def safe_nodes(self) -> List[int]:
+        safe = self.safe
+        return [i for i in range(len(safe)) if safe[i]]
+
+    # ---- updates ---------------------------------------------------------
+    def add_node(self) -> int:
+        """New isolated node — terminal, hence safe.  Returns its id."""
+        self.out.append(set())
+        self.into.append(set())
+        self.safe.append(1)
+        return len(self.out) - 1
+
+    def add_edge(self, u: int, v: int) -> None:
+        if v in self.out[u]:
+            return
+        self.out[u].add(v)
+        self.into[v].add(u)
+        if self.safe[u] and (not self.safe[v] or self._reaches(v, u)):
+            self._mark_unsafe(u)
+
+    def remove_edge(self, u: int, v: int) -> None:
+        self.out[u].remove(v)      # KeyError if the edge doesn't exist
+        self.into[v].remove(u)
+        if not self.safe[u]:
+            self._repeel(u)
+
+    def add_edges(self, edges) -> None:
+        for u, v in edges:
+            self.add_edge(u, v)
+
+    def remove_edges(self, edges) -> None:
+        for u, v in edges:
+            self.remove_edge(u, v)
+
+    # ---- helpers ---------------------------------------------------------
+    def _reaches(self, start: int, target: int) -> bool:
+        """Iterative DFS from a SAFE start (so it only sees safe nodes)."""
+        out = self.out
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node == target:
+                return True
+            for neighbor in out[node]:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return False
+
+    def _mark_unsafe(self, u: int) -> None:
+        """u and all of its safe ancestors become unsafe."""
+        safe, into = self.safe, self.into
+        safe[u] = 0
+        stack = [u]
+        while stack:
+            node = stack.pop()
+            for parent in into[node]:
+                if safe[parent]:
+                    safe[parent] = 0
+                    stack.append(parent)
+
+    def _repeel(self, u: int) -> None:
+        """Re-run the Kahn peel on the unsafe ancestors of u (incl. u)."""
+        safe, out, into = self.safe, self.out, self.into
+
+        region = {u}
+        stack = [u]
+        while stack:
+            node = stack.pop()
+            for parent in into[node]:
+                if not safe[parent] and parent not in region:
+                    region.add(parent)
+                    stack.append(parent)
+
+        # Count the neighbors that are not (yet) known to be safe
+        pending = {node: sum(1 for nb in out[node] if not safe[nb])
+                   for node in region}
+        queue = [node for node, count in pending.items() if count == 0]
+        for node in queue:          # the list grows while we walk it
+            safe[node] = 1
+            for parent in into[node]:
+                if parent in pending:
+                    pending[parent] -= 1
+                    if pending[parent] == 0:
+                        queue.append(parent)
+
+
 """
 COMPREHENSIVE ANALYSIS:
 
@@ -168,6 +360,17 @@ COMPREHENSIVE ANALYSIS:
    ❌ More complex to implement
    ❌ Less intuitive
 
+   **Solution 4 (Iterative three-color DFS)**:
+   ✅ Solution2's logic, no recursion limit (10^6-deep chains are fine)
+   ✅ Remembers unsafe nodes too, so every node is entered once
+   ✅ Output read off the color array in order — no final sort
+   ❌ Stack bookkeeping is harder to write on a whiteboard
+
+   **Solution 5 (SafeNodeTracker)**:
+   ✅ add_edge / remove_edge only revisit the nodes that can change
+   ✅ Bulk queries: safe_nodes(), are_safe(nodes)
+   ❌ Stores in-edges as well (O(V + E) sets)
+
 3. **WHY SOLUTION 2 IS BETTER**:
    - Standard three-color DFS pattern
    - Single state array instead of three boolean arrays
@@ -214,5 +417,14 @@ COMPREHENSIVE ANALYSIS:
     - Not using memoization (visiting same node multiple times)
     - Incorrect state transitions
 
+11. **LARGE GRAPHS**:
+    - All three solutions index graph[node], so they also run on a
+      dsa/graph.py CSRGraph (two flat arrays instead of a list per node).
+    - dsa/graph.py also has iterative safe_nodes / safe_nodes_topological
+      that work on the CSR arrays directly (transpose is cached, no
+      rebuilt reverse_graph).
+
 RECOMMENDATION: Use Solution 2 - it's the cleanest and most standard approach.
+For deep or large graphs use Solution 4; when the graph keeps changing,
+SafeNodeTracker.
 """
\ No newline at end of file
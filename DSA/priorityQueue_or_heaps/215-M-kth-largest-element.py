@@ -197,6 +197,57 @@ class Solution7:
         return -pq.get()
 
 
+# APPROACH 8: INTROSELECT (QUICKSELECT WITH A WORST-CASE GUARANTEE)
+# Time Complexity: O(n) worst case
+# Space Complexity: O(n) - the partitions are built as new lists
+class Solution8:
+    def findKthLargest(self, nums: List[int], k: int) -> int:
+        """
+        INTROSELECT APPROACH:
+        - Quickselect with a median-of-3 pivot and a THREE-way split
+          (< pivot, == pivot, > pivot), iterative - no recursion depth
+        - If ~2*log2(n) rounds pass without finishing, the input is
+          feeding bad pivots: switch to median-of-medians, which always
+          throws away at least 30% of the items
+        
+        ADVANTAGES:
+        1. Sorted / all-equal inputs no longer make Solution2 O(n²)
+        2. List comprehensions partition at C speed
+        
+        DISADVANTAGES:
+        1. O(n) extra space instead of in-place swaps
+        
+        dsa/orderstat.py has the full engine: kth_smallest, several k
+        in one pass, nth_element and a np.partition backend.
+        """
+        target = len(nums) - k          # index in ascending order
+        budget = 2 * len(nums).bit_length()
+        while True:
+            if len(nums) <= 16:
+                return sorted(nums)[target]
+            if budget > 0:
+                a, b, c = nums[0], nums[len(nums) // 2], nums[-1]
+                pivot = sorted((a, b, c))[1]
+                budget -= 1
+            else:
+                pivot = self.medianOfMedians(nums)
+            less = [x for x in nums if x < pivot]
+            greater = [x for x in nums if x > pivot]
+            if target < len(less):
+                nums = less
+            elif target >= len(nums) - len(greater):
+                target -= len(nums) - len(greater)
+                nums = greater
+            else:
+                return pivot
+
+    def medianOfMedians(self, nums: List[int]) -> int:
+        medians = [sorted(nums[i:i + 5])[(min(5, len(nums) - i) - 1) // 2]
+                   for i in range(0, len(nums), 5)]
+        # Median of the medians = its (len+1)//2-th largest
+        return self.findKthLargest(medians, (len(medians) + 1) // 2)
+
+
 """
 COMPLEXITY COMPARISON AND RECOMMENDATIONS:
 
@@ -208,10 +259,14 @@ COMPLEXITY COMPARISON AND RECOMMENDATIONS:
 2. **Large k (k close to n)**:
    - **QUICKSELECT (Solution 2)** - O(n) average ✅ RECOMMENDED
    - Best average case performance
+   - **INTROSELECT (Solution 8)** - O(n) worst case ✅ for untrusted input
+     (Solution 2 is O(n²) on sorted or all-equal arrays)
 
 3. **Multiple queries on same array**:
    - **SORTING (Solution 3)** - O(n log n) once, then O(1) per query
    - Or MAX-HEAP for partial sorting
+   - Or dsa/orderstat.py kth_largest(nums, [k1, k2, ...]) - all ks from
+     one partitioning pass (np.partition for NumPy arrays)
 
 4. **Streaming data**:
    - **MIN-HEAP (Solution 1)** ✅ RECOMMENDED
@@ -1,5 +1,6 @@
 import heapq
-from typing import List
+from itertools import islice
+from typing import Iterable, List
 from collections import Counter, defaultdict
 
 
@@ -179,6 +180,182 @@ class Solution5:
         return unique_nums[n - k:]
 
 
+# APPROACH 6: Streaming Top K (Space-Saving heavy hitters, mergeable)
+class StreamingTopK:
+    """
+    Top k over input that never fits in memory at once: feed it chunks
+    from an iterator (log lines, socket batches, ...) and merge the
+    partial results from several processes at the end.
+
+        counter = StreamingTopK(capacity=10_000)     # bounded memory
+        counter.consume(iter_chunks(open("ids.log"), 100_000, parse=int))
+        counter.topK(10)
+
+    Two modes:
+    - capacity=None → EXACT: a Counter of every distinct item.  Memory
+      O(distinct), answers match Solution1..5.
+    - capacity=m    → SPACE-SAVING (Metwally et al.): tracks at most m
+      items.  When a new item arrives and the table is full, it evicts
+      the item with the smallest count c_min and takes over its slot
+      with count c_min + w, remembering error = c_min.
+      Guarantees, with N = total weight seen:
+        * every item with true frequency > N / m is in the table
+        * count - error <= true frequency <= count
+
+    Time Complexity: O(chunk) per chunk to pre-aggregate with Counter
+    (C speed), then O(d log m) for d distinct items in the chunk.
+    Space Complexity: O(m) in Space-Saving mode, O(distinct) exact.
+
+    Pros: bounded memory, one pass, mergeable across processes
+    Cons: approximate in bounded mode (items near the k-th count may swap)
+    """
+
+    def __init__(self, capacity: int = None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be positive (or None for exact)")
+        self.capacity = capacity
+        self.counts = Counter()
+        self.errors = {}        # item → overestimate (Space-Saving only)
+        self.heap = []          # (count, item) — one entry per tracked item
+        self.total = 0          # N: total weight seen
+
+    # ---- compatibility with Solution1..5 ---------------------------------
+    def topKFrequent(self, nums: List[int], k: int) -> List[int]:
+        self.update(nums)
+        return self.topK(k)
+
+    # ---- ingestion --------------------------------------------------------
+    def update(self, chunk: Iterable) -> None:
+        """Add one chunk.  Pre-aggregating with Counter keeps the slow
+        per-item Python work proportional to DISTINCT items per chunk."""
+        self.add_counts(Counter(chunk))
+
+    def consume(self, chunks: Iterable[Iterable]) -> "StreamingTopK":
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def add_counts(self, counts) -> None:
+        """Add pre-aggregated {item: weight} counts."""
+        if self.capacity is None:
+            self.counts.update(counts)
+            self.total += sum(counts.values())
+            return
+        for item, w in counts.items():
+            self._add(item, w)
+
+    def _add(self, item, w):
+        self.total += w
+        counts = self.counts
+        if item in counts:
+            counts[item] += w        # heap entry goes stale; fixed lazily
+            return
+        if len(counts) < self.capacity:
+            counts[item] = w
+            self.errors[item] = 0
+            heapq.heappush(self.heap, (w, item))
+            return
+        c_min, victim = self._pop_min()
+        del counts[victim]
+        del self.errors[victim]
+        counts[item] = c_min + w
+        self.errors[item] = c_min
+        heapq.heappush(self.heap, (c_min + w, item))
+
+    def _pop_min(self):
+        # Counts only grow, so a stale (count, item) entry is refreshed
+        # and pushed back; each tracked item has exactly one heap entry.
+        heap, counts = self.heap, self.counts
+        while True:
+            c, item = heapq.heappop(heap)
+            if counts[item] == c:
+                return c, item
+            heapq.heappush(heap, (counts[item], item))
+
+    def _min_count(self):
+        if self.capacity is None or len(self.counts) < self.capacity:
+            return 0        # not full → unseen items truly have count 0
+        return min(self.counts.values())
+
+    # ---- merging partial results -----------------------------------------
+    def merge(self, other: "StreamingTopK") -> "StreamingTopK":
+        """
+        Fold another summary into this one (in place) and return self.
+
+        Exact + exact → exact sum.  Otherwise the mergeable-summary rule
+        (Agarwal et al. 2012): an item missing from a FULL summary may
+        still have occurred up to that summary's minimum count, so that
+        minimum is added to both its count and its error.  The union is
+        then trimmed back to the largest `capacity` counts.
+        """
+        if self.capacity is None and other.capacity is None:
+            self.counts.update(other.counts)
+            self.total += other.total
+            return self
+
+        capacity = min(c for c in (self.capacity, other.capacity) if c is not None)
+        min_a, min_b = self._min_count(), other._min_count()
+        counts, errors = Counter(), {}
+        for item in self.counts.keys() | other.counts.keys():
+            c, e = 0, 0
+            for side, side_min in ((self, min_a), (other, min_b)):
+                if item in side.counts:
+                    c += side.counts[item]
+                    e += side.errors.get(item, 0)
+                else:
+                    c += side_min
+                    e += side_min
+            counts[item] = c
+            errors[item] = e
+
+        keep = heapq.nlargest(capacity, counts.items(), key=lambda kv: kv[1])
+        self.capacity = capacity
+        self.counts = Counter(dict(keep))
+        self.errors = {item: errors[item] for item, _ in keep}
+        self.heap = [(c, item) for item, c in keep]
+        heapq.heapify(self.heap)
+        self.total += other.total
+        return self
+
+    def state(self) -> tuple:
+        """Plain-data snapshot, safe to send between processes."""
+        return self.capacity, dict(self.counts), dict(self.errors), self.total
+
+    @classmethod
+    def from_state(cls, state: tuple) -> "StreamingTopK":
+        capacity, counts, errors, total = state
+        obj = cls(capacity)
+        obj.counts = Counter(counts)
+        obj.errors = dict(errors) if capacity is not None else {}
+        obj.heap = [(c, item) for item, c in counts.items()] if capacity is not None else []
+        heapq.heapify(obj.heap)
+        obj.total = total
+        return obj
+
+    # ---- queries ----------------------------------------------------------
+    def topK(self, k: int) -> List:
+        return [item for item, _ in self.counts.most_common(k)]
+
+    def estimates(self, k: int) -> List[tuple]:
+        """[(item, count, guaranteed_min)] for the top k, most frequent first."""
+        return [(item, c, c - self.errors.get(item, 0))
+                for item, c in self.counts.most_common(k)]
+
+
+def iter_chunks(items: Iterable, size: int, parse=None):
+    """
+    Lazily cut any iterable (e.g. an open file) into lists of `size`
+    items, optionally mapping `parse` over each — only one chunk is in
+    memory at a time.
+    """
+    it = iter(items) if parse is None else map(parse, items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 # PERFORMANCE COMPARISON AND RECOMMENDATIONS:
 
 """
@@ -209,6 +386,12 @@ WHEN TO USE EACH APPROACH:
    - Use when: You're familiar with quickselect algorithm
    - Avoid when: Worst case O(n²) is unacceptable
 
+6. STREAMING TOP K (StreamingTopK) - DATA LARGER THAN RAM
+   - Use when: Input arrives in chunks / from files bigger than memory
+   - Use when: Partial counts from several processes must be combined
+   - capacity=None is exact; capacity=m bounds memory to m items
+   - Avoid when: The whole list fits in memory (Solution2 is simpler)
+
 OVERALL RECOMMENDATION:
 Use bucket sort (Solution2) for most production code - it's optimal, 
 simple to understand, and performs well in practice.
@@ -84,6 +84,70 @@ class SolutionOptimized:
 
         return currentTime
 
+def schedule(tasks, n: int, workers: int = 1, cooldowns: dict = None):
+    """
+    Event-driven scheduler: lazily yields (time, worker, task) for every
+    execution, in time order.
+    
+    tasks:     list of task names, or {task: count}
+    n:         default cooldown between two runs of the same task
+    workers:   how many tasks may run in the same time unit
+    cooldowns: optional {task: cooldown} overriding n per task
+    
+    Each time unit, up to `workers` ready tasks run, most remaining first
+    (the greedy that is optimal for one worker).  Unlike the per-tick
+    Solution loop, an idle stretch is skipped in ONE jump to the next
+    ready time, so the work is O(total tasks * log(unique tasks)) no
+    matter how long the cooldowns are.
+    """
+    counts = tasks if isinstance(tasks, dict) else Counter(tasks)
+    cooldowns = cooldowns or {}
+    # Heap entries carry a sequence number so task names never get compared
+    ready = [(-count, seq, task) for seq, (task, count) in enumerate(counts.items())
+             if count > 0]
+    heapq.heapify(ready)
+    waiting = []        # (ready_time, -remaining, seq, task)
+    time = 0
+
+    while ready or waiting:
+        if not ready:
+            time = max(time, waiting[0][0])     # jump over the idle gap
+        while waiting and waiting[0][0] <= time:
+            _, count, seq, task = heapq.heappop(waiting)
+            heapq.heappush(ready, (count, seq, task))
+
+        for worker in range(min(workers, len(ready))):
+            count, seq, task = heapq.heappop(ready)
+            yield time, worker, task
+            if count + 1 < 0:
+                gap = cooldowns.get(task, n)
+                heapq.heappush(waiting, (time + gap + 1, count + 1, seq, task))
+        time += 1
+
+
+def makespan(tasks, n: int, workers: int = 1, cooldowns: dict = None) -> int:
+    """Total time units the schedule takes (0 for no tasks)."""
+    last = -1
+    for last, _, _ in schedule(tasks, n, workers, cooldowns):
+        pass
+    return last + 1
+
+
+class SolutionEventDriven:
+    def leastInterval(self, tasks: List[str], n: int) -> int:
+        """
+        Event-Driven Simulation (see schedule() above)
+        
+        Same greedy as Solution, but with heapq instead of the locking
+        queue.PriorityQueue, and time jumps straight to the next event
+        instead of ticking through idle units one at a time.
+        
+        Time: O(m log(unique_tasks)) - one heap round trip per task
+        Space: O(unique_tasks)
+        """
+        return makespan(tasks, n)
+
+
 class SolutionMath:
     def leastInterval(self, tasks: List[str], n: int) -> int:
         """
@@ -131,7 +195,14 @@ COMPLEXITY ANALYSIS:
    Space: O(unique_tasks)
    - Better constant factors, processes in cycles instead of single time steps
    
-3. Mathematical Approach:
+3. Event-Driven Approach (schedule / SolutionEventDriven):
+   Time: O(m * log(unique_tasks)) - independent of how long the idle gaps are
+   Space: O(unique_tasks)
+   - Jumps to the next ready time instead of ticking, heapq not PriorityQueue
+   - schedule() yields the full (time, worker, task) plan lazily and
+     supports several workers and per-task cooldowns (capacity planning)
+
+4. Mathematical Approach:
    Time: O(m) where m is total number of tasks
    Space: O(1) if using array for counting, O(unique_tasks) if using Counter
    - Most efficient, direct formula calculation
@@ -139,6 +210,9 @@ COMPLEXITY ANALYSIS:
 RECOMMENDED APPROACH:
 Use Mathematical approach for interviews - it's most efficient and shows deep understanding.
 Use Optimized approach if you need to show the simulation logic clearly.
+Use schedule() when you need the actual plan, more than one worker,
+or different cooldowns per task - the formula only covers one worker
+and one shared cooldown.
 
 KEY INSIGHTS:
 - The bottleneck is always the most frequent task
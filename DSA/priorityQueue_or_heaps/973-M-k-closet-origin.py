@@ -1,6 +1,11 @@
 from typing import List
 import heapq
 
+try:
+    import numpy as np
+except ImportError:  # optional — only SolutionNumpy needs it
+    np = None
+
 class Solution:
     def kClosest(self, points: List[List[int]], k: int) -> List[List[int]]:
         """
@@ -49,3 +54,176 @@ class SolutionAlternative:
         """
         points.sort(key=lambda p: p[0] * p[0] + p[1] * p[1])
         return points[:k]
+
+
+# Vectorized O(n) solution: distances + argpartition in NumPy
+class SolutionNumpy:
+    def kClosest(self, points: List[List[int]], k: int,
+                 origin=(0, 0)) -> List[List[int]]:
+        """
+        Squared distances for ALL points in one vectorized expression, then
+        np.argpartition picks the k smallest without sorting the rest.
+        
+        Time Complexity: O(n) - done in C, no Python loop per point
+        Space Complexity: O(n) for the coordinate / distance arrays
+        
+        Converting a Python list of lists to an array is most of the cost,
+        so keep the points as an (n, 2) array when querying repeatedly.
+        """
+        if np is None:
+            raise ImportError("SolutionNumpy needs numpy installed")
+        coords = np.asarray(points)       # input dtype kept: floats stay floats
+        if k <= 0:
+            return []
+        # int64 / float64 for the arithmetic so small dtypes can't overflow
+        work = np.result_type(coords, np.asarray(origin), np.int64)
+        delta = coords.astype(work) - np.asarray(origin, dtype=work)
+        dist = np.einsum("ij,ij->i", delta, delta)
+        if k >= len(dist):
+            return coords.tolist()
+        nearest = np.argpartition(dist, k - 1)[:k]
+        return coords[nearest].tolist()
+
+
+# Spatial index: build once, answer kClosest for ANY origin in ~O(k log n)
+class KDTree:
+    """
+    2-d tree over a fixed point set, for many kClosest queries.
+    
+    Layout (implicit, no node objects): points are reordered so every
+    range [lo, hi) has its splitting point at mid = (lo + hi) // 2,
+    the left half in [lo, mid) and the right half in [mid + 1, hi).
+    Levels alternate x / y.  Ranges of <= leaf_size points are leaves.
+    
+    Query: depth-first, near side first, keeping a max-heap of the best k
+    so far.  A subtree is skipped when its distance lower bound (the
+    squared distance to the splitting line) can't beat the k-th best.
+    
+    Build: O(n log² n)   Query: ~O(log n + k) on spread-out points
+    Space: O(n)
+    """
+
+    def __init__(self, points: List[List[int]], leaf_size: int = 16):
+        self.points = points
+        self.leaf_size = leaf_size
+        order = list(range(len(points)))
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        stack = [(0, len(order), 0)]
+        while stack:
+            lo, hi, axis = stack.pop()
+            if hi - lo <= leaf_size:
+                continue
+            coord = xs if axis == 0 else ys
+            order[lo:hi] = sorted(order[lo:hi], key=coord.__getitem__)
+            mid = (lo + hi) // 2
+            stack.append((lo, mid, 1 - axis))
+            stack.append((mid + 1, hi, 1 - axis))
+        self.order = order                       # tree slot → original index
+        self.xs = [xs[i] for i in order]
+        self.ys = [ys[i] for i in order]
+
+    def __len__(self):
+        return len(self.order)
+
+    def query(self, origin, k: int) -> List[int]:
+        """Original indices of the k points closest to origin, nearest first."""
+        if k <= 0:
+            return []
+        qx, qy = origin
+        xs, ys, leaf = self.xs, self.ys, self.leaf_size
+        heap = []                    # (-dist², slot): max-heap of the best k
+        stack = [(0, len(xs), 0, 0)] # (lo, hi, axis, lower bound on dist²)
+        while stack:
+            lo, hi, axis, bound = stack.pop()
+            if len(heap) == k and bound >= -heap[0][0]:
+                continue
+            if hi - lo <= leaf:
+                candidates = range(lo, hi)
+            else:
+                mid = (lo + hi) // 2
+                candidates = (mid,)
+                diff = qx - xs[mid] if axis == 0 else qy - ys[mid]
+                far_bound = max(bound, diff * diff)
+                if diff < 0:     # query is left of / below the split
+                    stack.append((mid + 1, hi, 1 - axis, far_bound))
+                    stack.append((lo, mid, 1 - axis, bound))
+                else:
+                    stack.append((lo, mid, 1 - axis, far_bound))
+                    stack.append((mid + 1, hi, 1 - axis, bound))
+            for i in candidates:
+                dx, dy = xs[i] - qx, ys[i] - qy
+                d = dx * dx + dy * dy
+                if len(heap) < k:
+                    heapq.heappush(heap, (-d, i))
+                elif d < -heap[0][0]:
+                    heapq.heapreplace(heap, (-d, i))
+        order = self.order
+        return [order[i] for _, i in sorted(heap, reverse=True)]
+
+    def k_closest(self, origin, k: int) -> List[List[int]]:
+        """The points themselves, nearest first."""
+        points = self.points
+        return [points[i] for i in self.query(origin, k)]
+
+    def query_many(self, origins, k: int) -> List[List[int]]:
+        """query() for every origin — one index serves them all."""
+        return [self.query(origin, k) for origin in origins]
+
+
+"""
+WHEN TO USE WHICH:
+- One query, small k: Solution (heap of size k), O(n log k)
+- One query, large array already in NumPy: SolutionNumpy, O(n) in C
+- MANY queries against the same points (different origins): KDTree —
+  pay O(n log² n) once, then each query only visits a few leaves
+  instead of all n points
+"""
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    n, queries, k = 10**5, 200, 10
+    rng = random.Random(3)
+    points = [[rng.randint(-10**4, 10**4), rng.randint(-10**4, 10**4)]
+              for _ in range(n)]
+    origins = [(rng.randint(-10**4, 10**4), rng.randint(-10**4, 10**4))
+               for _ in range(queries)]
+
+    def shifted(origin):
+        # Solution / SolutionAlternative only measure from (0, 0)
+        ox, oy = origin
+        return [[x - ox, y - oy] for x, y in points]
+
+    def dist_set(origin, found):
+        ox, oy = origin
+        return sorted((x - ox) ** 2 + (y - oy) ** 2 for x, y in found)
+
+    def run(label, answer):
+        start = time.perf_counter()
+        results = [answer(origin) for origin in origins]
+        elapsed = time.perf_counter() - start
+        print(f"{label:<34} {elapsed:8.3f}s  {elapsed / queries * 1e3:8.3f} ms/query")
+        return results
+
+    print(f"n = {n:,} points, {queries} origins, k = {k}")
+    base = run("Solution (heap)", lambda o: [
+        [x + o[0], y + o[1]] for x, y in Solution().kClosest(shifted(o), k)])
+    run("SolutionAlternative (sort)", lambda o: [
+        [x + o[0], y + o[1]] for x, y in SolutionAlternative().kClosest(shifted(o), k)])
+
+    if np is not None:
+        solver = SolutionNumpy()
+        run("SolutionNumpy (list input)", lambda o: solver.kClosest(points, k, o))
+        coords = np.asarray(points)
+        got = run("SolutionNumpy (array input)", lambda o: solver.kClosest(coords, k, o))
+        assert all(dist_set(o, g) == dist_set(o, b)
+                   for o, g, b in zip(origins, got, base))
+
+    start = time.perf_counter()
+    tree = KDTree(points)
+    print(f"{'KDTree build (once)':<34} {time.perf_counter() - start:8.3f}s")
+    got = run("KDTree.k_closest", lambda o: tree.k_closest(o, k))
+    assert all(dist_set(o, g) == dist_set(o, b) for o, g, b in zip(origins, got, base))
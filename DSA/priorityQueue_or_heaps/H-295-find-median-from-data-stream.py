@@ -10,6 +10,14 @@ Four solutions, ranked from naive to optimal:
     3. TwoHeapMedianFinderV1    — Two heaps, manual routing
     4. TwoHeapMedianFinderV2    — Two heaps, push-then-fix  ← BEST
 
+Beyond the LeetCode problem:
+
+    5. WindowedQuantileFinder   — V2 generalised: sliding window
+                                  (last N / last T seconds), any
+                                  quantile, batched addNums
+    6. KLLQuantileSketch        — approximate, O(k log(n/k)) memory,
+                                  mergeable across workers
+
 Complexity Summary:
 ┌─────────────────────────┬──────────────┬────────────────┐
 │ Approach                │ addNum       │ findMedian     │
@@ -18,12 +26,20 @@ Complexity Summary:
 │ Bisect Insert           │ O(n)         │ O(1)           │
 │ Two Heaps v1            │ O(log n)     │ O(1)           │
 │ Two Heaps v2 (Best)     │ O(log n)     │ O(1)           │
+│ Windowed Quantiles      │ O(q log w)*  │ O(1)*          │
+│ KLL Sketch (approx.)    │ O(1)*        │ O(k log k)*    │
 └─────────────────────────┴──────────────┴────────────────┘
-Space: O(n) for all approaches.
+Space: O(n) for the exact approaches (O(w) for the windowed one),
+O(k log(n/k)) for the KLL sketch.
+* amortised; q = tracked quantiles, w = window size.
 """
 
 import heapq
 import bisect
+import math
+import random
+import time
+from collections import deque
 
 
 # ============================================================
@@ -208,4 +224,460 @@ class TwoHeapMedianFinderV2:
         # A is always >= B in size, so only two cases exist
         if len(self.A) == len(self.B):
             return (-self.A[0] + self.B[0]) / 2
-        return float(-self.A[0])  # A holds the extra element
\ No newline at end of file
+        return float(-self.A[0])  # A holds the extra element
+
+# ============================================================
+# 5. WINDOWED QUANTILES — Lazy-Deletion Two Heaps
+# ============================================================
+# Time:  addNum → O(q log w) amortised  |  findQuantile → O(1) amortised
+#        addNums(batch) → one rebalance per batch instead of per item
+# Space: O(w)  (+ not-yet-purged tombstones, bounded by compaction)
+#
+# How it works:
+#   - Same A/B split as v2, but the split is at an arbitrary rank:
+#       len(A) == floor(q * (n - 1)) + 1
+#     so max(A) and min(B) are the two elements around quantile q.
+#     q = 0.5 gives exactly v2's median (average of the middle two).
+#   - One split per tracked quantile (p50 / p90 / p99 ...).
+#   - A deque remembers arrival order; samples that fall out of the
+#     window (count or age) are deleted LAZILY: we record a tombstone
+#     and only pop it once it surfaces at the top of its heap.
+#
+# Which heap holds an expiring x?
+#   - x <= max(A) → A.  All of B is >= max(A), so if x < max(A) it
+#     can only be in A, and if x == max(A) A certainly has a copy.
+#   - otherwise → B.
+#
+# Pitfalls:
+#   - Sizes must count LIVE elements only — len(heap) includes
+#     tombstones, which would corrupt the rank split.
+#   - Tombstones buried deep never surface on their own; each heap
+#     compacts itself once dead entries outnumber live ones.
+#   - Time windows use time.monotonic() unless explicit timestamps
+#     are passed, and timestamps must be non-decreasing.
+# ============================================================
+class LazyHeap:
+    """Min-heap with O(log n) amortised delete-by-value (tombstones)."""
+
+    def __init__(self, items=()):
+        self.heap = list(items)
+        heapq.heapify(self.heap)
+        self.dead = {}            # value → pending deletions
+        self.size = len(self.heap)
+
+    def __len__(self):
+        return self.size
+
+    def push(self, x):
+        heapq.heappush(self.heap, x)
+        self.size += 1
+
+    def remove(self, x):
+        # Caller guarantees x is present — just record the tombstone
+        self.dead[x] = self.dead.get(x, 0) + 1
+        self.size -= 1
+        self._prune()
+        if len(self.heap) > 2 * self.size + 16:
+            self._compact()
+
+    def top(self):
+        self._prune()
+        return self.heap[0]
+
+    def pop(self):
+        self._prune()
+        self.size -= 1
+        x = heapq.heappop(self.heap)
+        self._prune()
+        return x
+
+    def _prune(self):
+        # Drop tombstoned values sitting at the top
+        heap, dead = self.heap, self.dead
+        while heap and heap[0] in dead:
+            x = heapq.heappop(heap)
+            dead[x] -= 1
+            if dead[x] == 0:
+                del dead[x]
+
+    def _compact(self):
+        live = []
+        for x in self.heap:
+            if self.dead.get(x):
+                self.dead[x] -= 1
+            else:
+                live.append(x)
+        self.dead.clear()
+        heapq.heapify(live)
+        self.heap = live
+
+
+class QuantileSplit:
+    """
+    Two heaps split at quantile q of the current multiset.
+      A = max heap (negated) with the lowest floor(q*(n-1)) + 1 values
+      B = min heap with the rest
+    """
+
+    def __init__(self, q: float):
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"quantile must be in [0, 1], got {q}")
+        self.q = q
+        self.A = LazyHeap()
+        self.B = LazyHeap()
+
+    def __len__(self):
+        return len(self.A) + len(self.B)
+
+    def target(self, n: int) -> int:
+        return math.floor(self.q * (n - 1)) + 1 if n else 0
+
+    def push(self, num) -> None:
+        # Same push-then-fix order as TwoHeapMedianFinderV2
+        self.A.push(-num)
+        if len(self.B) and -self.A.top() > self.B.top():
+            self.B.push(-self.A.pop())
+
+    def remove(self, num) -> None:
+        if len(self.A) and num <= -self.A.top():
+            self.A.remove(-num)
+        else:
+            self.B.remove(num)
+
+    def rebalance(self) -> None:
+        # Move tops across until A holds exactly target(n) elements.
+        # After one push/remove this is at most a couple of moves;
+        # after a batch it is |drift|, paid once for the whole batch.
+        want = self.target(len(self))
+        while len(self.A) > want:
+            self.B.push(-self.A.pop())
+        while len(self.A) < want:
+            self.A.push(-self.B.pop())
+
+    def value(self) -> float:
+        n = len(self)
+        if n == 0:
+            raise IndexError("quantile of an empty window")
+        rank = self.q * (n - 1)
+        frac = rank - math.floor(rank)
+        lo = -self.A.top()
+        if frac == 0 or not len(self.B):
+            return float(lo)
+        # Linear interpolation between the two neighbours — for q=0.5
+        # and even n this is the usual "average of the middle two".
+        return lo + frac * (self.B.top() - lo)
+
+    def reset(self, values_sorted) -> None:
+        # Bulk (re)build from sorted values: a sorted list already is a
+        # valid min-heap, so no heapify and no per-item pushes.
+        k = self.target(len(values_sorted))
+        self.A = LazyHeap()
+        self.A.heap = [-x for x in reversed(values_sorted[:k])]
+        self.A.size = k
+        self.B = LazyHeap()
+        self.B.heap = list(values_sorted[k:])
+        self.B.size = len(values_sorted) - k
+
+
+class WindowedQuantileFinder:
+    """
+    Streaming quantiles over the last `window` samples and/or the last
+    `window_seconds` seconds (both None → unbounded, like v2).
+
+        f = WindowedQuantileFinder(window=1000, quantiles=(0.5, 0.9, 0.99))
+        f.addNums(latencies)
+        f.findMedian(), f.findQuantile(0.99)
+
+    Time comes from `clock` unless samples carry their own `ts=`: once
+    one does, calls without `ts` use the latest explicit timestamp, so
+    replayed or simulated streams never mix with the wall clock.
+    """
+
+    def __init__(self, window=None, window_seconds=None,
+                 quantiles=(0.5,), clock=time.monotonic):
+        if window is not None and window < 1:
+            raise ValueError("window must hold at least one sample")
+        self.window = window
+        self.window_seconds = window_seconds
+        self.clock = clock
+        # The median is always available, extra quantiles are opt-in
+        qs = sorted(set(quantiles) | {0.5})
+        self.splits = {q: QuantileSplit(q) for q in qs}
+        self.samples = deque()    # (timestamp, value) in arrival order
+        self.last_ts = None       # latest explicit ts, if any was given
+
+    def __len__(self):
+        return len(self.samples)
+
+    def addNum(self, num, ts=None) -> None:
+        ts = self._now(ts)
+        self.samples.append((ts, num))
+        for split in self.splits.values():
+            split.push(num)
+        self._evict(ts)
+        for split in self.splits.values():
+            split.rebalance()
+
+    def addNums(self, nums, ts=None) -> None:
+        """
+        Add a whole batch with one rebalance per split at the end.
+        If the batch is at least as big as the live window, rebuild
+        from a single sort instead — C sort beats n heap pushes.
+        """
+        ts = self._now(ts)
+        batch = list(nums)
+        if self.window is not None and len(batch) > self.window:
+            batch = batch[-self.window:]   # older ones would expire at once
+
+        if len(batch) >= len(self.samples):
+            self.samples.extend((ts, x) for x in batch)
+            self._evict(ts, rebuild=True)
+            values = sorted(x for _, x in self.samples)
+            for split in self.splits.values():
+                split.reset(values)
+            return
+
+        for x in batch:
+            self.samples.append((ts, x))
+            for split in self.splits.values():
+                split.push(x)
+        self._evict(ts)
+        for split in self.splits.values():
+            split.rebalance()
+
+    def findMedian(self, ts=None) -> float:
+        self.expire(ts)
+        return self.splits[0.5].value()
+
+    def findQuantile(self, q: float, ts=None) -> float:
+        if q not in self.splits:
+            raise KeyError(f"quantile {q} is not tracked "
+                           f"(tracked: {sorted(self.splits)})")
+        self.expire(ts)
+        return self.splits[q].value()
+
+    def findQuantiles(self, ts=None) -> dict:
+        self.expire(ts)
+        return {q: split.value() for q, split in self.splits.items()}
+
+    def expire(self, ts=None) -> None:
+        """Drop samples that aged out even though nothing new arrived."""
+        if self.window_seconds is None:
+            return
+        self._evict(self._now(ts))
+        for split in self.splits.values():
+            split.rebalance()
+
+    def _now(self, ts):
+        if ts is not None:
+            self.last_ts = ts
+            return ts
+        return self.clock() if self.last_ts is None else self.last_ts
+
+    def _evict(self, now, rebuild=False):
+        samples = self.samples
+        cutoff = None if self.window_seconds is None else now - self.window_seconds
+        while samples and (
+            (self.window is not None and len(samples) > self.window)
+            or (cutoff is not None and samples[0][0] <= cutoff)
+        ):
+            _, old = samples.popleft()
+            if not rebuild:   # a rebuild re-reads `samples` anyway
+                for split in self.splits.values():
+                    split.remove(old)
+
+
+# ============================================================
+# 6. KLL SKETCH — Approximate, Mergeable Quantiles
+# ============================================================
+# Time:  addNum → O(1) amortised  |  findMedian → O(k log k) after
+#        an update, O(log k) when nothing changed (cached)
+# Space: O(k log(n / k)) — independent of n for practical purposes
+#
+# How it works (Karnin, Lang & Liberty 2016):
+#   - A stack of "compactors".  Level h holds items of weight 2^h.
+#   - New items go to level 0.  When a level is over capacity, sort
+#     it and keep every OTHER item (random even/odd offset), promoting
+#     the survivors one level up with doubled weight.
+#   - Capacities shrink geometrically (factor c = 2/3) going DOWN
+#     from the top level, so total memory is ~ k / (1 - c) = 3k items.
+#   - A query sorts all (item, weight) pairs and walks the cumulative
+#     weight to rank q * n.
+#
+# Accuracy:
+#   - Rank error ~ O(1/k) with high probability: k = 200 gives
+#     roughly ±1% rank error (the value returned is off by at most
+#     ~1% of n positions in sorted order, not 1% in value).
+#
+# Merging:
+#   - Concatenate compactors level by level, then compress.  The
+#     result has the same guarantees as one sketch over the combined
+#     stream — so per-worker sketches can be merged in any order.
+#
+# Pitfalls:
+#   - Answers are samples from the stream, never interpolated; for
+#     even n findMedian returns one of the middle items, not their
+#     average like v2.
+#   - Only sketches with the same k should be merged.
+# ============================================================
+class KLLQuantileSketch:
+    def __init__(self, k: int = 200, c: float = 2 / 3, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.c = c
+        self.rng = random.Random(seed)
+        self.compactors = [[]]
+        self.n = 0              # exact count of items seen
+        self.size = 0           # items currently stored
+        self.max_size = self._capacity(0)
+        self._sorted = None     # cached (items, cumulative weights)
+
+    def __len__(self):
+        return self.n
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self.compactors) - h - 1
+        return int(math.ceil(self.c ** depth * self.k)) + 1
+
+    def _grow(self):
+        self.compactors.append([])
+        self.max_size = sum(self._capacity(h) for h in range(len(self.compactors)))
+
+    def addNum(self, num) -> None:
+        self.compactors[0].append(num)
+        self.n += 1
+        self.size += 1
+        self._sorted = None
+        if self.size >= self.max_size:
+            self._compress()
+
+    def addNums(self, nums) -> None:
+        for num in nums:
+            self.addNum(num)
+
+    def _compress(self):
+        for h, items in enumerate(self.compactors):
+            if len(items) >= self._capacity(h):
+                if h + 1 >= len(self.compactors):
+                    self._grow()
+                items.sort()
+                # Odd length: the unpaired item stays behind at level h
+                keep = [items.pop()] if len(items) % 2 else []
+                # Keep every other item, random phase → unbiased ranks
+                offset = self.rng.randint(0, 1)
+                self.compactors[h + 1].extend(items[offset::2])
+                self.compactors[h] = keep
+                self.size = sum(len(c) for c in self.compactors)
+                if self.size < self.max_size:
+                    break
+
+    def merge(self, other: "KLLQuantileSketch") -> "KLLQuantileSketch":
+        """Fold `other` into self (in place) and return self."""
+        if other.k != self.k:
+            raise ValueError(f"cannot merge sketches with k={self.k} and k={other.k}")
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for h, items in enumerate(other.compactors):
+            self.compactors[h].extend(items)
+        self.n += other.n
+        self.size = sum(len(c) for c in self.compactors)
+        self._sorted = None
+        while self.size >= self.max_size:
+            self._compress()
+        return self
+
+    def _weighted(self):
+        if self._sorted is None:
+            pairs = sorted(
+                (x, 1 << h)
+                for h, items in enumerate(self.compactors)
+                for x in items
+            )
+            items, cum, total = [], [], 0
+            for x, w in pairs:
+                total += w
+                items.append(x)
+                cum.append(total)
+            self._sorted = (items, cum)
+        return self._sorted
+
+    def findQuantile(self, q: float) -> float:
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"quantile must be in [0, 1], got {q}")
+        if self.n == 0:
+            raise IndexError("quantile of an empty sketch")
+        items, cum = self._weighted()
+        # Stored weight can drift slightly from n — scale to what's stored
+        target = q * (cum[-1] - 1) + 1
+        i = bisect.bisect_left(cum, target)
+        return float(items[min(i, len(items) - 1)])
+
+    def findMedian(self) -> float:
+        return self.findQuantile(0.5)
+
+    def rank(self, x) -> float:
+        """Approximate number of stream items <= x."""
+        if self.n == 0:
+            return 0
+        items, cum = self._weighted()
+        i = bisect.bisect_right(items, x)
+        return cum[i - 1] * self.n / cum[-1] if i else 0
+
+
+# ============================================================
+# QUICK BENCHMARK — exact v2 vs KLL sketch
+# ============================================================
+if __name__ == "__main__":
+    import tracemalloc
+
+    n, workers = 10**6, 4
+    rng = random.Random(7)
+    stream = [rng.gauss(100, 25) for _ in range(n)]
+    truth = sorted(stream)
+
+    def rank_error(value):
+        # |rank(value) - n/2| as a fraction of n
+        lo = bisect.bisect_left(truth, value)
+        hi = bisect.bisect_right(truth, value)
+        mid = n // 2
+        return 0.0 if lo <= mid <= hi else min(abs(lo - mid), abs(hi - mid)) / n
+
+    def run(label, make):
+        tracemalloc.start()
+        start = time.perf_counter()
+        finder = make()
+        median = finder.findMedian()
+        elapsed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<28} {elapsed:7.2f}s {current / 2**20:9.2f}MB"
+              f"  median={median:9.4f}  rank err={rank_error(median):.4%}")
+
+    def exact():
+        f = TwoHeapMedianFinderV2()
+        for x in stream:
+            f.addNum(x)
+        return f
+
+    def sketch():
+        f = KLLQuantileSketch(seed=1)
+        f.addNums(stream)
+        return f
+
+    def merged():
+        # Each worker sketches its shard; the coordinator merges them
+        chunk = n // workers
+        parts = [KLLQuantileSketch(seed=w) for w in range(workers)]
+        for w, part in enumerate(parts):
+            part.addNums(stream[w * chunk:(w + 1) * chunk])
+        total = parts[0]
+        for part in parts[1:]:
+            total.merge(part)
+        return total
+
+    print(f"n = {n:,}  (times include tracemalloc overhead)")
+    print(f"{'':28} {'time':>8} {'retained':>11}")
+    run("TwoHeapMedianFinderV2", exact)
+    run("KLLQuantileSketch(k=200)", sketch)
+    run(f"KLL merged x{workers}", merged)